@@ -0,0 +1,129 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Any, List
+from src.config import Config
+from src.agents.tools.parsed_diff import parse_diff
+from src.agents.tools.analysis_tools import (
+    extract_file_changes,
+    calculate_impact_score,
+    identify_technologies,
+    extract_modified_functions,
+    classify_change_type,
+    score_impact
+)
+from src.agents.tools.technology_detection import detect_technologies
+from src.agents.context.diff_reducer import DiffReducer
+from src.agents.context.token_budget import token_budget_for
+from src.agents.context.analysis_prompt import build_analysis_prompt
+from benchmarks.synthetic_diff import generate_diff
+
+SIZE_UNITS = {"KB": 1024, "MB": 1024 * 1024}
+DEFAULT_SIZES = "1KB,10KB,100KB,1MB,10MB,50MB"
+
+def parse_size(value: str) -> int:
+    value = value.strip().upper()
+    for unit, multiplier in SIZE_UNITS.items():
+        if value.endswith(unit):
+            return int(float(value[:-len(unit)]) * multiplier)
+    return int(value)
+
+def build_prompt(diff: str) -> str:
+    commit_data = {"message": "feat: synthetic benchmark commit", "author": "bench", "timestamp": "2024-01-01T00:00:00Z"}
+    parsed_diff = parse_diff(diff)
+    classify_change_type(commit_data["message"])
+    score_impact(parsed_diff)
+    detect_technologies(parsed_diff)
+    reducer = DiffReducer(token_budget_for(Config.ANALYSIS_MODEL), Config.ANALYSIS_FILE_TOKEN_CAP)
+    reduction = reducer.reduce(parsed_diff)
+    return build_analysis_prompt(commit_data, len(parsed_diff.files), reduction["diff"])
+
+BENCHMARKS: Dict[str, Callable[[str], Any]] = {
+    "extract_file_changes": extract_file_changes,
+    "identify_technologies": identify_technologies,
+    "extract_modified_functions": extract_modified_functions,
+    "calculate_impact_score": calculate_impact_score,
+    "build_prompt": build_prompt
+}
+
+def measure_time(function: Callable[[str], Any], diff: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        parse_diff.cache_clear()
+        started = time.perf_counter()
+        function(diff)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def measure_peak_memory(function: Callable[[str], Any], diff: str) -> int:
+    parse_diff.cache_clear()
+    tracemalloc.start()
+    function(diff)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    parse_diff.cache_clear()
+    return peak
+
+def run(sizes: List[int], repeat: int, seed: int) -> Dict[str, Any]:
+    results = {}
+    for size in sizes:
+        diff = generate_diff(size, seed)
+        for name, function in BENCHMARKS.items():
+            elapsed = measure_time(function, diff, repeat)
+            results[f"{name}@{size}"] = {
+                "benchmark": name,
+                "size_bytes": size,
+                "seconds": elapsed,
+                "throughput_mb_s": size / (1024 * 1024) / elapsed if elapsed else float("inf"),
+                "peak_memory_bytes": measure_peak_memory(function, diff)
+            }
+            print(
+                f"{name:<28} {size:>10} B  {results[f'{name}@{size}']['throughput_mb_s']:>10.2f} MB/s  "
+                f"{results[f'{name}@{size}']['peak_memory_bytes'] / 1024:>10.0f} KiB"
+            )
+    return {"seed": seed, "repeat": repeat, "results": results}
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    for key, result in current["results"].items():
+        previous = baseline["results"].get(key)
+        if not previous:
+            continue
+        if result["throughput_mb_s"] < previous["throughput_mb_s"] * (1 - threshold):
+            regressions.append(
+                f"{key}: throughput {result['throughput_mb_s']:.2f} MB/s < baseline {previous['throughput_mb_s']:.2f} MB/s"
+            )
+        if result["peak_memory_bytes"] > previous["peak_memory_bytes"] * (1 + threshold):
+            regressions.append(
+                f"{key}: peak memory {result['peak_memory_bytes']} B > baseline {previous['peak_memory_bytes']} B"
+            )
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks for commit diff analysis tools")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmarks/baseline.json")
+    parser.add_argument("--compare", default=None)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    current = run([parse_size(size) for size in args.sizes.split(",")], args.repeat, args.seed)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(current, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    with open(args.output, "w") as file:
+        json.dump(current, file, indent=2)
+    print(f"Baseline written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import random
+from typing import List
+
+LANGUAGE_MIX = [
+    ("python", ".py", 0.3),
+    ("typescript", ".ts", 0.25),
+    ("go", ".go", 0.1),
+    ("java", ".java", 0.1),
+    ("markdown", ".md", 0.1),
+    ("json", ".json", 0.05),
+    ("lockfile", "package-lock.json", 0.05),
+    ("css", ".css", 0.05)
+]
+
+DIRECTORIES = ["src", "src/api", "src/services", "lib", "pkg/server", "docs", "web/components", "internal/store"]
+
+def _identifier(rng: random.Random) -> str:
+    parts = ["user", "order", "cache", "request", "session", "report", "commit", "payload", "token", "handler"]
+    return "_".join(rng.sample(parts, 2))
+
+def _definition(language: str, name: str) -> str:
+    if language == "python":
+        return f"def {name}(self, value):"
+    if language == "typescript":
+        return f"export function {name}(value: string): string {{"
+    if language == "go":
+        return f"func (s *Server) {name}(ctx context.Context) error {{"
+    if language == "java":
+        return f"    public void {name}(String value) {{"
+    return f"## {name}"
+
+def _body_line(language: str, rng: random.Random) -> str:
+    name = _identifier(rng)
+    if language == "python":
+        return f"        {name} = self.{_identifier(rng)}.get({rng.randint(0, 999)})"
+    if language in ("typescript", "java"):
+        return f"    const {name} = await {_identifier(rng)}({rng.randint(0, 999)});"
+    if language == "go":
+        return f"\t{name} := s.{_identifier(rng)}({rng.randint(0, 999)})"
+    if language == "json":
+        return f'  "{name}": {rng.randint(0, 999)},'
+    if language == "lockfile":
+        return f'      "integrity": "sha512-{rng.getrandbits(128):032x}",'
+    if language == "css":
+        return f"  .{name} {{ margin: {rng.randint(0, 32)}px; }}"
+    return f"The {name} section describes {_identifier(rng)} in detail."
+
+def _hunk(language: str, rng: random.Random, start: int) -> List[str]:
+    context_name = _identifier(rng)
+    added = rng.randint(1, 12)
+    removed = rng.randint(0, 8)
+    lines = [f"@@ -{start},{removed + 3} +{start},{added + 3} @@ {_definition(language, context_name)}"]
+    lines.append(" " + _body_line(language, rng))
+    lines.extend("-" + _body_line(language, rng) for _ in range(removed))
+    if rng.random() < 0.3:
+        lines.append("+" + _definition(language, _identifier(rng)))
+    lines.extend("+" + _body_line(language, rng) for _ in range(added))
+    lines.append(" " + _body_line(language, rng))
+    lines.append(" " + _body_line(language, rng))
+    return lines
+
+def _filename(language: str, suffix: str, rng: random.Random, index: int) -> str:
+    if language == "lockfile":
+        return f"{rng.choice(DIRECTORIES)}/{suffix}"
+    return f"{rng.choice(DIRECTORIES)}/{_identifier(rng)}_{index}{suffix}"
+
+def generate_diff(target_bytes: int, seed: int = 42) -> str:
+    rng = random.Random(seed)
+    languages = [entry[:2] for entry in LANGUAGE_MIX]
+    weights = [entry[2] for entry in LANGUAGE_MIX]
+    chunks = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        language, suffix = rng.choices(languages, weights)[0]
+        filename = _filename(language, suffix, rng, index)
+        lines = [
+            f"diff --git a/{filename} b/{filename}",
+            f"index {rng.getrandbits(28):07x}..{rng.getrandbits(28):07x} 100644",
+            f"--- a/{filename}",
+            f"+++ b/{filename}"
+        ]
+        start = 1
+        for _ in range(rng.randint(1, 6)):
+            lines.extend(_hunk(language, rng, start))
+            start += rng.randint(20, 200)
+        chunk = "\n".join(lines) + "\n"
+        chunks.append(chunk)
+        size += len(chunk)
+        index += 1
+    return "".join(chunks)[:target_bytes]
@@ -0,0 +1,169 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter
+from datetime import timezone
+from typing import Dict, Any, List, Optional
+import httpx
+from dotenv import load_dotenv
+from loadtest.payloads import build_push_payload, build_webhook_request
+
+def percentile(values: List[float], percentile: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))]
+
+class LoadDriver:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.sent_at: Dict[str, float] = {}
+        self.statuses: Counter = Counter()
+        self.send_latencies: List[float] = []
+        self.loop_lags: List[float] = []
+
+    async def register_repository(self, client: httpx.AsyncClient):
+        response = await client.post(f"{self.args.target}/api/repositories", json={
+            "url": self.args.repo_url,
+            "owner": self.args.owner,
+            "repo": self.args.repo_url.rstrip("/").split("/")[-1],
+            "secret": self.args.secret
+        })
+        print(f"Repository registration returned {response.status_code}")
+
+    async def _runtime_metrics(self, client: httpx.AsyncClient, reset: bool = False) -> Optional[Dict[str, Any]]:
+        try:
+            if reset:
+                await client.post(f"{self.args.target}/api/metrics/runtime/reset")
+                return None
+            response = await client.get(f"{self.args.target}/api/metrics/runtime")
+            return response.json() if response.status_code == 200 else None
+        except httpx.HTTPError:
+            return None
+
+    async def _send(self, client: httpx.AsyncClient):
+        payload = build_push_payload(self.args.repo_url, self.args.owner, self.args.commits_per_push, self.rng)
+        body, headers = build_webhook_request(payload, self.args.secret)
+        started = time.time()
+        for commit in payload["commits"]:
+            self.sent_at[commit["id"]] = started
+        try:
+            response = await client.post(f"{self.args.target}/api/webhooks/github", content=body, headers=headers)
+            self.statuses[response.status_code] += 1
+        except httpx.HTTPError as e:
+            self.statuses[type(e).__name__] += 1
+        self.send_latencies.append(time.time() - started)
+
+    async def drive(self, client: httpx.AsyncClient):
+        loop = asyncio.get_running_loop()
+        total = int(self.args.rate * self.args.duration)
+        started = loop.time()
+        tasks = []
+        for index in range(total):
+            scheduled = started + index / self.args.rate
+            await asyncio.sleep(max(0.0, scheduled - loop.time()))
+            self.loop_lags.append(max(0.0, loop.time() - scheduled))
+            tasks.append(asyncio.create_task(self._send(client)))
+        await asyncio.gather(*tasks)
+
+    async def collect(self) -> Dict[str, Dict[str, Any]]:
+        from src.integration.database import Database
+
+        collection = Database().get_collection("commits")
+        settled: Dict[str, Dict[str, Any]] = {}
+        deadline = time.time() + self.args.settle_timeout
+        while len(settled) < len(self.sent_at) and time.time() < deadline:
+            pending = [sha for sha in self.sent_at if sha not in settled]
+            cursor = collection.find(
+                {"hash": {"$in": pending}, "analysis_status": {"$in": ["completed", "failed"]}},
+                {"hash": 1, "created_at": 1, "analysis_status": 1}
+            )
+            async for doc in cursor:
+                settled[doc["hash"]] = doc
+            if len(settled) < len(self.sent_at):
+                await asyncio.sleep(1)
+        return settled
+
+    def report(
+        self,
+        settled: Dict[str, Dict[str, Any]],
+        elapsed: float,
+        runtime_metrics: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        latencies = []
+        completed_at = []
+        for sha, doc in settled.items():
+            saved_at = doc["created_at"].replace(tzinfo=timezone.utc).timestamp()
+            latencies.append(saved_at - self.sent_at[sha])
+            completed_at.append(saved_at)
+
+        window = (max(completed_at) - min(self.sent_at.values())) if completed_at else 0
+        return {
+            "pushes": sum(self.statuses.values()),
+            "commits_sent": len(self.sent_at),
+            "commits_settled": len(settled),
+            "commits_failed": sum(1 for doc in settled.values() if doc["analysis_status"] == "failed"),
+            "webhook_statuses": {str(status): count for status, count in self.statuses.items()},
+            "webhook_response_seconds": {
+                "p50": percentile(self.send_latencies, 50),
+                "p95": percentile(self.send_latencies, 95),
+                "p99": percentile(self.send_latencies, 99)
+            },
+            "receipt_to_saved_seconds": {
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": max(latencies) if latencies else None
+            },
+            "throughput_commits_per_second": len(settled) / window if window else 0.0,
+            "drive_seconds": elapsed,
+            "driver_schedule_lag_seconds": {
+                "p99": percentile(self.loop_lags, 99),
+                "max": max(self.loop_lags) if self.loop_lags else None
+            },
+            "server_runtime": runtime_metrics
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        async with httpx.AsyncClient(timeout=self.args.request_timeout, limits=httpx.Limits(max_connections=self.args.max_connections)) as client:
+            if self.args.register:
+                await self.register_repository(client)
+            await self._runtime_metrics(client, reset=True)
+            started = time.time()
+            await self.drive(client)
+            elapsed = time.time() - started
+            settled = await self.collect()
+            runtime_metrics = await self._runtime_metrics(client)
+        return self.report(settled, elapsed, runtime_metrics)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Drive signed GitHub push webhooks at a target rate and report end-to-end latency")
+    parser.add_argument("--target", default="http://127.0.0.1:8000")
+    parser.add_argument("--repo-url", default="https://github.com/loadtest/service")
+    parser.add_argument("--owner", default="loadtest")
+    parser.add_argument("--secret", default="loadtest-secret")
+    parser.add_argument("--register", action="store_true", help="Register the repository before driving load")
+    parser.add_argument("--rate", type=float, default=2.0, help="Pushes per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to drive load for")
+    parser.add_argument("--commits-per-push", type=int, default=3)
+    parser.add_argument("--settle-timeout", type=float, default=300.0, help="Seconds to wait for commits to be saved")
+    parser.add_argument("--request-timeout", type=float, default=30.0)
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    load_dotenv()
+    report = asyncio.run(LoadDriver(args).run())
+    print(json.dumps(report, indent=2, default=str))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, default=str)
+    return 0 if report["commits_settled"] == report["commits_sent"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+import math
+import random
+from typing import Optional
+
+SERVER_ERRORS = [500, 502, 503]
+
+class LatencyProfile:
+    def __init__(
+        self,
+        median_ms: float,
+        sigma: float,
+        error_rate: float,
+        rate_limit_rate: float,
+        seed: Optional[int] = None
+    ):
+        self.median_ms = median_ms
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rng = random.Random(seed)
+
+    def sample_delay(self) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        return self.rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+    def sample_failure(self) -> Optional[int]:
+        roll = self.rng.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return self.rng.choice(SERVER_ERRORS)
+        return None
+
+    async def apply(self) -> Optional[int]:
+        await asyncio.sleep(self.sample_delay())
+        return self.sample_failure()
+
+def add_profile_arguments(parser: argparse.ArgumentParser, median_ms: float):
+    parser.add_argument("--latency-ms", type=float, default=median_ms, help="Median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal spread of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 5xx")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with a 429")
+    parser.add_argument("--seed", type=int, default=42)
+
+def profile_from_args(args: argparse.Namespace) -> LatencyProfile:
+    return LatencyProfile(args.latency_ms, args.latency_sigma, args.error_rate, args.rate_limit_rate, args.seed)
@@ -0,0 +1,74 @@
+import argparse
+import random
+from functools import lru_cache
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+import uvicorn
+from src.agents.tools.parsed_diff import parse_diff
+from benchmarks.synthetic_diff import generate_diff
+from loadtest.latency_profile import LatencyProfile, add_profile_arguments, profile_from_args
+
+RATE_LIMIT_HEADERS = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4999"}
+
+def create_app(profile: LatencyProfile, diff_bytes: int, seed: int) -> FastAPI:
+    app = FastAPI()
+
+    @lru_cache(maxsize=1024)
+    def commit_diff(sha: str) -> str:
+        rng = random.Random(f"{seed}:{sha}")
+        size = max(256, int(rng.lognormvariate(0, 0.8) * diff_bytes))
+        return generate_diff(size, rng.randint(0, 2 ** 31))
+
+    def failure_response(status: int) -> JSONResponse:
+        if status == 429:
+            return JSONResponse(
+                {"message": "API rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": "1", "X-RateLimit-Remaining": "0"}
+            )
+        return JSONResponse({"message": "Server Error"}, status_code=status)
+
+    @app.get("/repos/{owner}/{repo}/commits/{sha}")
+    async def get_commit(owner: str, repo: str, sha: str, request: Request):
+        failure = await profile.apply()
+        if failure:
+            return failure_response(failure)
+
+        diff = commit_diff(sha)
+        if "diff" in request.headers.get("Accept", ""):
+            return PlainTextResponse(diff, headers=RATE_LIMIT_HEADERS)
+
+        return JSONResponse({
+            "sha": sha,
+            "files": [
+                {
+                    "filename": file_diff.filename,
+                    "status": file_diff.status,
+                    "additions": file_diff.lines_added,
+                    "deletions": file_diff.lines_removed
+                }
+                for file_diff in parse_diff(diff).files
+            ]
+        }, headers=RATE_LIMIT_HEADERS)
+
+    @app.get("/repos/{owner}/{repo}/compare/{basehead}")
+    async def compare_commits(owner: str, repo: str, basehead: str):
+        failure = await profile.apply()
+        if failure:
+            return failure_response(failure)
+        return JSONResponse({"message": "Not Found"}, status_code=404, headers=RATE_LIMIT_HEADERS)
+
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the GitHub commits REST API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9001)
+    parser.add_argument("--diff-bytes", type=int, default=4000, help="Median size of generated commit diffs")
+    add_profile_arguments(parser, median_ms=120)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(profile_from_args(args), args.diff_bytes, args.seed), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
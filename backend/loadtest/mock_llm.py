@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+import json
+import re
+import time
+import uuid
+from typing import Dict, Any, List
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+import uvicorn
+from loadtest.latency_profile import LatencyProfile, add_profile_arguments, profile_from_args
+
+BATCH_COMMIT_PATTERN = re.compile(r"^### Commit (\w+)", re.MULTILINE)
+COMMIT_MESSAGE_PATTERN = re.compile(r"^Commit Message: (.*)$", re.MULTILINE)
+
+def _prompt_text(messages: List[Dict[str, Any]]) -> str:
+    for message in reversed(messages):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content", "")
+        if isinstance(content, list):
+            return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+        return content
+    return ""
+
+def _analysis(summary: str) -> Dict[str, Any]:
+    return {
+        "summary": summary[:100] or "Synthetic change",
+        "details": "Synthetic analysis produced by the load-test model stand-in.",
+        "key_changes": ["Synthetic key change"],
+        "potential_issues": []
+    }
+
+def build_analysis(prompt: str) -> Dict[str, Any]:
+    messages = COMMIT_MESSAGE_PATTERN.findall(prompt)
+    shas = BATCH_COMMIT_PATTERN.findall(prompt)
+    if shas:
+        return {"commits": [
+            {"sha": sha, **_analysis(messages[index] if index < len(messages) else "")}
+            for index, sha in enumerate(shas)
+        ]}
+    return _analysis(messages[0] if messages else "")
+
+def _split_tokens(content: str, size: int = 8) -> List[str]:
+    return [content[index:index + size] for index in range(0, len(content), size)]
+
+def create_app(profile: LatencyProfile, token_delay_ms: float) -> FastAPI:
+    app = FastAPI()
+
+    def completion_chunk(completion_id: str, model: str, delta: Dict[str, Any], finish_reason=None) -> str:
+        return "data: " + json.dumps({
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }) + "\n\n"
+
+    async def stream_completion(completion_id: str, model: str, content: str):
+        yield completion_chunk(completion_id, model, {"role": "assistant", "content": ""})
+        for token in _split_tokens(content):
+            await asyncio.sleep(token_delay_ms / 1000)
+            yield completion_chunk(completion_id, model, {"content": token})
+        yield completion_chunk(completion_id, model, {}, "stop")
+        yield "data: [DONE]\n\n"
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        failure = await profile.apply()
+        if failure:
+            return JSONResponse(
+                {"error": {"message": "Synthetic upstream failure", "type": "server_error", "code": failure}},
+                status_code=failure,
+                headers={"Retry-After": "1"} if failure == 429 else None
+            )
+
+        model = body.get("model", "mock")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        content = json.dumps(build_analysis(_prompt_text(body.get("messages", []))))
+
+        if body.get("stream"):
+            return StreamingResponse(stream_completion(completion_id, model, content), media_type="text/event-stream")
+
+        return JSONResponse({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        })
+
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for an OpenAI-compatible chat completions API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9002)
+    parser.add_argument("--token-delay-ms", type=float, default=5, help="Delay between streamed chunks")
+    add_profile_arguments(parser, median_ms=800)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(profile_from_args(args), args.token_delay_ms), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
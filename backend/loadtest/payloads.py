@@ -0,0 +1,55 @@
+import hashlib
+import hmac
+import json
+import random
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+
+COMMIT_MESSAGES = [
+    "feat: add pagination to the orders endpoint",
+    "fix: handle empty session tokens",
+    "refactor: extract cache invalidation helper",
+    "chore: bump httpx from 0.27.0 to 0.27.2",
+    "docs: fix typo in README",
+    "test: cover report aggregation edge cases",
+    "perf: avoid re-parsing payloads in the handler"
+]
+
+def _sha(rng: random.Random) -> str:
+    return "%040x" % rng.getrandbits(160)
+
+def build_push_payload(repo_url: str, owner: str, commits_per_push: int, rng: random.Random) -> Dict[str, Any]:
+    commits = []
+    for _ in range(commits_per_push):
+        sha = _sha(rng)
+        commits.append({
+            "id": sha,
+            "message": rng.choice(COMMIT_MESSAGES),
+            "author": {"username": owner, "name": owner},
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "url": f"{repo_url}/commit/{sha}",
+            "added": [],
+            "modified": ["src/app.py"],
+            "removed": []
+        })
+    return {
+        "ref": "refs/heads/main",
+        "before": _sha(rng),
+        "after": commits[-1]["id"] if commits else _sha(rng),
+        "repository": {"html_url": repo_url, "full_name": repo_url.rstrip("/").split("github.com/")[-1]},
+        "pusher": {"name": owner},
+        "commits": commits
+    }
+
+def sign_payload(body: bytes, secret: Optional[str]) -> str:
+    return "sha256=" + hmac.new((secret or "").encode(), msg=body, digestmod=hashlib.sha256).hexdigest()
+
+def build_webhook_request(payload: Dict[str, Any], secret: Optional[str]) -> Tuple[bytes, Dict[str, str]]:
+    body = json.dumps(payload).encode()
+    return body, {
+        "Content-Type": "application/json",
+        "X-GitHub-Event": "push",
+        "X-GitHub-Delivery": str(uuid.uuid4()),
+        "X-Hub-Signature-256": sign_payload(body, secret)
+    }
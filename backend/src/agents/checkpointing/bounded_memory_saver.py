@@ -0,0 +1,154 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from langgraph.checkpoint.memory import MemorySaver
+
+class BoundedMemorySaver(MemorySaver):
+    def __init__(
+        self,
+        max_threads: int,
+        ttl_seconds: int,
+        max_bytes: int,
+        spill_directory: Optional[str] = None
+    ):
+        super().__init__()
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.spill_directory = spill_directory or None
+        self.thread_access = OrderedDict()
+        self.thread_bytes: Dict[str, int] = {}
+        self.total_bytes = 0
+        self.stats = {"evictions": 0, "spills": 0, "restores": 0}
+
+    def _thread_id(self, config) -> Optional[str]:
+        return config.get("configurable", {}).get("thread_id")
+
+    def _measure(self, thread_id: str) -> int:
+        size = 0
+        for checkpoints in self.storage.get(thread_id, {}).values():
+            for checkpoint, metadata, _ in checkpoints.values():
+                size += len(checkpoint[1]) + len(metadata[1])
+        for key, writes in self.writes.items():
+            if key[0] == thread_id:
+                size += sum(len(write[2][1]) for write in writes.values())
+        for key, blob in self.blobs.items():
+            if key[0] == thread_id:
+                size += len(blob[1])
+        return size
+
+    def _checkpoint_bytes(self, thread_id: str, namespace: str, checkpoint_id: str) -> int:
+        entry = self.storage.get(thread_id, {}).get(namespace, {}).get(checkpoint_id)
+        return len(entry[0][1]) + len(entry[1][1]) if entry else 0
+
+    def _blob_bytes(self, keys: list) -> int:
+        return sum(len(self.blobs[key][1]) for key in keys if key in self.blobs)
+
+    def _writes_bytes(self, key: tuple) -> int:
+        return sum(len(write[2][1]) for write in self.writes.get(key, {}).values())
+
+    def _spill_path(self, thread_id: str) -> str:
+        name = hashlib.sha256(str(thread_id).encode()).hexdigest()
+        return os.path.join(self.spill_directory, f"{name}.pkl")
+
+    def _spill(self, thread_id: str):
+        os.makedirs(self.spill_directory, exist_ok=True)
+        snapshot = {
+            "storage": {namespace: dict(checkpoints) for namespace, checkpoints in self.storage.get(thread_id, {}).items()},
+            "writes": {key: dict(writes) for key, writes in self.writes.items() if key[0] == thread_id},
+            "blobs": {key: blob for key, blob in self.blobs.items() if key[0] == thread_id}
+        }
+        descriptor, temp_path = tempfile.mkstemp(dir=self.spill_directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            pickle.dump(snapshot, file)
+        os.replace(temp_path, self._spill_path(thread_id))
+        self.stats["spills"] += 1
+
+    def _restore(self, thread_id: str):
+        if not self.spill_directory or thread_id in self.storage:
+            return
+        path = self._spill_path(thread_id)
+        try:
+            with open(path, "rb") as file:
+                snapshot = pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return
+        for namespace, checkpoints in snapshot["storage"].items():
+            self.storage[thread_id][namespace].update(checkpoints)
+        for key, writes in snapshot["writes"].items():
+            self.writes[key].update(writes)
+        self.blobs.update(snapshot["blobs"])
+        self.stats["restores"] += 1
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        self._touch(thread_id, self._measure(thread_id))
+
+    def _evict(self, thread_id: str):
+        if self.spill_directory:
+            self._spill(thread_id)
+        self.delete_thread(thread_id)
+        self.thread_access.pop(thread_id, None)
+        self.total_bytes -= self.thread_bytes.pop(thread_id, 0)
+        self.stats["evictions"] += 1
+
+    def _touch(self, thread_id: Optional[str], added_bytes: int):
+        if thread_id is None:
+            return
+        self.thread_access[thread_id] = time.monotonic()
+        self.thread_access.move_to_end(thread_id)
+        self.thread_bytes[thread_id] = self.thread_bytes.get(thread_id, 0) + added_bytes
+        self.total_bytes += added_bytes
+        self._enforce_limits(thread_id)
+
+    def _enforce_limits(self, active_thread_id: str):
+        expires_before = time.monotonic() - self.ttl_seconds
+        while self.thread_access:
+            oldest_thread_id, last_access = next(iter(self.thread_access.items()))
+            if oldest_thread_id == active_thread_id:
+                break
+            over_capacity = (
+                len(self.thread_access) > self.max_threads
+                or self.total_bytes > self.max_bytes
+            )
+            if not over_capacity and last_access >= expires_before:
+                break
+            self._evict(oldest_thread_id)
+
+    def get_tuple(self, config):
+        thread_id = self._thread_id(config)
+        if thread_id is not None:
+            self._restore(thread_id)
+            if thread_id in self.thread_access:
+                self.thread_access.move_to_end(thread_id)
+        return super().get_tuple(config)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = self._thread_id(config)
+        namespace = config["configurable"].get("checkpoint_ns", "")
+        blob_keys = [(thread_id, namespace, channel, version) for channel, version in new_versions.items()]
+        previous_bytes = self._checkpoint_bytes(thread_id, namespace, checkpoint["id"]) + self._blob_bytes(blob_keys)
+        result = super().put(config, checkpoint, metadata, new_versions)
+        current_bytes = self._checkpoint_bytes(thread_id, namespace, checkpoint["id"]) + self._blob_bytes(blob_keys)
+        self._touch(thread_id, current_bytes - previous_bytes)
+        return result
+
+    def put_writes(self, config, writes, task_id, task_path: str = ""):
+        thread_id = self._thread_id(config)
+        key = (thread_id, config["configurable"].get("checkpoint_ns", ""), config["configurable"].get("checkpoint_id"))
+        previous_bytes = self._writes_bytes(key)
+        result = super().put_writes(config, writes, task_id, task_path)
+        self._touch(thread_id, self._writes_bytes(key) - previous_bytes)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "threads": len(self.thread_access),
+            "bytes": self.total_bytes
+        }
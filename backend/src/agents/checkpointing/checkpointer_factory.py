@@ -0,0 +1,17 @@
+from langgraph.checkpoint.memory import MemorySaver
+from src.config import Config
+from src.agents.checkpointing.bounded_memory_saver import BoundedMemorySaver
+
+def build_checkpointer(mode: str):
+    if mode == "none":
+        return None
+    if mode == "memory":
+        return MemorySaver()
+    if mode == "bounded":
+        return BoundedMemorySaver(
+            max_threads=Config.CHECKPOINT_MAX_THREADS,
+            ttl_seconds=Config.CHECKPOINT_TTL_SECONDS,
+            max_bytes=Config.CHECKPOINT_MAX_BYTES,
+            spill_directory=Config.CHECKPOINT_SPILL_DIR
+        )
+    raise ValueError(f"Unknown checkpointer mode: {mode}")
@@ -1,7 +1,10 @@
 import os
+import hashlib
 from langchain_openai import ChatOpenAI
 from deepagents import create_deep_agent
-from langgraph.checkpoint.memory import MemorySaver
+from src.agents.checkpointing.checkpointer_factory import build_checkpointer
+from src.config import Config
+from src.agents.structured_output.commit_analysis_result import CommitAnalysisResult
 from src.agents.tools.analysis_tools import (
     extract_file_changes,
     categorize_change_type,
@@ -53,28 +56,55 @@ Always be:
 - Focused on actionable insights
 - Objective in assessment
 
-Use the provided tools to extract technical details from the diff.
 """
 
-def get_commit_analysis_agent():
-    checkpointer = MemorySaver()
-    
-    model = ChatOpenAI(
-        model=os.getenv("ANALYSIS_MODEL", "openai/gpt-4o"),
-        temperature=float(os.getenv("ANALYSIS_TEMPERATURE", "0.3")),
+CONTEXT_MODE_INSTRUCTIONS = {
+    "tools": "Use the provided tools to extract technical details from the diff.\n",
+    "precomputed": (
+        "Each commit comes with a Precomputed Facts section listing change type, impact score, "
+        "per-file stats, technologies and modified symbols. Treat these facts as authoritative "
+        "and answer in a single response without recomputing them.\n"
+    ),
+    "hybrid": (
+        "Each commit comes with a Precomputed Facts section listing change type, impact score, "
+        "per-file stats, technologies and modified symbols. Treat these facts as authoritative. "
+        "Only call the provided tools when a detail you need is missing from the facts.\n"
+    )
+}
+
+ANALYSIS_TOOLS = [
+    extract_file_changes,
+    categorize_change_type,
+    calculate_impact_score,
+    identify_technologies,
+    extract_modified_functions
+]
+
+def commit_analysis_instructions(context_mode: str) -> str:
+    return COMMIT_ANALYSIS_INSTRUCTIONS + CONTEXT_MODE_INSTRUCTIONS.get(context_mode, CONTEXT_MODE_INSTRUCTIONS["tools"])
+
+COMMIT_ANALYSIS_PROMPT_VERSION = hashlib.sha256(
+    commit_analysis_instructions(Config.ANALYSIS_CONTEXT_MODE).encode("utf-8")
+).hexdigest()[:12]
+
+def get_analysis_model(temperature: float = None, model_name: str = None):
+    if temperature is None:
+        temperature = float(os.getenv("ANALYSIS_TEMPERATURE", "0.3"))
+    return ChatOpenAI(
+        model=model_name or Config.ANALYSIS_MODEL,
+        temperature=temperature,
         api_key=os.getenv("OPENROUTER_API_KEY"),
-        base_url="https://openrouter.ai/api/v1"
+        base_url=Config.OPENROUTER_BASE_URL
     )
+
+def get_commit_analysis_agent(response_format=CommitAnalysisResult, model_name: str = None):
+    checkpointer = build_checkpointer(Config.ANALYSIS_AGENT_CHECKPOINTER)
+    model = get_analysis_model(model_name=model_name)
     
     return create_deep_agent(
         model=model,
-        tools=[
-            extract_file_changes,
-            categorize_change_type,
-            calculate_impact_score,
-            identify_technologies,
-            extract_modified_functions
-        ],
-        system_prompt=COMMIT_ANALYSIS_INSTRUCTIONS,
+        tools=[] if Config.ANALYSIS_CONTEXT_MODE == "precomputed" else ANALYSIS_TOOLS,
+        system_prompt=commit_analysis_instructions(Config.ANALYSIS_CONTEXT_MODE),
+        response_format=response_format,
         checkpointer=checkpointer
     )
@@ -0,0 +1,25 @@
+from typing import Dict, Any, Optional
+
+def build_analysis_prompt(
+    commit_data: Dict[str, Any],
+    files_changed: int,
+    diff: str,
+    facts: Optional[str] = None
+) -> str:
+    facts_section = f"\nPrecomputed Facts:\n{facts}\n" if facts else ""
+    return f"""Analyze this commit:
+
+Commit Message: {commit_data.get('message')}
+Author: {commit_data.get('author')}
+Timestamp: {commit_data.get('timestamp')}
+Files Changed: {files_changed}
+{facts_section}
+Diff:
+{diff}
+
+Provide a structured analysis in JSON format with the following fields:
+- summary: Brief one-line summary (max 100 chars)
+- details: Detailed explanation of changes
+- key_changes: List of 3-5 most important modifications
+- potential_issues: List of any concerns or risks (empty list if none)
+"""
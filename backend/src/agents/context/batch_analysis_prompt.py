@@ -0,0 +1,28 @@
+from typing import Dict, Any, List
+
+def build_batch_analysis_prompt(contexts: List[Dict[str, Any]]) -> str:
+    sections = []
+    for context in contexts:
+        commit_data = context["commit_data"]
+        facts_section = f"\nPrecomputed Facts:\n{context['facts']}\n" if context.get("facts") else ""
+        sections.append(f"""### Commit {commit_data.get('sha')}
+Commit Message: {commit_data.get('message')}
+Author: {commit_data.get('author')}
+Timestamp: {commit_data.get('timestamp')}
+Files Changed: {len(context['file_changes'])}
+{facts_section}
+Diff:
+{context['reduction']['diff']}
+""")
+
+    commits = "\n".join(sections)
+    return f"""Analyze each of these {len(contexts)} small commits independently:
+
+{commits}
+Respond with a JSON array containing exactly one object per commit, with the following fields:
+- sha: The full commit SHA exactly as given above
+- summary: Brief one-line summary (max 100 chars)
+- details: Detailed explanation of changes
+- key_changes: List of 3-5 most important modifications
+- potential_issues: List of any concerns or risks (empty list if none)
+"""
@@ -0,0 +1,49 @@
+from typing import Dict, Any, List
+from src.config import Config
+from src.agents.tools.parsed_diff import ParsedDiff, FileDiff
+from src.agents.context.generated_files import classify_generated_file
+
+def _symbol_summary(file_symbols: Dict[str, List[str]]) -> str:
+    return "; ".join(
+        f"{kind}={','.join(names)}"
+        for kind, names in file_symbols.items()
+        if names
+    )
+
+def _file_line(file_diff: FileDiff, technologies: List[str], file_symbols: Dict[str, List[str]]) -> str:
+    line = f"- {file_diff.filename}"
+    if file_diff.status == "renamed":
+        line += f" (from {file_diff.old_filename})"
+    if technologies:
+        line += f" [{','.join(technologies)}]"
+    line += f" {file_diff.status} +{file_diff.lines_added} -{file_diff.lines_removed}"
+    generated = classify_generated_file(file_diff)
+    if generated:
+        line += f" ({generated})"
+    if file_symbols:
+        line += f" symbols: {_symbol_summary(file_symbols)}"
+    return line
+
+def build_commit_facts(
+    parsed_diff: ParsedDiff,
+    change_type: str,
+    impact_score: int,
+    technologies: Dict[str, Any],
+    symbols: Dict[str, Dict[str, List[str]]]
+) -> str:
+    lines = [
+        f"change_type: {change_type} | impact_score: {impact_score} | files: {len(parsed_diff.files)} "
+        f"| +{parsed_diff.lines_added} -{parsed_diff.lines_removed}",
+        f"technologies: {', '.join(technologies['technologies']) or 'unknown'}",
+        "files:"
+    ]
+    for file_diff in parsed_diff.files[:Config.ANALYSIS_FACTS_MAX_FILES]:
+        lines.append(_file_line(
+            file_diff,
+            technologies["files"].get(file_diff.filename, []),
+            symbols.get(file_diff.filename, {})
+        ))
+    remaining = len(parsed_diff.files) - Config.ANALYSIS_FACTS_MAX_FILES
+    if remaining > 0:
+        lines.append(f"- ... {remaining} more files")
+    return "\n".join(lines)
@@ -0,0 +1,132 @@
+from typing import Dict, List, Any, Optional
+from src.agents.tools.parsed_diff import ParsedDiff, FileDiff, DiffHunk
+from src.agents.tools.technology_detection import classify_file
+from src.agents.tools.symbol_extraction import LANGUAGE_PATTERNS
+from src.agents.context.token_counter import TokenCounter
+from src.agents.context.generated_files import classify_generated_file
+from src.agents.context.hunk_ranking import score_hunk
+
+class DiffReducer:
+    def __init__(
+        self,
+        token_budget: int,
+        file_token_cap: int,
+        token_counter: Optional[TokenCounter] = None
+    ):
+        self.token_budget = token_budget
+        self.file_token_cap = file_token_cap
+        self.token_counter = token_counter or TokenCounter()
+
+    def _file_header(self, file_diff: FileDiff) -> str:
+        return "\n".join(line for line in file_diff.header_lines if not line.startswith("index "))
+
+    def _file_summary(self, file_diff: FileDiff, reason: str) -> str:
+        return (
+            f"{file_diff.header_lines[0]}\n"
+            f"... ({reason} omitted, +{file_diff.lines_added} -{file_diff.lines_removed})"
+        )
+
+    def _truncate_hunk(self, hunk: DiffHunk, available: int) -> int:
+        used = self.token_counter.count(hunk.header + "\n" + self._elision_marker(hunk, 0))
+        kept = 0
+        for line in hunk.lines:
+            used += self.token_counter.count(line + "\n")
+            if used > available:
+                break
+            kept += 1
+        return kept
+
+    def _elision_marker(self, hunk: DiffHunk, kept: int) -> str:
+        return f"... ({len(hunk.lines) - kept} of {len(hunk.lines)} hunk lines elided)"
+
+    def _select_hunks(self, parsed_diff: ParsedDiff, skipped: Dict[int, str], budget: int) -> Dict[int, Dict[int, Optional[int]]]:
+        candidates = []
+        for file_index, file_diff in enumerate(parsed_diff.files):
+            if file_index in skipped:
+                continue
+            patterns = LANGUAGE_PATTERNS.get(classify_file(file_diff.filename), [])
+            for hunk_index, hunk in enumerate(file_diff.hunks):
+                tokens = self.token_counter.count(hunk.header + "\n" + "\n".join(hunk.lines))
+                candidates.append((score_hunk(hunk, patterns), file_index, hunk_index, tokens))
+
+        selected: Dict[int, Dict[int, Optional[int]]] = {}
+        file_tokens: Dict[int, int] = {}
+        for _, file_index, hunk_index, tokens in sorted(candidates, key=lambda candidate: -candidate[0]):
+            available = min(budget, self.file_token_cap - file_tokens.get(file_index, 0))
+            kept_lines = None
+            if tokens > available:
+                hunk = parsed_diff.files[file_index].hunks[hunk_index]
+                kept_lines = self._truncate_hunk(hunk, available)
+                if kept_lines == 0:
+                    continue
+                tokens = self.token_counter.count(
+                    "\n".join([hunk.header, *hunk.lines[:kept_lines], self._elision_marker(hunk, kept_lines)])
+                )
+            budget -= tokens
+            file_tokens[file_index] = file_tokens.get(file_index, 0) + tokens
+            selected.setdefault(file_index, {})[hunk_index] = kept_lines
+        return selected
+
+    def _render_file(self, file_diff: FileDiff, hunk_indexes: Dict[int, Optional[int]]) -> str:
+        parts = [self._file_header(file_diff)]
+        for hunk_index, hunk in enumerate(file_diff.hunks):
+            if hunk_index not in hunk_indexes:
+                continue
+            kept_lines = hunk_indexes[hunk_index]
+            parts.append(hunk.header)
+            if kept_lines is None:
+                parts.extend(hunk.lines)
+            else:
+                parts.extend(hunk.lines[:kept_lines])
+                parts.append(self._elision_marker(hunk, kept_lines))
+        omitted = len(file_diff.hunks) - len(hunk_indexes)
+        if omitted:
+            parts.append(f"... ({omitted} of {len(file_diff.hunks)} hunks omitted)")
+        return "\n".join(parts)
+
+    def reduce(self, parsed_diff: ParsedDiff) -> Dict[str, Any]:
+        skipped = {}
+        for file_index, file_diff in enumerate(parsed_diff.files):
+            reason = classify_generated_file(file_diff)
+            if reason:
+                skipped[file_index] = reason
+
+        fixed_sections = {
+            file_index: self._file_summary(file_diff, skipped[file_index]) if file_index in skipped else self._file_header(file_diff)
+            for file_index, file_diff in enumerate(parsed_diff.files)
+        }
+        fixed_tokens = sum(self.token_counter.count(section) for section in fixed_sections.values())
+        selected = self._select_hunks(parsed_diff, skipped, max(self.token_budget - fixed_tokens, 0))
+
+        sections: List[str] = []
+        omitted_files = []
+        partial_files = []
+        for file_index, file_diff in enumerate(parsed_diff.files):
+            if file_index in skipped:
+                sections.append(fixed_sections[file_index])
+                omitted_files.append({"filename": file_diff.filename, "reason": skipped[file_index]})
+                continue
+            hunk_indexes = selected.get(file_index, {})
+            if any(kept_lines is not None for kept_lines in hunk_indexes.values()):
+                partial_files.append(file_diff.filename)
+            sections.append(self._render_file(file_diff, hunk_indexes))
+
+        diff = "\n".join(sections)
+        selected_hunks = sum(
+            1
+            for hunk_indexes in selected.values()
+            for kept_lines in hunk_indexes.values()
+            if kept_lines is None
+        )
+        candidate_hunks = sum(
+            len(file_diff.hunks)
+            for file_index, file_diff in enumerate(parsed_diff.files)
+            if file_index not in skipped
+        )
+        return {
+            "diff": diff,
+            "tokens": self.token_counter.count(diff),
+            "omitted_files": omitted_files,
+            "partial_files": partial_files,
+            "reduced": bool(omitted_files) or selected_hunks < candidate_hunks
+        }
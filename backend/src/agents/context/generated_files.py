@@ -0,0 +1,40 @@
+import os
+import re
+from typing import Optional
+from src.agents.tools.parsed_diff import FileDiff
+
+LOCK_FILES = {
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "uv.lock",
+    "poetry.lock",
+    "pipfile.lock",
+    "cargo.lock",
+    "composer.lock",
+    "gemfile.lock",
+    "go.sum",
+    "bun.lockb",
+    "packages.lock.json"
+}
+
+VENDORED_PATTERN = re.compile(r"(?:^|/)(?:vendor|node_modules|third_party|bower_components|\.yarn)/")
+GENERATED_PATTERN = re.compile(
+    r"(?:^|/)(?:dist|build|out|coverage|__generated__)/"
+    r"|\.min\.(?:js|css)$|\.map$|\.bundle\.js$|_pb2(?:_grpc)?\.py$|\.pb\.go$|\.generated\.\w+$"
+)
+SNAPSHOT_PATTERN = re.compile(r"(?:^|/)__snapshots__/|\.snap$")
+
+def classify_generated_file(file_diff: FileDiff) -> Optional[str]:
+    filename = file_diff.filename.lower()
+    if file_diff.is_binary:
+        return "binary"
+    if os.path.basename(filename) in LOCK_FILES:
+        return "lockfile"
+    if VENDORED_PATTERN.search(filename):
+        return "vendored"
+    if SNAPSHOT_PATTERN.search(filename):
+        return "snapshot"
+    if GENERATED_PATTERN.search(filename):
+        return "generated"
+    return None
@@ -0,0 +1,20 @@
+import re
+from typing import List
+from src.agents.tools.parsed_diff import DiffHunk
+from src.agents.tools.symbol_extraction import match_definition
+
+TRIVIAL_LINE_PATTERN = re.compile(r"^\s*(?:#|//|/\*|\*|--|<!--|$)")
+
+def score_hunk(hunk: DiffHunk, patterns: List[re.Pattern]) -> float:
+    changed_lines = [line[1:] for line in hunk.lines if line[:1] in ("+", "-")]
+    if not changed_lines:
+        return 0.0
+
+    substantive_lines = [line for line in changed_lines if not TRIVIAL_LINE_PATTERN.match(line)]
+    score = len(substantive_lines) + 0.2 * (len(changed_lines) - len(substantive_lines))
+    if patterns:
+        definitions = sum(1 for line in substantive_lines if match_definition(line, patterns))
+        score += 5.0 * definitions
+    if hunk.lines_added and hunk.lines_removed:
+        score *= 1.2
+    return score
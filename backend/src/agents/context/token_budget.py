@@ -0,0 +1,12 @@
+from src.config import Config
+
+def parse_model_budgets(value: str) -> dict[str, int]:
+    budgets = {}
+    for entry in value.split(","):
+        model, _, budget = entry.strip().rpartition("=")
+        if model and budget.isdigit():
+            budgets[model] = int(budget)
+    return budgets
+
+def token_budget_for(model: str) -> int:
+    return parse_model_budgets(Config.ANALYSIS_MODEL_TOKEN_BUDGETS).get(model, Config.ANALYSIS_TOKEN_BUDGET)
@@ -0,0 +1,27 @@
+import re
+
+APPROXIMATE_TOKEN_PATTERN = re.compile(r"\w{1,4}|[^\w\s]|\n")
+
+class TokenCounter:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TokenCounter, cls).__new__(cls)
+            cls._instance.encoding = cls._load_encoding()
+        return cls._instance
+
+    @staticmethod
+    def _load_encoding():
+        try:
+            import tiktoken
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return sum(1 for _ in APPROXIMATE_TOKEN_PATTERN.finditer(text))
@@ -1,7 +1,8 @@
 import os
 from langchain_openai import ChatOpenAI
 from deepagents import create_deep_agent
-from langgraph.checkpoint.memory import MemorySaver
+from src.agents.checkpointing.checkpointer_factory import build_checkpointer
+from src.config import Config
 
 REPORT_AGGREGATION_INSTRUCTIONS = """You are preparing a personal daily work update for a repository.
 
@@ -31,14 +32,14 @@ Still working on yesterday task.
 Output ONLY the update.
 """
 
-def get_report_aggregation_agent():
-    checkpointer = MemorySaver()
+def get_report_aggregation_agent(model_name: str = None):
+    checkpointer = build_checkpointer(Config.REPORT_AGENT_CHECKPOINTER)
     
     model = ChatOpenAI(
-        model=os.getenv("ANALYSIS_MODEL", "openai/gpt-4o"),
+        model=model_name or Config.REPORT_MODEL,
         temperature=0.3,
         api_key=os.getenv("OPENROUTER_API_KEY"),
-        base_url="https://openrouter.ai/api/v1"
+        base_url=Config.OPENROUTER_BASE_URL
     )
     
     return create_deep_agent(
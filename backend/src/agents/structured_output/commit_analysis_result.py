@@ -0,0 +1,33 @@
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+class CommitAnalysisResult(BaseModel):
+    summary: str = Field(description="Brief one-line summary (max 100 chars)")
+    details: str = Field(default="", description="Detailed explanation of changes")
+    key_changes: List[str] = Field(default_factory=list, description="3-5 most important modifications")
+    potential_issues: List[str] = Field(default_factory=list, description="Concerns or risks, empty if none")
+
+class CommitBatchAnalysisItem(CommitAnalysisResult):
+    sha: str = Field(description="The full commit SHA exactly as given")
+
+class CommitBatchAnalysisResult(BaseModel):
+    commits: List[CommitBatchAnalysisItem] = Field(description="Exactly one analysis per commit")
+
+FIELD_ADAPTERS = {
+    name: TypeAdapter(field.annotation)
+    for name, field in CommitAnalysisResult.model_fields.items()
+}
+
+def validate_analysis_field(name: str, value: Any) -> Any:
+    adapter = FIELD_ADAPTERS.get(name)
+    if adapter is None:
+        raise ValueError(f"Unknown analysis field: {name}")
+    return adapter.validate_python(value)
+
+def validate_analysis(data: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(data, CommitAnalysisResult):
+        return data.model_dump(include=set(CommitAnalysisResult.model_fields))
+    try:
+        return CommitAnalysisResult.model_validate(data).model_dump(include=set(CommitAnalysisResult.model_fields))
+    except ValidationError:
+        return None
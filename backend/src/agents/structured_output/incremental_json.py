@@ -0,0 +1,81 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+class IncrementalJSONObjectParser:
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.started = False
+        self.finished = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.key: Optional[str] = None
+        self.token_start: Optional[int] = None
+        self.fields: Dict[str, Any] = {}
+
+    def _complete_token(self, end: int) -> List[Tuple[str, Any]]:
+        if self.token_start is None:
+            return []
+        raw = self.buffer[self.token_start:end].strip()
+        self.token_start = None
+        if not raw:
+            return []
+        if self.key is None:
+            try:
+                self.key = json.loads(raw)
+            except ValueError:
+                self.key = None
+            return []
+        key, self.key = self.key, None
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return []
+        self.fields[key] = value
+        return [(key, value)]
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        completed: List[Tuple[str, Any]] = []
+        self.buffer += chunk
+        while self.position < len(self.buffer) and not self.finished:
+            char = self.buffer[self.position]
+            index = self.position
+            self.position += 1
+
+            if not self.started:
+                if char == "{":
+                    self.started = True
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                continue
+
+            if char == '"':
+                self.in_string = True
+                if self.depth == 1 and self.token_start is None:
+                    self.token_start = index
+            elif char in "{[":
+                if self.depth == 1 and self.token_start is None:
+                    self.token_start = index
+                self.depth += 1
+            elif char in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    completed.extend(self._complete_token(index))
+                    self.finished = True
+            elif self.depth == 1 and char in ":,":
+                completed.extend(self._complete_token(index))
+            elif self.depth == 1 and self.token_start is None and not char.isspace():
+                self.token_start = index
+        return completed
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        return self.fields if self.finished else None
@@ -0,0 +1,37 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional
+from src.agents.structured_output.commit_analysis_result import CommitAnalysisResult, validate_analysis
+
+logger = logging.getLogger(__name__)
+
+REPAIR_INSTRUCTIONS = """Convert the commit analysis below into the required schema.
+Keep the original wording, do not analyze the commit again and do not invent new findings.
+If a field is missing, use an empty string or an empty list.
+
+Analysis:
+"""
+
+class AnalysisOutputRepairer:
+    def __init__(self, model_router, model_factory: Callable[[str], Any]):
+        self.model_router = model_router
+        self.model_factory = model_factory
+        self.models = {}
+
+    def _model_for(self, model_name: str):
+        if model_name not in self.models:
+            self.models[model_name] = self.model_factory(model_name).with_structured_output(CommitAnalysisResult)
+        return self.models[model_name]
+
+    async def repair(self, raw_output: str, models: List[str]) -> Optional[Dict[str, Any]]:
+        if not raw_output or not raw_output.strip():
+            return None
+
+        async def run_model(model_name: str):
+            return await self._model_for(model_name).ainvoke(REPAIR_INSTRUCTIONS + raw_output)
+
+        try:
+            result = await self.model_router.run(models, run_model)
+        except Exception as e:
+            logger.warning(f"Structured output repair failed: {e}")
+            return None
+        return validate_analysis(result)
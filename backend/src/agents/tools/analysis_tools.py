@@ -1,44 +1,13 @@
-import re
 from typing import Dict, List, Any
+from src.agents.tools.parsed_diff import ParsedDiff, parse_diff
+from src.agents.tools.technology_detection import detect_technologies
+from src.agents.tools.symbol_extraction import extract_modified_symbols
 
 def extract_file_changes(diff: str) -> List[Dict[str, Any]]:
     """Extract file changes from a git diff, including filenames and line counts."""
-    files = []
-    current_file = None
-    lines_added = 0
-    lines_removed = 0
-    
-    for line in diff.split('\n'):
-        if line.startswith('diff --git'):
-            if current_file:
-                current_file['lines_added'] = lines_added
-                current_file['lines_removed'] = lines_removed
-                files.append(current_file)
-            
-            match = re.search(r'b/(.+)$', line)
-            if match:
-                current_file = {
-                    'filename': match.group(1),
-                    'lines_added': 0,
-                    'lines_removed': 0
-                }
-                lines_added = 0
-                lines_removed = 0
-        
-        elif line.startswith('+') and not line.startswith('+++'):
-            lines_added += 1
-        elif line.startswith('-') and not line.startswith('---'):
-            lines_removed += 1
-    
-    if current_file:
-        current_file['lines_added'] = lines_added
-        current_file['lines_removed'] = lines_removed
-        files.append(current_file)
-    
-    return files
+    return parse_diff(diff).file_changes()
 
-def categorize_change_type(message: str, diff: str) -> str:
-    """Categorize commit type based on message and diff content."""
+def classify_change_type(message: str) -> str:
     message_lower = message.lower()
     
     keywords = {
@@ -56,11 +25,13 @@ def categorize_change_type(message: str, diff: str) -> str:
     
     return 'chore'
 
-def calculate_impact_score(diff: str) -> int:
-    """Calculate impact score (1-10) based on number of files and lines changed."""
-    files = extract_file_changes(diff)
-    total_lines = sum(f['lines_added'] + f['lines_removed'] for f in files)
-    num_files = len(files)
+def categorize_change_type(message: str, diff: str) -> str:
+    """Categorize commit type based on message and diff content."""
+    return classify_change_type(message)
+
+def score_impact(parsed_diff: ParsedDiff) -> int:
+    total_lines = parsed_diff.total_lines
+    num_files = len(parsed_diff.files)
     
     if total_lines < 10 and num_files <= 1:
         return 2
@@ -73,46 +44,20 @@ def calculate_impact_score(diff: str) -> int:
     else:
         return 10
 
+def calculate_impact_score(diff: str) -> int:
+    """Calculate impact score (1-10) based on number of files and lines changed."""
+    return score_impact(parse_diff(diff))
+
 def identify_technologies(diff: str) -> List[str]:
     """Identify programming languages and technologies used in the diff."""
-    tech_patterns = {
-        'python': [r'\.py$', r'import\s+', r'from\s+\w+\s+import'],
-        'javascript': [r'\.js$', r'\.jsx$', r'const\s+', r'let\s+', r'function\s+'],
-        'typescript': [r'\.ts$', r'\.tsx$', r'interface\s+', r'type\s+'],
-        'html': [r'\.html$', r'<\w+>'],
-        'css': [r'\.css$', r'\.scss$', r'\{[\s\S]*?\}'],
-        'sql': [r'\.sql$', r'SELECT\s+', r'INSERT\s+', r'UPDATE\s+'],
-        'docker': [r'Dockerfile', r'docker-compose'],
-        'yaml': [r'\.yml$', r'\.yaml$'],
-        'json': [r'\.json$'],
-        'markdown': [r'\.md$']
-    }
-    
-    technologies = []
-    for tech, patterns in tech_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, diff, re.IGNORECASE):
-                technologies.append(tech)
-                break
-    
-    return list(set(technologies))
+    return detect_technologies(parse_diff(diff))["technologies"]
 
 def extract_modified_functions(diff: str) -> List[str]:
-    """Extract names of functions that were modified in the diff."""
-    functions = []
-    
-    patterns = [
-        r'def\s+(\w+)\s*\(',
-        r'function\s+(\w+)\s*\(',
-        r'const\s+(\w+)\s*=\s*\(',
-        r'async\s+function\s+(\w+)\s*\(',
-    ]
-    
-    for line in diff.split('\n'):
-        if line.startswith('+') or line.startswith('-'):
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    functions.append(match.group(1))
-    
-    return list(set(functions))
+    """Extract names of functions and classes that were modified, added or removed in the diff."""
+    symbols = extract_modified_symbols(parse_diff(diff))
+    return sorted({
+        symbol
+        for file_symbols in symbols.values()
+        for names in file_symbols.values()
+        for symbol in names
+    })
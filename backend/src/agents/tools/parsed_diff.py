@@ -0,0 +1,138 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
+
+HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@ ?(.*)$")
+DIFF_HEADER_PATTERN = re.compile(r"^diff --git a/(.+?) b/(.+)$")
+
+class DiffHunk:
+    __slots__ = (
+        "header",
+        "context",
+        "old_start",
+        "old_count",
+        "new_start",
+        "new_count",
+        "lines",
+        "lines_added",
+        "lines_removed"
+    )
+
+    def __init__(self, header: str, match: re.Match):
+        self.header = header
+        self.old_start = int(match.group(1))
+        self.old_count = int(match.group(2) or 1)
+        self.new_start = int(match.group(3))
+        self.new_count = int(match.group(4) or 1)
+        self.context = match.group(5).strip()
+        self.lines: List[str] = []
+        self.lines_added = 0
+        self.lines_removed = 0
+
+    def added_lines(self) -> List[str]:
+        return [line[1:] for line in self.lines if line.startswith("+")]
+
+    def removed_lines(self) -> List[str]:
+        return [line[1:] for line in self.lines if line.startswith("-")]
+
+class FileDiff:
+    __slots__ = (
+        "filename",
+        "old_filename",
+        "header_lines",
+        "hunks",
+        "lines_added",
+        "lines_removed",
+        "status",
+        "is_binary"
+    )
+
+    def __init__(self, filename: str, old_filename: str, header: str):
+        self.filename = filename
+        self.old_filename = old_filename
+        self.header_lines: List[str] = [header]
+        self.hunks: List[DiffHunk] = []
+        self.lines_added = 0
+        self.lines_removed = 0
+        self.status = "modified"
+        self.is_binary = False
+
+    def added_lines(self) -> List[str]:
+        return [line for hunk in self.hunks for line in hunk.added_lines()]
+
+    def as_change(self) -> Dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "lines_added": self.lines_added,
+            "lines_removed": self.lines_removed
+        }
+
+class ParsedDiff:
+    __slots__ = ("files", "lines_added", "lines_removed")
+
+    def __init__(self, files: List[FileDiff]):
+        self.files = files
+        self.lines_added = sum(file_diff.lines_added for file_diff in files)
+        self.lines_removed = sum(file_diff.lines_removed for file_diff in files)
+
+    @property
+    def total_lines(self) -> int:
+        return self.lines_added + self.lines_removed
+
+    def file_changes(self) -> List[Dict[str, Any]]:
+        return [file_diff.as_change() for file_diff in self.files]
+
+def _start_file(line: str) -> Optional[FileDiff]:
+    match = DIFF_HEADER_PATTERN.match(line)
+    if not match:
+        return None
+    return FileDiff(match.group(2), match.group(1), line)
+
+def _apply_header(file_diff: FileDiff, line: str):
+    file_diff.header_lines.append(line)
+    if line.startswith("new file mode"):
+        file_diff.status = "added"
+    elif line.startswith("deleted file mode"):
+        file_diff.status = "removed"
+    elif line.startswith("rename from"):
+        file_diff.status = "renamed"
+    elif line.startswith("Binary files") or line.startswith("GIT binary patch"):
+        file_diff.is_binary = True
+
+@lru_cache(maxsize=64)
+def parse_diff(diff: str) -> ParsedDiff:
+    files: List[FileDiff] = []
+    current_file: Optional[FileDiff] = None
+    current_hunk: Optional[DiffHunk] = None
+
+    for line in diff.split("\n"):
+        if line.startswith("diff --git "):
+            current_file = _start_file(line)
+            current_hunk = None
+            if current_file:
+                files.append(current_file)
+            continue
+
+        if current_file is None:
+            continue
+
+        if line.startswith("@@"):
+            match = HUNK_HEADER_PATTERN.match(line)
+            if match:
+                current_hunk = DiffHunk(line, match)
+                current_file.hunks.append(current_hunk)
+                continue
+
+        if current_hunk is None:
+            _apply_header(current_file, line)
+            continue
+
+        current_hunk.lines.append(line)
+        if line.startswith("+"):
+            current_hunk.lines_added += 1
+            current_file.lines_added += 1
+        elif line.startswith("-"):
+            current_hunk.lines_removed += 1
+            current_file.lines_removed += 1
+
+    return ParsedDiff(files)
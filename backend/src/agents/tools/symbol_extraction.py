@@ -0,0 +1,114 @@
+import re
+from typing import Dict, List, Optional, Set
+from src.agents.tools.parsed_diff import ParsedDiff, FileDiff
+from src.agents.tools.technology_detection import classify_file
+
+JS_PATTERNS = [
+    re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*(\w+)\s*[(<]"),
+    re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(\w+)"),
+    re.compile(r"^\s*(?:export\s+)?(?:const|let|var)\s+(\w+)\s*(?::[^=]+)?=\s*(?:async\s+)?(?:function\b|\([^)]*\)\s*(?::[^=]+)?=>|\w+\s*=>)"),
+    re.compile(r"^\s*(?:(?:public|private|protected|static|async|readonly|get|set)\s+)*(?!(?:if|for|while|switch|catch|return|function)\b)(\w+)\s*\([^)]*\)\s*(?::[^{]+)?\{\s*$")
+]
+
+JAVA_LIKE_PATTERNS = [
+    re.compile(r"^\s*(?:(?:public|private|protected|internal|static|final|abstract|sealed|open|data)\s+)*(?:class|interface|enum|record|object|struct)\s+(\w+)"),
+    re.compile(r"^\s*(?:(?:public|private|protected|internal|static|final|abstract|synchronized|override|virtual|async|suspend)\s+)*fun\s+(?:<[^>]*>\s*)?(?:\w+\.)?(\w+)\s*\("),
+    re.compile(r"^\s*(?:(?:public|private|protected|internal|static|final|abstract|synchronized|override|virtual|async)\s+)+[\w<>\[\],.? ]+?\s+(\w+)\s*\([^;]*$")
+]
+
+C_LIKE_PATTERNS = [
+    re.compile(r"^\s*(?:class|struct|enum|union)\s+(\w+)\s*[:{]?\s*$"),
+    re.compile(r"^(?!\s*(?:if|for|while|switch|return|else)\b)[\w\*&:<>\s]+?\b(\w+)\s*\([^;]*\)\s*(?:const\s*)?\{?\s*$")
+]
+
+LANGUAGE_PATTERNS = {
+    "python": [
+        re.compile(r"^\s*(?:async\s+)?def\s+(\w+)\s*\("),
+        re.compile(r"^\s*class\s+(\w+)\s*[(:]")
+    ],
+    "javascript": JS_PATTERNS,
+    "typescript": JS_PATTERNS + [
+        re.compile(r"^\s*(?:export\s+)?(?:interface|type|enum)\s+(\w+)")
+    ],
+    "go": [
+        re.compile(r"^func\s+(?:\([^)]*\)\s*)?(\w+)\s*[(\[]"),
+        re.compile(r"^type\s+(\w+)\s+(?:struct|interface)\b")
+    ],
+    "java": JAVA_LIKE_PATTERNS,
+    "kotlin": JAVA_LIKE_PATTERNS,
+    "csharp": JAVA_LIKE_PATTERNS,
+    "swift": [
+        re.compile(r"^\s*(?:(?:public|private|internal|open|static|override|final)\s+)*func\s+(\w+)"),
+        re.compile(r"^\s*(?:(?:public|private|internal|open|final)\s+)*(?:class|struct|enum|protocol|extension)\s+(\w+)")
+    ],
+    "rust": [
+        re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:const\s+)?(?:async\s+)?(?:unsafe\s+)?fn\s+(\w+)"),
+        re.compile(r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|trait|mod)\s+(\w+)"),
+        re.compile(r"^\s*impl(?:<[^>]*>)?\s+(?:[\w:<>]+\s+for\s+)?(\w+)")
+    ],
+    "ruby": [
+        re.compile(r"^\s*def\s+(?:self\.)?(\w+[?!=]?)"),
+        re.compile(r"^\s*(?:class|module)\s+(\w+)")
+    ],
+    "php": [
+        re.compile(r"^\s*(?:(?:public|private|protected|static|final|abstract)\s+)*function\s+&?(\w+)\s*\("),
+        re.compile(r"^\s*(?:(?:final|abstract)\s+)?(?:class|interface|trait|enum)\s+(\w+)")
+    ],
+    "c": C_LIKE_PATTERNS,
+    "cpp": C_LIKE_PATTERNS,
+    "shell": [
+        re.compile(r"^\s*(?:function\s+)?(\w+)\s*\(\)\s*\{?")
+    ]
+}
+
+def match_definition(line: str, patterns: List[re.Pattern]) -> Optional[str]:
+    for pattern in patterns:
+        match = pattern.match(line)
+        if match:
+            return match.group(1)
+    return None
+
+def extract_file_symbols(file_diff: FileDiff) -> Optional[Dict[str, List[str]]]:
+    patterns = LANGUAGE_PATTERNS.get(classify_file(file_diff.filename))
+    if not patterns:
+        return None
+
+    added_definitions: Set[str] = set()
+    removed_definitions: Set[str] = set()
+    enclosing_symbols: Set[str] = set()
+
+    for hunk in file_diff.hunks:
+        enclosing = match_definition(hunk.context, patterns) if hunk.context else None
+        for line in hunk.lines:
+            marker, content = line[:1], line[1:]
+            definition = match_definition(content, patterns)
+            if marker == "+" and definition:
+                added_definitions.add(definition)
+                enclosing = definition
+            elif marker == "-" and definition:
+                removed_definitions.add(definition)
+                enclosing = definition
+            elif marker == " " and definition:
+                enclosing = definition
+            elif marker in ("+", "-") and enclosing:
+                enclosing_symbols.add(enclosing)
+
+    added = added_definitions - removed_definitions
+    removed = removed_definitions - added_definitions
+    modified = ((added_definitions & removed_definitions) | enclosing_symbols) - added - removed
+    if not (added or removed or modified):
+        return None
+
+    return {
+        "modified": sorted(modified),
+        "added": sorted(added),
+        "removed": sorted(removed)
+    }
+
+def extract_modified_symbols(parsed_diff: ParsedDiff) -> Dict[str, Dict[str, List[str]]]:
+    symbols = {}
+    for file_diff in parsed_diff.files:
+        file_symbols = extract_file_symbols(file_diff)
+        if file_symbols:
+            symbols[file_diff.filename] = file_symbols
+    return symbols
@@ -0,0 +1,94 @@
+import os
+import re
+from typing import Dict, List, Any, Optional
+from src.agents.tools.parsed_diff import ParsedDiff, FileDiff
+
+EXTENSION_TECHNOLOGIES = {
+    ".py": "python",
+    ".pyi": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".mts": "typescript",
+    ".html": "html",
+    ".htm": "html",
+    ".css": "css",
+    ".scss": "css",
+    ".sass": "css",
+    ".less": "css",
+    ".sql": "sql",
+    ".yml": "yaml",
+    ".yaml": "yaml",
+    ".json": "json",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".go": "go",
+    ".java": "java",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".swift": "swift",
+    ".sh": "shell",
+    ".bash": "shell",
+    ".toml": "toml",
+    ".tf": "terraform"
+}
+
+FILENAME_TECHNOLOGIES = {
+    "dockerfile": "docker",
+    "docker-compose.yml": "docker",
+    "docker-compose.yaml": "docker",
+    "compose.yml": "docker",
+    "compose.yaml": "docker",
+    "makefile": "make",
+    "gemfile": "ruby",
+    "go.mod": "go"
+}
+
+CONTENT_PATTERN = re.compile(
+    r"(?P<shell>^#!.*\b(?:ba|z)?sh\b)"
+    r"|(?P<python>^#!.*\bpython|^\s*from\s+[\w.]+\s+import\s|^\s*def\s+\w+\s*\(.*\)\s*(?:->.*)?:\s*$)"
+    r"|(?P<typescript>^\s*(?:export\s+)?(?:interface\s+\w+\s*\{|type\s+\w+\s*=))"
+    r"|(?P<javascript>^\s*(?:export\s+)?(?:const|let)\s+\w+\s*=\s*require\(|^\s*(?:export\s+)?function\s+\w+\s*\()"
+    r"|(?P<sql>^\s*(?i:select\s+.+\s+from|insert\s+into|update\s+\w+\s+set|create\s+table)\b)"
+    r"|(?P<html>^\s*<(?:!doctype\s+html|html|head|body|div|span)\b)",
+    re.MULTILINE
+)
+
+def classify_file(filename: str) -> Optional[str]:
+    basename = os.path.basename(filename).lower()
+    if basename in FILENAME_TECHNOLOGIES:
+        return FILENAME_TECHNOLOGIES[basename]
+    if basename.startswith("dockerfile"):
+        return "docker"
+    return EXTENSION_TECHNOLOGIES.get(os.path.splitext(basename)[1])
+
+def sniff_file(file_diff: FileDiff) -> List[str]:
+    added_text = "\n".join(file_diff.added_lines())
+    return sorted({match.lastgroup for match in CONTENT_PATTERN.finditer(added_text)})
+
+def detect_technologies(parsed_diff: ParsedDiff) -> Dict[str, Any]:
+    file_technologies = {}
+    for file_diff in parsed_diff.files:
+        technology = classify_file(file_diff.filename)
+        file_technologies[file_diff.filename] = [technology] if technology else sniff_file(file_diff)
+
+    return {
+        "files": file_technologies,
+        "technologies": sorted({
+            technology
+            for technologies in file_technologies.values()
+            for technology in technologies
+        })
+    }
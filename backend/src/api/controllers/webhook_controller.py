@@ -1,5 +1,7 @@
-from fastapi import HTTPException, Request, BackgroundTasks
+from fastapi import HTTPException, Request
 from src.api.services.webhook_service import WebhookService
+from src.utils.webhook_payload import extract_repository_url_candidates
+from src.utils.repository_url import normalize_repository_url
 import hmac
 import hashlib
 import json
@@ -24,21 +26,19 @@ class WebhookController:
 
     async def handle_github_webhook(
         self, 
-        request: Request, 
-        background_tasks: BackgroundTasks
+        request: Request
     ) -> Dict[str, Any]:
         signature = request.headers.get("X-Hub-Signature-256")
         if not signature:
             raise HTTPException(status_code=400, detail="Signature missing")
 
         body = await request.body()
-        payload = json.loads(body)
 
-        repo_url = payload.get("repository", {}).get("html_url")
-        if not repo_url:
+        repo_url_candidates = extract_repository_url_candidates(body)
+        if not repo_url_candidates:
             raise HTTPException(status_code=400, detail="Repository URL missing")
 
-        repo_data = await self.webhook_service.verify_repository(repo_url)
+        repo_data = await self.webhook_service.verify_repository(repo_url_candidates)
         if not repo_data:
             raise HTTPException(status_code=404, detail="Repository not registered")
 
@@ -47,18 +47,34 @@ class WebhookController:
             if not self.verify_signature(body, signature, webhook_secret):
                 raise HTTPException(status_code=401, detail="Invalid signature")
 
+        payload = json.loads(body)
+        repo_url = repo_data.get("url")
+        payload_repo_url = (payload.get("repository") or {}).get("html_url")
+        if not payload_repo_url or normalize_repository_url(payload_repo_url) != normalize_repository_url(repo_url):
+            raise HTTPException(status_code=400, detail="Repository does not match payload")
+
         commits = payload.get("commits", [])
         if not commits:
             return {"status": "ok", "message": "No commits to process"}
 
+        delivery_id = request.headers.get("X-GitHub-Delivery")
+        is_new_delivery = await self.webhook_service.register_delivery(delivery_id, repo_url)
+        if not is_new_delivery:
+            return {"status": "ok", "message": "Delivery already processed", "delivery_id": delivery_id}
+
         repo_owner = repo_data.get("owner")
         
-        background_tasks.add_task(
-            self.webhook_service.process_commits_background,
-            commits,
-            repo_owner,
-            repo_url
-        )
+        push_range = {"before": payload.get("before"), "after": payload.get("after")}
+        try:
+            await self.webhook_service.enqueue_commits(
+                commits,
+                repo_owner,
+                repo_url,
+                push_range=push_range
+            )
+        except Exception:
+            await self.webhook_service.release_delivery(delivery_id)
+            raise
         
         logger.info(f"Queued {len(commits)} commits for analysis from {repo_url}")
 
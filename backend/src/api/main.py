@@ -1,7 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.api.routes import repositories, settings, webhooks, commits
+from src.api.routes import repositories, settings, webhooks, commits, metrics
 from src.integration.database import Database
+from src.workers.worker_pool import AnalysisWorkerPool
+from src.services.repository_registry import RepositoryRegistry
+from src.integration.http_clients import HttpClientRegistry
+from src.services.runtime_metrics import RuntimeMetrics
+from src.config import Config
 import uvicorn
 import logging
 
@@ -19,16 +24,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(repositories.router, prefix="/api", tags=["repositories"])
 app.include_router(settings.router, prefix="/api", tags=["settings"])
 app.include_router(webhooks.router, prefix="/api", tags=["webhooks"])
 app.include_router(commits.router, prefix="/api", tags=["commits"])
+app.include_router(metrics.router, prefix="/api", tags=["metrics"])
+
+worker_pool = AnalysisWorkerPool(Config.ANALYSIS_WORKERS)
 
 @app.on_event("startup")
 async def startup_db_client():
     await Database().create_indexes()
 
+@app.on_event("startup")
+async def startup_http_clients():
+    HttpClientRegistry().startup()
+
+@app.on_event("startup")
+async def startup_repository_registry():
+    await RepositoryRegistry().load()
+
+@app.on_event("startup")
+async def startup_analysis_workers():
+    if Config.ANALYSIS_EMBEDDED_WORKERS:
+        worker_pool.start()
+
+@app.on_event("startup")
+async def startup_runtime_metrics():
+    if Config.RUNTIME_METRICS_ENABLED:
+        RuntimeMetrics().start()
+
+@app.on_event("shutdown")
+async def shutdown_runtime_metrics():
+    await RuntimeMetrics().stop()
+
+@app.on_event("shutdown")
+async def shutdown_analysis_workers():
+    await worker_pool.stop()
+
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    await HttpClientRegistry().shutdown()
+
 if __name__ == "__main__":
     uvicorn.run("src.api.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,19 +1,40 @@
-from fastapi import APIRouter, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Response
 from src.integration.commits import CommitDAO
-from typing import List, Any
+from src.integration.commit_diffs import CommitDiffDAO
+from src.utils.commit_cursor import encode_cursor, decode_cursor
+from src.config import Config
+from typing import List, Any, Optional
 
 router = APIRouter()
 commit_dao = CommitDAO()
+commit_diff_dao = CommitDiffDAO()
 
 @router.get("/repositories/{repo_id:path}/commits")
 async def get_repository_commits(
     repo_id: str, 
+    response: Response,
     date: str = None, 
-    page: int = 1, 
-    limit: int = 20
+    page: Optional[int] = None, 
+    limit: int = 20,
+    cursor: Optional[str] = None
 ):
-    skip = (page - 1) * limit
-    commits = await commit_dao.get_by_repository(repo_id, date_str=date, skip=skip, limit=limit)
+    limit = max(1, min(limit, Config.COMMIT_PAGE_MAX_LIMIT))
+    current_page = max(page or 1, 1)
+    
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    skip = 0 if after else (current_page - 1) * limit
+    commits = await commit_dao.get_by_repository(repo_id, date_str=date, skip=skip, limit=limit, after=after)
+    
+    next_cursor = None
+    if len(commits) == limit and isinstance(commits[-1].get("timestamp"), datetime):
+        next_cursor = encode_cursor(commits[-1]["timestamp"], commits[-1]["_id"])
     
     # Format MongoDB results (convert ObjectId to str)
     for commit in commits:
@@ -22,5 +43,27 @@ async def get_repository_commits(
             commit["created_at"] = commit["created_at"].isoformat()
         if "timestamp" in commit and not isinstance(commit["timestamp"], str):
             commit["timestamp"] = commit["timestamp"].isoformat()
-                
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return commits
+
+@router.get("/repositories/{repo_id:path}/commits/{sha}/diff")
+async def get_commit_diff(repo_id: str, sha: str):
+    commit = await commit_dao.get_legacy_diff(repo_id, sha)
+    if not commit:
+        raise HTTPException(status_code=404, detail="Commit not found")
+
+    stored_diff = await commit_diff_dao.get_diff(sha)
+    if stored_diff:
+        return stored_diff
+
+    if commit.get("diff") is not None:
+        return {
+            "hash": sha,
+            "diff": commit["diff"],
+            "size": commit.get("diff_size"),
+            "truncated": commit.get("diff_truncated", False)
+        }
+
+    raise HTTPException(status_code=404, detail="Diff not available")
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, HTTPException
+from src.services.runtime_metrics import RuntimeMetrics
+from src.services.model_router import ModelRouter
+from src.config import Config
+
+router = APIRouter()
+runtime_metrics = RuntimeMetrics()
+
+@router.get("/metrics/runtime")
+async def get_runtime_metrics():
+    if not Config.RUNTIME_METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Runtime metrics disabled")
+    return {**runtime_metrics.snapshot(), "models": ModelRouter().get_stats()}
+
+@router.post("/metrics/runtime/reset")
+async def reset_runtime_metrics():
+    if not Config.RUNTIME_METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Runtime metrics disabled")
+    runtime_metrics.reset()
+    return {"status": "ok"}
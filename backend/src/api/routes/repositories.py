@@ -1,13 +1,16 @@
 from fastapi import APIRouter, HTTPException
 from src.api.models.repository import RepositoryCreate, RepositoryResponse
 from src.integration.repositories import RepositoryDAO
+from src.services.repository_registry import RepositoryRegistry
 
 router = APIRouter()
 repo_dao = RepositoryDAO()
+repository_registry = RepositoryRegistry()
 
 @router.post("/repositories", response_model=RepositoryResponse)
 async def add_repository(repo: RepositoryCreate):
     result = await repo_dao.add_repository(repo.url, repo.owner, repo.repo, repo.secret)
+    await repository_registry.invalidate()
     return {
         "url": repo.url,
         "owner": repo.owner,
@@ -30,6 +33,7 @@ async def delete_repository(repo_id: str):
     result = await repo_dao.delete_repository(repo_id)
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Repository not found")
+    await repository_registry.invalidate()
     return {"status": "deleted"}
 
 @router.put("/repositories/{repo_id}", response_model=RepositoryResponse)
@@ -37,6 +41,7 @@ async def update_repository(repo_id: str, repo: RepositoryCreate):
     result = await repo_dao.update_repository(repo_id, repo.url, repo.owner, repo.repo, repo.secret)
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Repository not found")
+    await repository_registry.invalidate()
     return {
         "url": repo.url,
         "owner": repo.owner,
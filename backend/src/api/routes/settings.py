@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 from src.integration.settings import SettingsDAO
+from src.integration.http_clients import HttpClientRegistry
 
 router = APIRouter()
+http_clients = HttpClientRegistry()
 
 @router.get("/settings")
 async def get_settings():
@@ -17,16 +19,14 @@ async def get_settings():
         "slack_webhook_url": slack_webhook_url
     }
 
-import httpx
 import os
 
 @router.get("/settings/whatsapp/status")
 async def get_whatsapp_status():
     bridge_url = os.getenv("WHATSAPP_BRIDGE_URL", "http://localhost:8001")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{bridge_url}/api/whatsapp/status")
-            return response.json()
+        response = await http_clients.get("whatsapp_bridge").get(f"{bridge_url}/api/whatsapp/status")
+        return response.json()
     except Exception:
         return {"status": "DISCONNECTED", "error": "Bridge offline"}
 
@@ -34,9 +34,8 @@ async def get_whatsapp_status():
 async def get_whatsapp_qr():
     bridge_url = os.getenv("WHATSAPP_BRIDGE_URL", "http://localhost:8001")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{bridge_url}/api/whatsapp/qr")
-            return response.json()
+        response = await http_clients.get("whatsapp_bridge").get(f"{bridge_url}/api/whatsapp/qr")
+        return response.json()
     except Exception:
         return {"error": "Bridge offline or QR not available"}
 
@@ -44,9 +43,8 @@ async def get_whatsapp_qr():
 async def get_whatsapp_groups():
     bridge_url = os.getenv("WHATSAPP_BRIDGE_URL", "http://localhost:8001")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{bridge_url}/api/whatsapp/groups")
-            return response.json()
+        response = await http_clients.get("whatsapp_bridge").get(f"{bridge_url}/api/whatsapp/groups")
+        return response.json()
     except Exception:
         return {"groups": [], "error": "Bridge offline"}
 
@@ -1,22 +1,37 @@
-from src.integration.repositories import RepositoryDAO
+from src.integration.analysis_jobs import AnalysisJobDAO
+from src.integration.commits import CommitDAO
+from src.integration.webhook_deliveries import WebhookDeliveryDAO
 from src.services.analysis_service import AnalysisService
-from typing import Dict, List, Any
+from src.services.repository_registry import RepositoryRegistry
+from src.config import Config
+from typing import Dict, List, Any, Optional
 import logging
-import asyncio
 
 logger = logging.getLogger(__name__)
 
 class WebhookService:
     def __init__(self):
-        self.repo_dao = RepositoryDAO()
+        self.repository_registry = RepositoryRegistry()
+        self.job_dao = AnalysisJobDAO()
+        self.commit_dao = CommitDAO()
+        self.delivery_dao = WebhookDeliveryDAO()
         self.analysis_service = AnalysisService()
 
-    async def verify_repository(self, repo_url: str) -> Dict[str, Any]:
-        repo_data = await self.repo_dao.collection.find_one({"url": repo_url})
+    async def verify_repository(self, repo_urls: List[str]) -> Dict[str, Any]:
+        repo_data = await self.repository_registry.find(repo_urls)
         if not repo_data:
             return None
         return repo_data
 
+    async def register_delivery(self, delivery_id: str, repo_url: str) -> bool:
+        if not delivery_id:
+            return True
+        return await self.delivery_dao.record_delivery(delivery_id, repo_url)
+
+    async def release_delivery(self, delivery_id: str):
+        if delivery_id:
+            await self.delivery_dao.delete_delivery(delivery_id)
+
     def verify_author(self, commit_author: str, repo_owner: str) -> bool:
         return commit_author == repo_owner
 
@@ -36,11 +51,13 @@ class WebhookService:
         self, 
         commits: List[Dict[str, Any]], 
         repo_owner: str,
-        repo_url: str
+        repo_url: str,
+        force: bool = False,
+        job_id=None,
+        push_range: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         processed_commits = []
         skipped_commits = []
-        analyzed_commits = []
 
         for commit in commits:
             commit_author = commit.get("author", {}).get("username")
@@ -54,14 +71,38 @@ class WebhookService:
                 })
                 continue
 
-            commit_data = self.extract_commit_data(commit)
-            processed_commits.append(commit_data)
-            
-            analysis_result = await self.analysis_service.analyze_commit(
-                commit_data, 
-                repo_url
+            processed_commits.append(self.extract_commit_data(commit))
+
+        if not force:
+            settled_hashes = await self.commit_dao.get_settled_hashes(
+                [commit_data["sha"] for commit_data in processed_commits],
+                Config.JOB_VISIBILITY_TIMEOUT,
+                job_id
             )
-            analyzed_commits.append(analysis_result)
+            skipped_commits.extend({
+                "sha": commit_data["sha"],
+                "author": commit_data["author"],
+                "reason": "Commit already analyzed or in progress"
+            } for commit_data in processed_commits if commit_data["sha"] in settled_hashes)
+            processed_commits = [
+                commit_data for commit_data in processed_commits
+                if commit_data["sha"] not in settled_hashes
+            ]
+
+        await self.commit_dao.mark_pending([{
+            "hash": commit_data["sha"],
+            "message": commit_data["message"],
+            "author": commit_data["author"],
+            "timestamp": commit_data["timestamp"],
+            "url": commit_data["url"],
+            "repository": repo_url
+        } for commit_data in processed_commits], job_id)
+
+        analyzed_commits = await self.analysis_service.batch_analyze_commits(
+            processed_commits,
+            repo_url,
+            push_range
+        )
 
         return {
             "processed": processed_commits,
@@ -69,18 +110,18 @@ class WebhookService:
             "analyzed": analyzed_commits
         }
     
-    async def process_commits_background(
+    async def enqueue_commits(
         self,
         commits: List[Dict[str, Any]],
         repo_owner: str,
-        repo_url: str
+        repo_url: str,
+        force: bool = False,
+        push_range: Optional[Dict[str, str]] = None
     ):
-        try:
-            result = await self.process_commits(commits, repo_owner, repo_url)
-            
-            logger.info(
-                f"Background analysis completed: {len(result['analyzed'])} analyzed, "
-                f"{len(result['skipped'])} skipped for {repo_url}"
-            )
-        except Exception as e:
-            logger.error(f"Background analysis failed for {repo_url}: {e}")
+        return await self.job_dao.enqueue({
+            "commits": commits,
+            "repo_owner": repo_owner,
+            "repository": repo_url,
+            "force": force,
+            "push_range": push_range
+        })
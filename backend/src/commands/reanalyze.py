@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Any, List
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+def to_push_commit(doc: Dict[str, Any]) -> Dict[str, Any]:
+    timestamp = doc.get("timestamp")
+    return {
+        "id": doc["hash"],
+        "message": doc.get("message"),
+        "author": {"username": doc.get("author")},
+        "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+        "url": doc.get("url")
+    }
+
+async def reanalyze(repo_url: str, hashes: List[str], date_str: str) -> int:
+    from src.integration.commits import CommitDAO
+    from src.integration.repositories import RepositoryDAO
+    from src.api.services.webhook_service import WebhookService
+
+    repository = await RepositoryDAO().get_by_url(repo_url)
+    if not repository:
+        raise SystemExit(f"Repository not registered: {repo_url}")
+
+    commits = await CommitDAO().get_for_reanalysis(repository["url"], hashes, date_str)
+    if not commits:
+        logger.info(f"No stored commits matched for {repository['url']}")
+        return 0
+
+    await WebhookService().enqueue_commits(
+        [to_push_commit(doc) for doc in commits],
+        repository["owner"],
+        repository["url"],
+        force=True
+    )
+    return len(commits)
+
+def main():
+    parser = argparse.ArgumentParser(description="Queue stored commits for forced re-analysis")
+    parser.add_argument("repository", help="Registered repository URL")
+    parser.add_argument("--sha", action="append", default=[], help="Commit hash to re-analyze (repeatable)")
+    parser.add_argument("--date", help="Re-analyze commits from this day (YYYY-MM-DD)")
+    args = parser.parse_args()
+    if not args.sha and not args.date:
+        parser.error("pass at least one --sha or a --date")
+
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    queued = asyncio.run(reanalyze(args.repository, args.sha, args.date))
+    logger.info(f"Queued {queued} commits for forced re-analysis of {args.repository}")
+
+if __name__ == "__main__":
+    main()
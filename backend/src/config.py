@@ -8,3 +8,68 @@ class Config:
     GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET")
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
     WA_GROUP_ID = os.getenv("WA_GROUP_ID")
+    ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "2"))
+    ANALYSIS_EMBEDDED_WORKERS = os.getenv("ANALYSIS_EMBEDDED_WORKERS", "true").lower() == "true"
+    JOB_VISIBILITY_TIMEOUT = int(os.getenv("JOB_VISIBILITY_TIMEOUT", "900"))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+    JOB_RETRY_BASE_DELAY = float(os.getenv("JOB_RETRY_BASE_DELAY", "10"))
+    JOB_RETRY_MAX_DELAY = float(os.getenv("JOB_RETRY_MAX_DELAY", "900"))
+    JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+    JOB_HEARTBEAT_INTERVAL = float(os.getenv("JOB_HEARTBEAT_INTERVAL", "60"))
+    JOB_RETENTION_TTL = int(os.getenv("JOB_RETENTION_TTL", "604800"))
+    ANALYSIS_CONCURRENCY = int(os.getenv("ANALYSIS_CONCURRENCY", "4"))
+    ANALYSIS_REPOSITORY_CONCURRENCY = int(os.getenv("ANALYSIS_REPOSITORY_CONCURRENCY", "2"))
+    WEBHOOK_DELIVERY_TTL = int(os.getenv("WEBHOOK_DELIVERY_TTL", "604800"))
+    REPOSITORY_REGISTRY_REFRESH_SECONDS = int(os.getenv("REPOSITORY_REGISTRY_REFRESH_SECONDS", "60"))
+    HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "100"))
+    GITHUB_MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "5"))
+    GITHUB_RETRY_BASE_DELAY = float(os.getenv("GITHUB_RETRY_BASE_DELAY", "1"))
+    GITHUB_ETAG_CACHE_SIZE = int(os.getenv("GITHUB_ETAG_CACHE_SIZE", "512"))
+    GITHUB_ETAG_CACHE_MAX_BYTES = int(os.getenv("GITHUB_ETAG_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+    MAX_DIFF_SIZE = int(os.getenv("MAX_DIFF_SIZE", str(2 * 1024 * 1024)))
+    DIFF_CACHE_DIR = os.getenv("DIFF_CACHE_DIR", ".cache/diffs")
+    DIFF_CACHE_MAX_BYTES = int(os.getenv("DIFF_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+    ANALYSIS_MODEL = os.getenv("ANALYSIS_MODEL", "openai/gpt-4o")
+    ANALYSIS_TOKEN_BUDGET = int(os.getenv("ANALYSIS_TOKEN_BUDGET", "12000"))
+    ANALYSIS_MODEL_TOKEN_BUDGETS = os.getenv("ANALYSIS_MODEL_TOKEN_BUDGETS", "")
+    ANALYSIS_FILE_TOKEN_CAP = int(os.getenv("ANALYSIS_FILE_TOKEN_CAP", "3000"))
+    ANALYSIS_AGENT_CHECKPOINTER = os.getenv("ANALYSIS_AGENT_CHECKPOINTER", "bounded")
+    REPORT_AGENT_CHECKPOINTER = os.getenv("REPORT_AGENT_CHECKPOINTER", "bounded")
+    CHECKPOINT_MAX_THREADS = int(os.getenv("CHECKPOINT_MAX_THREADS", "256"))
+    CHECKPOINT_TTL_SECONDS = int(os.getenv("CHECKPOINT_TTL_SECONDS", "3600"))
+    CHECKPOINT_MAX_BYTES = int(os.getenv("CHECKPOINT_MAX_BYTES", str(64 * 1024 * 1024)))
+    CHECKPOINT_SPILL_DIR = os.getenv("CHECKPOINT_SPILL_DIR", "")
+    ANALYSIS_CACHE_ENABLED = os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() == "true"
+    ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", str(30 * 24 * 3600)))
+    MICRO_BATCH_ENABLED = os.getenv("MICRO_BATCH_ENABLED", "true").lower() == "true"
+    MICRO_BATCH_MAX_DIFF_BYTES = int(os.getenv("MICRO_BATCH_MAX_DIFF_BYTES", "4000"))
+    MICRO_BATCH_MAX_IMPACT = int(os.getenv("MICRO_BATCH_MAX_IMPACT", "4"))
+    MICRO_BATCH_SIZE = int(os.getenv("MICRO_BATCH_SIZE", "8"))
+    HEURISTIC_ENABLED = os.getenv("HEURISTIC_ENABLED", "true").lower() == "true"
+    HEURISTIC_RULES = os.getenv("HEURISTIC_RULES", "docs_only,lockfile_only,dependency_bump,typo_fix")
+    HEURISTIC_MAX_DEPENDENCY_LINES = int(os.getenv("HEURISTIC_MAX_DEPENDENCY_LINES", "40"))
+    HEURISTIC_MAX_TYPO_LINES = int(os.getenv("HEURISTIC_MAX_TYPO_LINES", "2"))
+    GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+    OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+    RUNTIME_METRICS_ENABLED = os.getenv("RUNTIME_METRICS_ENABLED", "false").lower() == "true"
+    RUNTIME_METRICS_INTERVAL = float(os.getenv("RUNTIME_METRICS_INTERVAL", "0.5"))
+    ANALYSIS_MODEL_TIERING = os.getenv("ANALYSIS_MODEL_TIERING", "true").lower() == "true"
+    ANALYSIS_SMALL_MODEL = os.getenv("ANALYSIS_SMALL_MODEL", "openai/gpt-4o-mini")
+    ANALYSIS_SMALL_MAX_DIFF_BYTES = int(os.getenv("ANALYSIS_SMALL_MAX_DIFF_BYTES", "8000"))
+    ANALYSIS_SMALL_MAX_IMPACT = int(os.getenv("ANALYSIS_SMALL_MAX_IMPACT", "4"))
+    REPORT_MODEL = os.getenv("REPORT_MODEL", ANALYSIS_MODEL)
+    REPORT_FALLBACK_MODEL = os.getenv("REPORT_FALLBACK_MODEL", ANALYSIS_SMALL_MODEL)
+    MODEL_CONCURRENCY_INITIAL = float(os.getenv("MODEL_CONCURRENCY_INITIAL", "4"))
+    MODEL_CONCURRENCY_MIN = float(os.getenv("MODEL_CONCURRENCY_MIN", "1"))
+    MODEL_CONCURRENCY_MAX = float(os.getenv("MODEL_CONCURRENCY_MAX", "16"))
+    MODEL_LATENCY_TOLERANCE = float(os.getenv("MODEL_LATENCY_TOLERANCE", "2.0"))
+    MODEL_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("MODEL_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    MODEL_CIRCUIT_RESET_SECONDS = float(os.getenv("MODEL_CIRCUIT_RESET_SECONDS", "30"))
+    ANALYSIS_CONTEXT_MODE = os.getenv("ANALYSIS_CONTEXT_MODE", "precomputed")
+    ANALYSIS_FACTS_MAX_FILES = int(os.getenv("ANALYSIS_FACTS_MAX_FILES", "40"))
+    COMMIT_DIFF_COMPRESSION_LEVEL = int(os.getenv("COMMIT_DIFF_COMPRESSION_LEVEL", "6"))
+    COMMIT_PAGE_MAX_LIMIT = int(os.getenv("COMMIT_PAGE_MAX_LIMIT", "100"))
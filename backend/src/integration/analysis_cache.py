@@ -0,0 +1,21 @@
+from datetime import datetime
+from src.integration.database import Database
+
+class AnalysisCacheDAO:
+    def __init__(self):
+        self.collection = Database().get_collection("analysis_cache")
+
+    async def get(self, key: str):
+        return await self.collection.find_one({"key": key}, {"analysis": 1})
+
+    async def put(self, key: str, analysis: dict, model: str, prompt_version: str):
+        return await self.collection.update_one(
+            {"key": key},
+            {"$set": {
+                "analysis": analysis,
+                "model": model,
+                "prompt_version": prompt_version,
+                "created_at": datetime.utcnow()
+            }},
+            upsert=True
+        )
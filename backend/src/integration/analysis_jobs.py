@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+from pymongo import ReturnDocument
+from src.integration.database import Database
+
+class AnalysisJobDAO:
+    def __init__(self):
+        self.collection = Database().get_collection("analysis_jobs")
+
+    async def enqueue(self, payload: dict):
+        now = datetime.utcnow()
+        return await self.collection.insert_one({
+            **payload,
+            "status": "pending",
+            "attempts": 0,
+            "available_at": now,
+            "lease_expires_at": None,
+            "worker_id": None,
+            "last_error": None,
+            "created_at": now,
+            "updated_at": now
+        })
+
+    async def lease(self, worker_id: str, visibility_timeout: int):
+        now = datetime.utcnow()
+        return await self.collection.find_one_and_update(
+            {"$or": [
+                {"status": "pending", "available_at": {"$lte": now}},
+                {"status": "leased", "lease_expires_at": {"$lte": now}}
+            ]},
+            {"$set": {
+                "status": "leased",
+                "worker_id": worker_id,
+                "lease_expires_at": now + timedelta(seconds=visibility_timeout),
+                "updated_at": now
+            }, "$inc": {"attempts": 1}},
+            sort=[("available_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def extend_lease(self, job_id, worker_id: str, visibility_timeout: int) -> bool:
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": job_id, "worker_id": worker_id, "status": "leased"},
+            {"$set": {
+                "lease_expires_at": now + timedelta(seconds=visibility_timeout),
+                "updated_at": now
+            }}
+        )
+        return result.matched_count > 0
+
+    async def ack(self, job_id, worker_id: str) -> bool:
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": job_id, "worker_id": worker_id, "status": "leased"},
+            {"$set": {
+                "status": "completed",
+                "lease_expires_at": None,
+                "completed_at": now,
+                "finished_at": now,
+                "updated_at": now
+            }}
+        )
+        return result.matched_count > 0
+
+    async def retry(self, job_id, worker_id: str, error: str, delay: float) -> bool:
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": job_id, "worker_id": worker_id, "status": "leased"},
+            {"$set": {
+                "status": "pending",
+                "available_at": now + timedelta(seconds=delay),
+                "lease_expires_at": None,
+                "last_error": error,
+                "updated_at": now
+            }}
+        )
+        return result.matched_count > 0
+
+    async def fail(self, job_id, worker_id: str, error: str) -> bool:
+        now = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": job_id, "worker_id": worker_id, "status": "leased"},
+            {"$set": {
+                "status": "failed",
+                "lease_expires_at": None,
+                "last_error": error,
+                "finished_at": now,
+                "updated_at": now
+            }}
+        )
+        return result.matched_count > 0
@@ -0,0 +1,39 @@
+import zlib
+from datetime import datetime
+from typing import Optional, Dict, Any
+from src.integration.database import Database
+from src.config import Config
+
+class CommitDiffDAO:
+    def __init__(self):
+        self.collection = Database().get_collection("commit_diffs")
+
+    def build_document(self, hash: str, diff: str, size: int, truncated: bool) -> Dict[str, Any]:
+        compressed = zlib.compress(diff.encode("utf-8"), Config.COMMIT_DIFF_COMPRESSION_LEVEL)
+        return {
+            "hash": hash,
+            "diff": compressed,
+            "encoding": "zlib",
+            "size": size,
+            "stored_size": len(compressed),
+            "truncated": truncated,
+            "updated_at": datetime.utcnow()
+        }
+
+    async def save_diff(self, hash: str, diff: str, size: int, truncated: bool):
+        return await self.collection.update_one(
+            {"hash": hash},
+            {"$set": self.build_document(hash, diff, size, truncated)},
+            upsert=True
+        )
+
+    async def get_diff(self, hash: str) -> Optional[Dict[str, Any]]:
+        doc = await self.collection.find_one({"hash": hash})
+        if not doc:
+            return None
+        return {
+            "hash": hash,
+            "diff": zlib.decompress(doc["diff"]).decode("utf-8", errors="replace"),
+            "size": doc.get("size"),
+            "truncated": doc.get("truncated", False)
+        }
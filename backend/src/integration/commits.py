@@ -1,55 +1,131 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Any, Optional, Tuple
+from pymongo import UpdateOne
 from src.integration.database import Database
+from src.utils.timestamps import parse_timestamp, fallback_timestamp
+
+LIST_PROJECTION = {"diff": 0}
 
 class CommitDAO:
     def __init__(self):
         self.collection = Database().get_collection("commits")
 
+    def _normalize_timestamp(self, commit_data: dict):
+        timestamp = commit_data.get("timestamp")
+        parsed = parse_timestamp(timestamp)
+        if parsed is None and timestamp is not None:
+            commit_data["timestamp_raw"] = timestamp
+        commit_data["timestamp"] = parsed or fallback_timestamp(commit_data.get("created_at"))
+
     async def save_summary(self, commit_data: dict):
         commit_data["created_at"] = datetime.utcnow()
-        if "timestamp" in commit_data and isinstance(commit_data["timestamp"], str):
-            try:
-                # ISO 8601 can have 'Z' or offset. datetime.fromisoformat handles offsets in 3.7+
-                # but might need 'Z' replaced with +00:00 depending on Python version.
-                ts_str = commit_data["timestamp"].replace('Z', '+00:00')
-                commit_data["timestamp"] = datetime.fromisoformat(ts_str)
-            except (ValueError, TypeError):
-                pass
+        self._normalize_timestamp(commit_data)
 
-        if "timestamp" not in commit_data or commit_data["timestamp"] is None:
-            commit_data["timestamp"] = datetime.utcnow()
+        update = {"$set": commit_data}
+        if commit_data.get("analysis_status") == "completed":
+            commit_data.pop("diff", None)
+            update["$unset"] = {"diff": ""}
 
         return await self.collection.update_one(
             {"hash": commit_data["hash"]},
-            {"$set": commit_data},
+            update,
             upsert=True
         )
 
+    async def save_partial_analysis(self, hash: str, fields: dict):
+        return await self.collection.update_one(
+            {"hash": hash, "analysis_status": "pending"},
+            {"$set": fields}
+        )
+
+    async def get_settled_hashes(self, hashes: list[str], in_flight_seconds: int, job_id=None) -> set[str]:
+        in_flight_since = datetime.utcnow() - timedelta(seconds=in_flight_seconds)
+        cursor = self.collection.find(
+            {
+                "hash": {"$in": hashes},
+                "$or": [
+                    {"analysis_status": "completed"},
+                    {
+                        "analysis_status": "pending",
+                        "analysis_started_at": {"$gte": in_flight_since},
+                        "analysis_job_id": {"$ne": job_id}
+                    }
+                ]
+            },
+            {"hash": 1}
+        )
+        return {doc["hash"] async for doc in cursor}
+
+    async def mark_pending(self, commits: list[dict], job_id=None):
+        if not commits:
+            return None
+        operations = []
+        for commit_data in commits:
+            self._normalize_timestamp(commit_data)
+            operations.append(UpdateOne(
+                {"hash": commit_data["hash"]},
+                {"$set": {
+                    **commit_data,
+                    "analysis_status": "pending",
+                    "analysis_started_at": datetime.utcnow(),
+                    "analysis_job_id": job_id
+                }, "$setOnInsert": {"created_at": datetime.utcnow()}},
+                upsert=True
+            ))
+        return await self.collection.bulk_write(operations, ordered=False)
+
+    def _day_range(self, date_str: str) -> dict:
+        start_date = datetime.strptime(date_str, "%Y-%m-%d")
+        return {"$gte": start_date, "$lt": start_date + timedelta(days=1)}
+
     async def get_daily_summaries(self, date_str: str = None):
         if not date_str:
             date_str = datetime.utcnow().strftime("%Y-%m-%d")
         
-        start_date = datetime.strptime(date_str, "%Y-%m-%d")
-        end_date = start_date.replace(hour=23, minute=59, second=59)
-        
-        return await self.collection.find({
-            "$or": [
-                {"timestamp": {"$gte": start_date, "$lte": end_date}},
-                {"timestamp": {"$regex": f"^{date_str}"}}
-            ]
-        }).to_list(length=1000)
+        return await self.collection.find(
+            {"timestamp": self._day_range(date_str)},
+            LIST_PROJECTION
+        ).to_list(length=1000)
 
-    async def get_by_repository(self, repo_url: str, date_str: str = None, skip: int = 0, limit: int = 20):
+    async def get_by_repository(
+        self,
+        repo_url: str,
+        date_str: str = None,
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, Any]] = None
+    ):
         query = {"repository": repo_url}
         if date_str:
             try:
-                start_date = datetime.strptime(date_str, "%Y-%m-%d")
-                end_date = start_date.replace(hour=23, minute=59, second=59)
-                query["$or"] = [
-                    {"timestamp": {"$gte": start_date, "$lte": end_date}},
-                    {"timestamp": {"$regex": f"^{date_str}"}}
-                ]
+                query["timestamp"] = self._day_range(date_str)
             except ValueError:
                 pass
+        if after:
+            timestamp, document_id = after
+            query["$or"] = [
+                {"timestamp": {"$lt": timestamp}},
+                {"timestamp": timestamp, "_id": {"$lt": document_id}}
+            ]
         
-        return await self.collection.find(query).sort("timestamp", -1).skip(skip).limit(limit).to_list(length=limit)
+        cursor = self.collection.find(query, LIST_PROJECTION).sort([("timestamp", -1), ("_id", -1)])
+        if skip:
+            cursor = cursor.skip(skip)
+        return await cursor.limit(limit).to_list(length=limit)
+
+    async def get_for_reanalysis(self, repo_url: str, hashes: list[str] = None, date_str: str = None, limit: int = 1000):
+        query = {"repository": repo_url}
+        if hashes:
+            query["hash"] = {"$in": hashes}
+        if date_str:
+            query["timestamp"] = self._day_range(date_str)
+        return await self.collection.find(
+            query,
+            {"hash": 1, "message": 1, "author": 1, "timestamp": 1, "url": 1}
+        ).sort("timestamp", 1).to_list(length=limit)
+
+    async def get_legacy_diff(self, repo_url: str, hash: str):
+        return await self.collection.find_one(
+            {"repository": repo_url, "hash": hash},
+            {"diff": 1, "diff_size": 1, "diff_truncated": 1}
+        )
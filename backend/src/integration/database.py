@@ -1,7 +1,10 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import OperationFailure
 import os
 from src.config import Config
 
+INDEX_OPTIONS_CONFLICT = 85
+
 class Database:
     _instance = None
     _client = None
@@ -17,7 +20,29 @@ class Database:
     def get_collection(self, name: str):
         return self._db[name]
 
+    async def _create_ttl_index(self, collection: str, field: str, ttl_seconds: int):
+        try:
+            await self._db[collection].create_index(field, expireAfterSeconds=ttl_seconds)
+        except OperationFailure as e:
+            if e.code != INDEX_OPTIONS_CONFLICT:
+                raise
+            await self._db.command({
+                "collMod": collection,
+                "index": {"keyPattern": {field: 1}, "expireAfterSeconds": ttl_seconds}
+            })
+
     async def create_indexes(self):
         await self._db["repositories"].create_index("url", unique=True)
         await self._db["commits"].create_index("hash", unique=True)
         await self._db["commits"].create_index("timestamp")
+        await self._db["commits"].create_index([("repository", 1), ("timestamp", -1), ("_id", -1)])
+        await self._db["commits"].create_index([("author", 1), ("timestamp", -1)])
+        await self._db["migrations"].create_index("name", unique=True)
+        await self._db["commit_diffs"].create_index("hash", unique=True)
+        await self._db["analysis_jobs"].create_index([("status", 1), ("available_at", 1)])
+        await self._db["analysis_jobs"].create_index([("status", 1), ("lease_expires_at", 1)])
+        await self._create_ttl_index("analysis_jobs", "finished_at", Config.JOB_RETENTION_TTL)
+        await self._db["webhook_deliveries"].create_index("delivery_id", unique=True)
+        await self._create_ttl_index("webhook_deliveries", "created_at", Config.WEBHOOK_DELIVERY_TTL)
+        await self._db["analysis_cache"].create_index("key", unique=True)
+        await self._create_ttl_index("analysis_cache", "created_at", Config.ANALYSIS_CACHE_TTL)
@@ -0,0 +1,105 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional, Dict, Any
+from src.config import Config
+from src.utils.repository_url import normalize_repository_url
+
+class DiffCache:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(DiffCache, cls).__new__(cls)
+            cls._instance.directory = Config.DIFF_CACHE_DIR
+            cls._instance.max_bytes = Config.DIFF_CACHE_MAX_BYTES
+            cls._instance.size_estimate = None
+            cls._instance.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        return cls._instance
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory) and self.max_bytes > 0
+
+    def _path(self, repo_url: str, commit_sha: str) -> str:
+        key = hashlib.sha256(f"{normalize_repository_url(repo_url)}@{commit_sha}".encode()).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.gz")
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                diff_result = json.load(file)
+            os.utime(path)
+            return diff_result
+        except (FileNotFoundError, EOFError, OSError, ValueError):
+            return None
+
+    def _write(self, path: str, diff_result: Dict[str, Any]) -> int:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(gzip.compress(json.dumps(diff_result).encode("utf-8")))
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return os.path.getsize(path)
+
+    def _scan(self) -> list[tuple[float, int, str]]:
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".gz"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                self.stats["evictions"] += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self.size_estimate = total
+
+    def _store(self, path: str, diff_result: Dict[str, Any]):
+        written = self._write(path, diff_result)
+        if self.size_estimate is None:
+            self.size_estimate = sum(size for _, size, _ in self._scan())
+        else:
+            self.size_estimate += written
+        if self.size_estimate > self.max_bytes:
+            self._evict()
+
+    async def get(self, repo_url: str, commit_sha: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        diff_result = await asyncio.to_thread(self._read, self._path(repo_url, commit_sha))
+        self.stats["hits" if diff_result is not None else "misses"] += 1
+        return diff_result
+
+    async def put(self, repo_url: str, commit_sha: str, diff_result: Dict[str, Any]):
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self._store, self._path(repo_url, commit_sha), diff_result)
+        self.stats["writes"] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self.stats, "size_bytes": self.size_estimate or 0}
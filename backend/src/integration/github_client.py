@@ -1,12 +1,21 @@
-import httpx
+import json
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 from src.integration.settings import SettingsDAO
+from src.integration.http_clients import HttpClientRegistry
+from src.integration.github_transport import GitHubTransport
+from src.integration.diff_cache import DiffCache
+from src.utils.patch_series import split_patch_series
+from src.config import Config
+
+NULL_COMMIT_SHA = "0" * 40
 
 class GitHubClient:
-    def __init__(self):
+    def __init__(self, http_clients: Optional[HttpClientRegistry] = None):
         self.settings_dao = SettingsDAO()
-        self.base_url = "https://api.github.com"
+        self.transport = GitHubTransport(http_clients)
+        self.diff_cache = DiffCache()
+        self.base_url = Config.GITHUB_API_URL.rstrip("/")
         self._token = None
     
     async def _get_token(self) -> str:
@@ -27,6 +36,44 @@ class GitHubClient:
         if len(path_parts) >= 2:
             return path_parts[0], path_parts[1]
         raise ValueError(f"Invalid repository URL: {repo_url}")
+
+    async def _get(
+        self,
+        url: str,
+        accept: str,
+        max_bytes: Optional[int] = None,
+        use_etag: bool = True
+    ) -> Dict[str, Any]:
+        headers = {
+            **(await self._get_headers()),
+            "Accept": accept
+        }
+        return await self.transport.get(url, headers, await self._get_token(), max_bytes, use_etag)
+
+    def _limit_diff(self, diff: str, max_bytes: Optional[int]) -> Dict[str, Any]:
+        encoded = diff.encode("utf-8")
+        if max_bytes is None or len(encoded) <= max_bytes:
+            return {"diff": diff, "size": len(encoded), "truncated": False}
+        return {
+            "diff": encoded[:max_bytes].decode("utf-8", errors="ignore"),
+            "size": len(encoded),
+            "truncated": True
+        }
+
+    def _is_usable(self, diff_result: Optional[Dict[str, Any]], max_bytes: Optional[int]) -> bool:
+        if diff_result is None:
+            return False
+        if not diff_result["truncated"]:
+            return True
+        return max_bytes is not None and len(diff_result["diff"].encode("utf-8")) >= max_bytes
+
+    def _from_cache(self, diff_result: Dict[str, Any], max_bytes: Optional[int]) -> Dict[str, Any]:
+        limited = self._limit_diff(diff_result["diff"], max_bytes)
+        return {
+            "diff": limited["diff"],
+            "size": max(diff_result["size"], limited["size"]),
+            "truncated": diff_result["truncated"] or limited["truncated"]
+        }
     
     async def get_commit_details(
         self, 
@@ -35,31 +82,64 @@ class GitHubClient:
     ) -> Dict[str, Any]:
         owner, repo = self._parse_repo_url(repo_url)
         url = f"{self.base_url}/repos/{owner}/{repo}/commits/{commit_sha}"
-        headers = await self._get_headers()
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        result = await self._get(url, "application/vnd.github.v3+json")
+        return json.loads(result["body"])
+
+    async def fetch_commit_diff(
+        self,
+        repo_url: str,
+        commit_sha: str,
+        max_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        cached_diff = await self.diff_cache.get(repo_url, commit_sha)
+        if self._is_usable(cached_diff, max_bytes):
+            return self._from_cache(cached_diff, max_bytes)
+        owner, repo = self._parse_repo_url(repo_url)
+        url = f"{self.base_url}/repos/{owner}/{repo}/commits/{commit_sha}"
+        result = await self._get(url, "application/vnd.github.v3.diff", max_bytes, use_etag=False)
+        diff_result = {"diff": result["body"], "size": result["size"], "truncated": result["truncated"]}
+        await self.diff_cache.put(repo_url, commit_sha, diff_result)
+        return diff_result
     
     async def get_commit_diff(
         self, 
         repo_url: str, 
         commit_sha: str
     ) -> str:
+        diff_result = await self.fetch_commit_diff(repo_url, commit_sha)
+        return diff_result["diff"]
+    
+    async def get_push_diffs(
+        self,
+        repo_url: str,
+        before: Optional[str],
+        after: Optional[str],
+        commit_shas: list[str],
+        max_bytes: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        diffs = {}
+        for commit_sha in commit_shas:
+            cached_diff = await self.diff_cache.get(repo_url, commit_sha)
+            if self._is_usable(cached_diff, max_bytes):
+                diffs[commit_sha] = self._from_cache(cached_diff, max_bytes)
+
+        missing_shas = [commit_sha for commit_sha in commit_shas if commit_sha not in diffs]
+        if not missing_shas or not before or not after or before == NULL_COMMIT_SHA:
+            return diffs
+
         owner, repo = self._parse_repo_url(repo_url)
-        url = f"{self.base_url}/repos/{owner}/{repo}/commits/{commit_sha}"
-        
-        base_headers = await self._get_headers()
-        headers = {
-            **base_headers,
-            "Accept": "application/vnd.github.v3.diff"
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            return response.text
+        url = f"{self.base_url}/repos/{owner}/{repo}/compare/{before}...{after}"
+        patch_budget = max_bytes * len(missing_shas) * 2 if max_bytes else None
+        result = await self._get(url, "application/vnd.github.v3.patch", patch_budget, use_etag=False)
+        patch_diffs = split_patch_series(result["body"])
+        if result["truncated"] and patch_diffs:
+            patch_diffs.pop(list(patch_diffs)[-1])
+
+        for commit_sha in missing_shas:
+            if commit_sha in patch_diffs:
+                diffs[commit_sha] = self._limit_diff(patch_diffs[commit_sha], max_bytes)
+                await self.diff_cache.put(repo_url, commit_sha, diffs[commit_sha])
+        return diffs
     
     async def get_commit_files(
         self, 
@@ -68,4 +148,3 @@ class GitHubClient:
     ) -> list[Dict[str, Any]]:
         commit_data = await self.get_commit_details(repo_url, commit_sha)
         return commit_data.get("files", [])
-
@@ -0,0 +1,34 @@
+from collections import OrderedDict
+from typing import Optional, Tuple, Any
+from src.config import Config
+
+class GitHubETagCache:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(GitHubETagCache, cls).__new__(cls)
+            cls._instance.entries = OrderedDict()
+            cls._instance.total_bytes = 0
+        return cls._instance
+
+    def get(self, key: str) -> Optional[Tuple[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry[0], entry[1]
+        return None
+
+    def _discard(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def put(self, key: str, etag: str, value: Any, size: int):
+        self._discard(key)
+        if size > Config.GITHUB_ETAG_CACHE_MAX_BYTES:
+            return
+        self.entries[key] = (etag, value, size)
+        self.total_bytes += size
+        while len(self.entries) > Config.GITHUB_ETAG_CACHE_SIZE or self.total_bytes > Config.GITHUB_ETAG_CACHE_MAX_BYTES:
+            self._discard(next(iter(self.entries)))
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from typing import Dict, Any, Mapping
+from src.config import Config
+
+class GitHubRateLimiter:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(GitHubRateLimiter, cls).__new__(cls)
+            cls._instance.quotas = {}
+        return cls._instance
+
+    def _quota(self, token_key: str) -> Dict[str, Any]:
+        if token_key not in self.quotas:
+            self.quotas[token_key] = {
+                "remaining": None,
+                "reset_at": 0.0,
+                "blocked_until": 0.0,
+                "next_allowed_at": 0.0,
+                "lock": asyncio.Lock()
+            }
+        return self.quotas[token_key]
+
+    def _blocked_delay(self, quota: Dict[str, Any]) -> float:
+        now = time.time()
+        if quota["blocked_until"] > now:
+            return quota["blocked_until"] - now
+        if quota["remaining"] is not None and quota["remaining"] <= 0 and quota["reset_at"] > now:
+            return quota["reset_at"] - now
+        return 0.0
+
+    def _pacing_delay(self, quota: Dict[str, Any]) -> float:
+        now = time.time()
+        remaining = quota["remaining"]
+        if remaining is None or remaining >= Config.GITHUB_RATE_LIMIT_RESERVE or quota["reset_at"] <= now:
+            return 0.0
+        return (quota["reset_at"] - now) / max(remaining, 1)
+
+    async def acquire(self, token_key: str):
+        quota = self._quota(token_key)
+        delay = self._blocked_delay(quota)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._blocked_delay(quota)
+        async with quota["lock"]:
+            slot = max(time.time(), quota["next_allowed_at"])
+            quota["next_allowed_at"] = slot + self._pacing_delay(quota)
+            if quota["remaining"] is not None:
+                quota["remaining"] -= 1
+        delay = slot - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, token_key: str, headers: Mapping[str, str]):
+        quota = self._quota(token_key)
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_at = headers.get("X-RateLimit-Reset")
+        if remaining is not None and remaining.isdigit():
+            quota["remaining"] = int(remaining)
+        if reset_at is not None and reset_at.isdigit():
+            quota["reset_at"] = float(reset_at)
+
+    def block(self, token_key: str, seconds: float):
+        quota = self._quota(token_key)
+        quota["blocked_until"] = max(quota["blocked_until"], time.time() + seconds)
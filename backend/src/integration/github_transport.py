@@ -0,0 +1,94 @@
+import hashlib
+import random
+import time
+from typing import Optional, Dict, Any
+import httpx
+from src.config import Config
+from src.integration.http_clients import HttpClientRegistry
+from src.integration.github_rate_limiter import GitHubRateLimiter
+from src.integration.github_etag_cache import GitHubETagCache
+
+class GitHubTransport:
+    def __init__(self, http_clients: Optional[HttpClientRegistry] = None):
+        self.http_clients = http_clients or HttpClientRegistry()
+        self.rate_limiter = GitHubRateLimiter()
+        self.etag_cache = GitHubETagCache()
+
+    def _token_key(self, token: Optional[str]) -> str:
+        if not token:
+            return "anonymous"
+        return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+    def _rate_limit_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset_at = response.headers.get("X-RateLimit-Reset")
+            if reset_at and reset_at.isdigit():
+                return max(float(reset_at) - time.time(), 1.0)
+        if response.status_code == 429 or "rate limit" in response.text.lower():
+            return Config.GITHUB_RETRY_BASE_DELAY * (2 ** attempt) * random.uniform(1.0, 2.0)
+        return None
+
+    async def _read_body(self, response: httpx.Response, max_bytes: Optional[int]) -> Dict[str, Any]:
+        chunks = []
+        bytes_read = 0
+        truncated = False
+        async for chunk in response.aiter_bytes():
+            if max_bytes is not None and bytes_read + len(chunk) > max_bytes:
+                chunks.append(chunk[:max_bytes - bytes_read])
+                bytes_read += len(chunk)
+                truncated = True
+                break
+            chunks.append(chunk)
+            bytes_read += len(chunk)
+
+        size = bytes_read
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and not response.headers.get("Content-Encoding"):
+            size = max(size, int(content_length))
+
+        return {
+            "body": b"".join(chunks).decode(response.encoding or "utf-8", errors="ignore"),
+            "size": size,
+            "truncated": truncated
+        }
+
+    async def get(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        token: Optional[str],
+        max_bytes: Optional[int] = None,
+        use_etag: bool = True
+    ) -> Dict[str, Any]:
+        token_key = self._token_key(token)
+        cache_key = f"{token_key}:{headers.get('Accept')}:{max_bytes}:{url}"
+        request_headers = dict(headers)
+        cached = self.etag_cache.get(cache_key) if use_etag else None
+        if cached:
+            request_headers["If-None-Match"] = cached[0]
+
+        for attempt in range(Config.GITHUB_MAX_RETRIES + 1):
+            await self.rate_limiter.acquire(token_key)
+            async with self.http_clients.get("github").stream("GET", url, headers=request_headers) as response:
+                self.rate_limiter.update(token_key, response.headers)
+
+                if response.status_code == 304 and cached:
+                    return cached[1]
+
+                if response.is_success:
+                    result = await self._read_body(response, max_bytes)
+                    etag = response.headers.get("ETag")
+                    if etag and use_etag:
+                        self.etag_cache.put(cache_key, etag, result, len(result["body"]))
+                    return result
+
+                await response.aread()
+                delay = self._rate_limit_delay(response, attempt)
+                if delay is None or attempt == Config.GITHUB_MAX_RETRIES:
+                    response.raise_for_status()
+                self.rate_limiter.block(token_key, delay)
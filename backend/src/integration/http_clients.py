@@ -0,0 +1,45 @@
+import httpx
+from src.config import Config
+
+CLIENT_TIMEOUTS = {
+    "github": httpx.Timeout(30.0, connect=5.0, pool=10.0),
+    "notifications": httpx.Timeout(15.0, connect=5.0, pool=10.0),
+    "whatsapp_bridge": httpx.Timeout(10.0, connect=2.0, pool=5.0)
+}
+
+class HttpClientRegistry:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(HttpClientRegistry, cls).__new__(cls)
+            cls._instance.clients = {}
+        return cls._instance
+
+    def _create_client(self, name: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=CLIENT_TIMEOUTS[name],
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY
+            ),
+            http2=Config.HTTP2_ENABLED
+        )
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self.clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create_client(name)
+            self.clients[name] = client
+        return client
+
+    def startup(self):
+        for name in CLIENT_TIMEOUTS:
+            self.get(name)
+
+    async def shutdown(self):
+        clients = list(self.clients.values())
+        self.clients = {}
+        for client in clients:
+            await client.aclose()
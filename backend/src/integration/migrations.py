@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional, Dict, Any
+from src.integration.database import Database
+
+class MigrationDAO:
+    def __init__(self):
+        self.collection = Database().get_collection("migrations")
+
+    async def get_progress(self, name: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one({"name": name})
+
+    async def save_progress(self, name: str, last_id, counters: Dict[str, int], status: str = "running"):
+        now = datetime.utcnow()
+        return await self.collection.update_one(
+            {"name": name},
+            {"$set": {
+                "last_id": last_id,
+                "status": status,
+                "updated_at": now
+            }, "$inc": counters, "$setOnInsert": {"started_at": now}},
+            upsert=True
+        )
+
+    async def complete(self, name: str):
+        return await self.collection.update_one(
+            {"name": name},
+            {"$set": {"status": "completed", "completed_at": datetime.utcnow()}}
+        )
+
+    async def reset(self, name: str):
+        return await self.collection.delete_one({"name": name})
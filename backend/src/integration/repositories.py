@@ -17,8 +17,11 @@ class RepositoryDAO:
             upsert=True
         )
 
-    async def get_all_repositories(self):
-        return await self.collection.find().to_list(length=100)
+    async def get_by_url(self, url: str):
+        return await self.collection.find_one({"url": url})
+
+    async def get_all_repositories(self, length: int = 100):
+        return await self.collection.find().to_list(length=length)
 
     async def delete_repository(self, repo_id: str):
         from bson import ObjectId
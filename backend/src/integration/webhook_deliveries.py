@@ -0,0 +1,21 @@
+from datetime import datetime
+from pymongo.errors import DuplicateKeyError
+from src.integration.database import Database
+
+class WebhookDeliveryDAO:
+    def __init__(self):
+        self.collection = Database().get_collection("webhook_deliveries")
+
+    async def record_delivery(self, delivery_id: str, repo_url: str) -> bool:
+        try:
+            await self.collection.insert_one({
+                "delivery_id": delivery_id,
+                "repository": repo_url,
+                "created_at": datetime.utcnow()
+            })
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def delete_delivery(self, delivery_id: str):
+        return await self.collection.delete_one({"delivery_id": delivery_id})
@@ -0,0 +1,95 @@
+import argparse
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+
+MIGRATION_NAME = "move_embedded_diffs"
+
+logger = logging.getLogger(__name__)
+
+def plan_diff_document(doc: Dict[str, Any], commit_diff_dao) -> Optional[Dict[str, Any]]:
+    diff = doc.get("diff")
+    if not isinstance(diff, str):
+        return None
+    size = doc.get("diff_size")
+    if not isinstance(size, int):
+        size = len(diff.encode("utf-8"))
+    return commit_diff_dao.build_document(doc["hash"], diff, size, bool(doc.get("diff_truncated", False)))
+
+async def migrate(batch_size: int, dry_run: bool, restart: bool) -> Dict[str, int]:
+    from src.integration.database import Database
+    from src.integration.commit_diffs import CommitDiffDAO
+    from src.integration.migrations import MigrationDAO
+
+    commits = Database().get_collection("commits")
+    commit_diff_dao = CommitDiffDAO()
+    migration_dao = MigrationDAO()
+    if restart and not dry_run:
+        await migration_dao.reset(MIGRATION_NAME)
+
+    progress = await migration_dao.get_progress(MIGRATION_NAME) or {}
+    if progress.get("status") == "completed":
+        logger.info(f"Migration {MIGRATION_NAME} already completed")
+        return {"moved": 0, "dropped": 0}
+
+    last_id = progress.get("last_id")
+    totals = {"moved": 0, "dropped": 0}
+    while True:
+        query: Dict[str, Any] = {"diff": {"$exists": True}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        batch: List[Dict[str, Any]] = await commits.find(
+            query,
+            {"hash": 1, "diff": 1, "diff_size": 1, "diff_truncated": 1}
+        ).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not batch:
+            break
+
+        diff_operations = []
+        commit_operations = []
+        counters = {"moved": 0, "dropped": 0}
+        for doc in batch:
+            diff_document = plan_diff_document(doc, commit_diff_dao)
+            if diff_document is not None:
+                diff_operations.append(UpdateOne(
+                    {"hash": doc["hash"]},
+                    {"$setOnInsert": diff_document},
+                    upsert=True
+                ))
+            counters["moved" if diff_document is not None else "dropped"] += 1
+            commit_operations.append(UpdateOne({"_id": doc["_id"]}, {"$unset": {"diff": ""}}))
+
+        last_id = batch[-1]["_id"]
+        if not dry_run:
+            if diff_operations:
+                await commit_diff_dao.collection.bulk_write(diff_operations, ordered=False)
+            await commits.bulk_write(commit_operations, ordered=False)
+            await migration_dao.save_progress(MIGRATION_NAME, last_id, counters)
+        for key, value in counters.items():
+            totals[key] += value
+        logger.info(f"Processed batch ending at {last_id}: {counters['moved']} moved, {counters['dropped']} dropped")
+
+    if not dry_run:
+        await migration_dao.complete(MIGRATION_NAME)
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser(description="Move embedded commit diffs into commit_diffs in resumable batches")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved progress and scan from the beginning")
+    args = parser.parse_args()
+
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    totals = asyncio.run(migrate(args.batch_size, args.dry_run, args.restart))
+    logger.info(f"Migration {MIGRATION_NAME} finished: {totals['moved']} moved, {totals['dropped']} dropped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import logging
+from typing import Dict, Any, List, Tuple
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+from src.utils.timestamps import parse_timestamp, fallback_timestamp
+
+MIGRATION_NAME = "normalize_commit_timestamps"
+
+logger = logging.getLogger(__name__)
+
+def plan_update(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    parsed = parse_timestamp(doc["timestamp"])
+    if parsed is not None:
+        return {"$set": {"timestamp": parsed}}, True
+    return {"$set": {"timestamp": fallback_timestamp(doc.get("created_at")), "timestamp_raw": doc["timestamp"]}}, False
+
+async def migrate(batch_size: int, dry_run: bool, restart: bool) -> Dict[str, int]:
+    from src.integration.database import Database
+    from src.integration.migrations import MigrationDAO
+
+    commits = Database().get_collection("commits")
+    migration_dao = MigrationDAO()
+    if restart and not dry_run:
+        await migration_dao.reset(MIGRATION_NAME)
+
+    progress = await migration_dao.get_progress(MIGRATION_NAME) or {}
+    if progress.get("status") == "completed":
+        logger.info(f"Migration {MIGRATION_NAME} already completed")
+        return {"converted": 0, "unparseable": 0}
+
+    last_id = progress.get("last_id")
+    totals = {"converted": 0, "unparseable": 0}
+    while True:
+        query: Dict[str, Any] = {"timestamp": {"$type": "string"}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        batch: List[Dict[str, Any]] = await commits.find(
+            query,
+            {"timestamp": 1, "created_at": 1}
+        ).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not batch:
+            break
+
+        operations = []
+        counters = {"converted": 0, "unparseable": 0}
+        for doc in batch:
+            update, converted = plan_update(doc)
+            counters["converted" if converted else "unparseable"] += 1
+            operations.append(UpdateOne({"_id": doc["_id"], "timestamp": doc["timestamp"]}, update))
+
+        last_id = batch[-1]["_id"]
+        if not dry_run:
+            await commits.bulk_write(operations, ordered=False)
+            await migration_dao.save_progress(MIGRATION_NAME, last_id, counters)
+        for key, value in counters.items():
+            totals[key] += value
+        logger.info(f"Processed batch ending at {last_id}: {counters['converted']} converted, {counters['unparseable']} unparseable")
+
+    if not dry_run:
+        await migration_dao.complete(MIGRATION_NAME)
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert string commit timestamps to UTC datetimes in resumable batches")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved progress and scan from the beginning")
+    args = parser.parse_args()
+
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    totals = asyncio.run(migrate(args.batch_size, args.dry_run, args.restart))
+    logger.info(f"Migration {MIGRATION_NAME} finished: {totals['converted']} converted, {totals['unparseable']} unparseable")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+from src.services.provider_errors import is_overload_error
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        initial: float,
+        minimum: float,
+        maximum: float,
+        latency_tolerance: float,
+        backoff: float = 0.5
+    ):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+        self.last_decrease = 0.0
+        self.condition = asyncio.Condition()
+
+    def _decrease(self, now: float):
+        cooldown = self.baseline_latency or 1.0
+        if now - self.last_decrease < cooldown:
+            return
+        self.limit = max(self.minimum, self.limit * self.backoff)
+        self.last_decrease = now
+
+    def _increase(self):
+        self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def _record(self, latency: float, overloaded: bool, succeeded: bool):
+        now = time.monotonic()
+        if overloaded:
+            self._decrease(now)
+            return
+        if not succeeded:
+            return
+        if self.baseline_latency is None:
+            self.baseline_latency = latency
+        elif latency > self.baseline_latency * self.latency_tolerance:
+            self._decrease(now)
+            return
+        else:
+            self.baseline_latency = 0.9 * self.baseline_latency + 0.1 * latency
+        self._increase()
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+        started = time.monotonic()
+        overloaded = False
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        except Exception as e:
+            overloaded = is_overload_error(e)
+            raise
+        finally:
+            async with self.condition:
+                self.in_flight -= 1
+                self._record(time.monotonic() - started, overloaded, succeeded)
+                self.condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "baseline_latency": self.baseline_latency
+        }
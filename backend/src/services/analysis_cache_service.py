@@ -0,0 +1,32 @@
+import hashlib
+from typing import Dict, Any, Optional
+from src.config import Config
+from src.integration.analysis_cache import AnalysisCacheDAO
+from src.utils.diff_fingerprint import diff_fingerprint
+
+class AnalysisCacheService:
+    def __init__(self, prompt_version: str):
+        self.cache_dao = AnalysisCacheDAO()
+        self.prompt_version = prompt_version
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    def build_key(self, diff: str, model: str) -> str:
+        return hashlib.sha256(
+            f"{diff_fingerprint(diff)}:{model}:{self.prompt_version}".encode("utf-8")
+        ).hexdigest()
+
+    async def lookup(self, diff: str, model: str) -> Optional[Dict[str, Any]]:
+        if not Config.ANALYSIS_CACHE_ENABLED:
+            return None
+        entry = await self.cache_dao.get(self.build_key(diff, model))
+        self.stats["hits" if entry else "misses"] += 1
+        return entry["analysis"] if entry else None
+
+    async def store(self, diff: str, model: str, analysis: Dict[str, Any], analysis_model: str):
+        if not Config.ANALYSIS_CACHE_ENABLED:
+            return
+        await self.cache_dao.put(self.build_key(diff, model), analysis, analysis_model, self.prompt_version)
+        self.stats["stores"] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
@@ -0,0 +1,25 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict
+from src.config import Config
+
+class AnalysisConcurrencyLimiter:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AnalysisConcurrencyLimiter, cls).__new__(cls)
+            cls._instance.global_limit = asyncio.Semaphore(Config.ANALYSIS_CONCURRENCY)
+            cls._instance.repository_limits = {}
+        return cls._instance
+
+    def _repository_limit(self, repo_url: str) -> asyncio.Semaphore:
+        if repo_url not in self.repository_limits:
+            self.repository_limits[repo_url] = asyncio.Semaphore(Config.ANALYSIS_REPOSITORY_CONCURRENCY)
+        return self.repository_limits[repo_url]
+
+    @asynccontextmanager
+    async def slot(self, repo_url: str):
+        async with self._repository_limit(repo_url):
+            async with self.global_limit:
+                yield
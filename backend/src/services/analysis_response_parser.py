@@ -0,0 +1,19 @@
+import json
+from typing import Dict, Any, Optional
+
+def parse_analysis_response(ai_response: str) -> Optional[Dict[str, Any]]:
+    try:
+        if "```json" in ai_response:
+            json_start = ai_response.find("```json") + 7
+            json_end = ai_response.find("```", json_start)
+            json_str = ai_response[json_start:json_end].strip()
+            return json.loads(json_str)
+        elif "```" in ai_response:
+            json_start = ai_response.find("```") + 3
+            json_end = ai_response.find("```", json_start)
+            json_str = ai_response[json_start:json_end].strip()
+            return json.loads(json_str)
+        else:
+            return json.loads(ai_response)
+    except (json.JSONDecodeError, ValueError):
+        return None
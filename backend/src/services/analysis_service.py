@@ -1,135 +1,394 @@
-import os
-import json
+import asyncio
+import logging
 from typing import Dict, Any, Optional
 from src.integration.github_client import GitHubClient
-from src.agents.commit_analysis_agent import get_commit_analysis_agent
-from src.integration.commits import CommitDAO
-from src.agents.tools.analysis_tools import (
-    extract_file_changes,
-    categorize_change_type,
-    calculate_impact_score,
-    identify_technologies
+from src.agents.commit_analysis_agent import (
+    get_commit_analysis_agent,
+    get_analysis_model,
+    COMMIT_ANALYSIS_PROMPT_VERSION
 )
+from src.agents.structured_output.commit_analysis_result import CommitAnalysisResult, CommitBatchAnalysisResult
+from src.agents.structured_output.output_repair import AnalysisOutputRepairer
+from src.integration.commits import CommitDAO
+from src.integration.commit_diffs import CommitDiffDAO
+from src.services.analysis_concurrency import AnalysisConcurrencyLimiter
+from src.services.analysis_cache_service import AnalysisCacheService
+from src.services.streaming_analysis import StreamingAnalysisRunner
+from src.services.micro_batch_analysis import MicroBatchAnalyzer
+from src.services.trivial_commit_rules import TrivialCommitClassifier
+from src.services.model_router import ModelRouter
+from src.config import Config
+from src.agents.tools.parsed_diff import parse_diff
+from src.agents.context.diff_reducer import DiffReducer
+from src.agents.context.token_budget import token_budget_for
+from src.agents.context.analysis_prompt import build_analysis_prompt
+from src.agents.context.commit_facts import build_commit_facts
+from src.agents.tools.technology_detection import detect_technologies
+from src.agents.tools.symbol_extraction import extract_modified_symbols
+from src.agents.tools.analysis_tools import classify_change_type, score_impact
+
+logger = logging.getLogger(__name__)
 
 class AnalysisService:
     def __init__(self):
         self.github_client = GitHubClient()
         self.commit_dao = CommitDAO()
-        self.agent = get_commit_analysis_agent()
-        self.max_diff_size = int(os.getenv("MAX_DIFF_SIZE", "50000"))
+        self.commit_diff_dao = CommitDiffDAO()
+        self.agents = {}
+        self.diff_reducers = {}
+        self.model_router = ModelRouter()
+        self.concurrency_limiter = AnalysisConcurrencyLimiter()
+        self.analysis_cache = AnalysisCacheService(COMMIT_ANALYSIS_PROMPT_VERSION)
+        self.streaming_runner = StreamingAnalysisRunner()
+        self.output_repairer = AnalysisOutputRepairer(
+            self.model_router,
+            lambda model_name: get_analysis_model(temperature=0, model_name=model_name)
+        )
+        self.micro_batcher = MicroBatchAnalyzer()
+        self.trivial_classifier = TrivialCommitClassifier()
+        self.max_diff_size = Config.MAX_DIFF_SIZE
+
+    def _agent_for(self, model: str, response_format=CommitAnalysisResult):
+        key = (model, response_format.__name__)
+        if key not in self.agents:
+            self.agents[key] = get_commit_analysis_agent(response_format, model)
+        return self.agents[key]
+
+    def _diff_reducer_for(self, token_budget: int) -> DiffReducer:
+        if token_budget not in self.diff_reducers:
+            self.diff_reducers[token_budget] = DiffReducer(token_budget, Config.ANALYSIS_FILE_TOKEN_CAP)
+        return self.diff_reducers[token_budget]
     
-    async def analyze_commit(
-        self, 
-        commit_data: Dict[str, Any], 
-        repo_url: str
+    async def _prepare_commit(
+        self,
+        commit_data: Dict[str, Any],
+        repo_url: str,
+        diff_result: Optional[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        try:
-            commit_sha = commit_data.get("sha")
-            
-            diff = await self.github_client.get_commit_diff(repo_url, commit_sha)
-            
-            if len(diff) > self.max_diff_size:
-                diff = diff[:self.max_diff_size] + "\n... (diff truncated)"
-            
-            file_changes = extract_file_changes(diff)
-            change_type = categorize_change_type(commit_data.get("message", ""), diff)
-            impact_score = calculate_impact_score(diff)
-            technologies = identify_technologies(diff)
-            
-            analysis_prompt = f"""Analyze this commit:
-
-Commit Message: {commit_data.get('message')}
-Author: {commit_data.get('author')}
-Timestamp: {commit_data.get('timestamp')}
-Files Changed: {len(file_changes)}
-
-Diff:
-{diff}
-
-Provide a structured analysis in JSON format with the following fields:
-- summary: Brief one-line summary (max 100 chars)
-- details: Detailed explanation of changes
-- key_changes: List of 3-5 most important modifications
-- potential_issues: List of any concerns or risks (empty list if none)
-"""
-            
-            config = {"configurable": {"thread_id": commit_sha}}
-            response = await self.agent.ainvoke(
-                {"messages": [{"role": "user", "content": analysis_prompt}]},
-                config
+        if diff_result is None:
+            diff_result = await self.github_client.fetch_commit_diff(
+                repo_url,
+                commit_data.get("sha"),
+                self.max_diff_size
             )
-            
-            ai_response = response["messages"][-1].content
-            
-            try:
-                if "```json" in ai_response:
-                    json_start = ai_response.find("```json") + 7
-                    json_end = ai_response.find("```", json_start)
-                    json_str = ai_response[json_start:json_end].strip()
-                    analysis_data = json.loads(json_str)
-                elif "```" in ai_response:
-                    json_start = ai_response.find("```") + 3
-                    json_end = ai_response.find("```", json_start)
-                    json_str = ai_response[json_start:json_end].strip()
-                    analysis_data = json.loads(json_str)
-                else:
-                    analysis_data = json.loads(ai_response)
-            except (json.JSONDecodeError, ValueError) as e:
-                analysis_data = {
-                    "summary": commit_data.get("message", "")[:100],
-                    "details": ai_response,
-                    "key_changes": [],
-                    "potential_issues": []
-                }
-            
-            analysis_result = {
-                "hash": commit_sha,
-                "message": commit_data.get("message"),
-                "author": commit_data.get("author"),
-                "timestamp": commit_data.get("timestamp"),
-                "url": commit_data.get("url"),
-                "repository": repo_url,
-                "diff": diff,
-                "files_changed": [f["filename"] for f in file_changes],
-                "lines_added": sum(f["lines_added"] for f in file_changes),
-                "lines_removed": sum(f["lines_removed"] for f in file_changes),
-                "change_type": change_type,
-                "summary": analysis_data.get("summary", ""),
-                "details": analysis_data.get("details", ""),
-                "impact_score": impact_score,
-                "key_changes": analysis_data.get("key_changes", []),
-                "potential_issues": analysis_data.get("potential_issues", []),
-                "technologies": technologies,
-                "analysis_status": "completed"
+        
+        diff = diff_result["diff"]
+        if diff_result["truncated"]:
+            diff = diff + "\n... (diff truncated)"
+        
+        parsed_diff = parse_diff(diff)
+        file_changes = parsed_diff.file_changes()
+        impact_score = score_impact(parsed_diff)
+        change_type = classify_change_type(commit_data.get("message", ""))
+        technologies = detect_technologies(parsed_diff)
+        models = self.model_router.analysis_models(
+            self.model_router.select_tier(diff_result["size"], impact_score)
+        )
+        reduction_budget = token_budget_for(models[0])
+        reduction = self._diff_reducer_for(reduction_budget).reduce(parsed_diff)
+        heuristic_analysis = None
+        if Config.HEURISTIC_ENABLED:
+            heuristic_analysis = self.trivial_classifier.analyze(
+                parsed_diff,
+                commit_data.get("message", ""),
+                diff_result["truncated"]
+            )
+        
+        facts = None
+        if Config.ANALYSIS_CONTEXT_MODE != "tools":
+            facts = build_commit_facts(
+                parsed_diff,
+                change_type,
+                impact_score,
+                technologies,
+                extract_modified_symbols(parsed_diff)
+            )
+        
+        return {
+            "commit_data": commit_data,
+            "diff_result": diff_result,
+            "diff": diff,
+            "parsed_diff": parsed_diff,
+            "file_changes": file_changes,
+            "change_type": change_type,
+            "impact_score": impact_score,
+            "technologies": technologies["technologies"],
+            "reduction": reduction,
+            "reduction_budget": reduction_budget,
+            "facts": facts,
+            "prompt": build_analysis_prompt(commit_data, len(file_changes), reduction["diff"], facts),
+            "models": models,
+            "analysis_model": None,
+            "heuristic_analysis": heuristic_analysis,
+            "analysis_mode": "heuristic" if heuristic_analysis else "llm"
+        }
+
+    def _prompt_for_model(self, context: Dict[str, Any], model: str) -> str:
+        token_budget = token_budget_for(model)
+        if token_budget >= context["reduction_budget"]:
+            return context["prompt"]
+        
+        reduction = self._diff_reducer_for(token_budget).reduce(context["parsed_diff"])
+        context["reduction"] = reduction
+        context["reduction_budget"] = token_budget
+        context["prompt"] = build_analysis_prompt(
+            context["commit_data"],
+            len(context["file_changes"]),
+            reduction["diff"],
+            context["facts"]
+        )
+        return context["prompt"]
+
+    async def _generate_analysis(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        commit_data = context["commit_data"]
+        cached_analysis = await self.analysis_cache.lookup(context["diff"], context["models"][0])
+        if cached_analysis is not None:
+            context["analysis_mode"] = "cached"
+            context["analysis_model"] = context["models"][0]
+            return cached_analysis
+        
+        async def publish_field(name: str, value: Any):
+            if name == "summary":
+                await self.commit_dao.save_partial_analysis(commit_data.get("sha"), {"summary": value})
+        
+        async def run_model(model: str):
+            context["analysis_model"] = model
+            return await self.streaming_runner.run(
+                self._agent_for(model),
+                self._prompt_for_model(context, model),
+                commit_data.get("sha"),
+                publish_field
+            )
+        
+        analysis_data, ai_response = await self.model_router.run(context["models"], run_model)
+        if analysis_data is None:
+            analysis_data = await self.output_repairer.repair(ai_response, context["models"])
+        if analysis_data is None:
+            return {
+                "summary": commit_data.get("message", "")[:100],
+                "details": ai_response,
+                "key_changes": [],
+                "potential_issues": []
             }
+        
+        await self.analysis_cache.store(context["diff"], context["models"][0], analysis_data, context["analysis_model"])
+        return analysis_data
+
+    def _build_result(
+        self,
+        context: Dict[str, Any],
+        repo_url: str,
+        analysis_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        commit_data = context["commit_data"]
+        file_changes = context["file_changes"]
+        return {
+            "hash": commit_data.get("sha"),
+            "message": commit_data.get("message"),
+            "author": commit_data.get("author"),
+            "timestamp": commit_data.get("timestamp"),
+            "url": commit_data.get("url"),
+            "repository": repo_url,
+            "diff_size": context["diff_result"]["size"],
+            "diff_truncated": context["diff_result"]["truncated"],
+            "prompt_diff_tokens": context["reduction"]["tokens"],
+            "omitted_files": context["reduction"]["omitted_files"],
+            "partial_files": context["reduction"]["partial_files"],
+            "files_changed": [f["filename"] for f in file_changes],
+            "lines_added": sum(f["lines_added"] for f in file_changes),
+            "lines_removed": sum(f["lines_removed"] for f in file_changes),
+            "change_type": context["change_type"],
+            "summary": analysis_data.get("summary", ""),
+            "details": analysis_data.get("details", ""),
+            "impact_score": context["impact_score"],
+            "key_changes": analysis_data.get("key_changes", []),
+            "potential_issues": analysis_data.get("potential_issues", []),
+            "technologies": context["technologies"],
+            "analysis_mode": context["analysis_mode"],
+            "analysis_model": context["analysis_model"],
+            "analysis_status": "completed"
+        }
+    
+    async def _save_failure(
+        self,
+        commit_data: Dict[str, Any],
+        repo_url: str,
+        error: Exception
+    ) -> Dict[str, Any]:
+        error_result = {
+            "hash": commit_data.get("sha"),
+            "message": commit_data.get("message"),
+            "author": commit_data.get("author"),
+            "timestamp": commit_data.get("timestamp"),
+            "url": commit_data.get("url"),
+            "repository": repo_url,
+            "analysis_status": "failed",
+            "error": str(error)
+        }
+        
+        await self.commit_dao.save_summary(error_result)
+        
+        return error_result
+
+    async def _complete_commit(
+        self,
+        context: Dict[str, Any],
+        repo_url: str,
+        analysis_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        try:
+            if analysis_data is None:
+                analysis_data = context["heuristic_analysis"]
+            if analysis_data is None:
+                async with self.concurrency_limiter.slot(repo_url):
+                    analysis_data = await self._generate_analysis(context)
+            analysis_result = self._build_result(context, repo_url, analysis_data)
             
+            await self.commit_diff_dao.save_diff(
+                analysis_result["hash"],
+                context["diff"],
+                context["diff_result"]["size"],
+                context["diff_result"]["truncated"]
+            )
             await self.commit_dao.save_summary(analysis_result)
             
             return analysis_result
-            
         except Exception as e:
-            error_result = {
-                "hash": commit_data.get("sha"),
-                "message": commit_data.get("message"),
-                "author": commit_data.get("author"),
-                "timestamp": commit_data.get("timestamp"),
-                "url": commit_data.get("url"),
-                "repository": repo_url,
-                "analysis_status": "failed",
-                "error": str(e)
-            }
-            
-            await self.commit_dao.save_summary(error_result)
-            
-            return error_result
+            return await self._save_failure(context["commit_data"], repo_url, e)
     
+    async def analyze_commit(
+        self, 
+        commit_data: Dict[str, Any], 
+        repo_url: str,
+        diff_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        try:
+            context = await self._prepare_commit(commit_data, repo_url, diff_result)
+        except Exception as e:
+            return await self._save_failure(commit_data, repo_url, e)
+        
+        return await self._complete_commit(context, repo_url)
+    
+    async def _as_list(self, coroutine) -> list[Dict[str, Any]]:
+        return [await coroutine]
+
+    async def _prepare_with_limit(
+        self,
+        commit_data: Dict[str, Any],
+        repo_url: str,
+        diff_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        async with self.concurrency_limiter.slot(repo_url):
+            return await self._prepare_commit(commit_data, repo_url, diff_result)
+
+    async def _analyze_micro_batch(
+        self,
+        contexts: list[Dict[str, Any]],
+        repo_url: str
+    ) -> list[Dict[str, Any]]:
+        pending = []
+        cached = {}
+        for context in contexts:
+            cached_analysis = await self.analysis_cache.lookup(context["diff"], context["models"][0])
+            if cached_analysis is not None:
+                context["analysis_mode"] = "cached"
+                context["analysis_model"] = context["models"][0]
+                cached[context["commit_data"].get("sha")] = cached_analysis
+            else:
+                pending.append(context)
+
+        batch_analyses = {}
+        batch_model = None
+        if len(pending) > 1:
+            async def run_model(model: str):
+                nonlocal batch_model
+                batch_model = model
+                for context in pending:
+                    self._prompt_for_model(context, model)
+                return await self.micro_batcher.analyze(self._agent_for(model, CommitBatchAnalysisResult), pending)
+            
+            try:
+                async with self.concurrency_limiter.slot(repo_url):
+                    batch_analyses = await self.model_router.run(pending[0]["models"], run_model)
+            except Exception as e:
+                logger.warning(f"Micro-batch analysis failed for {repo_url}, falling back to per-commit calls: {e}")
+
+        for context in pending:
+            analysis_data = batch_analyses.get(context["commit_data"].get("sha"))
+            if analysis_data is not None:
+                context["analysis_model"] = batch_model
+                await self.analysis_cache.store(context["diff"], context["models"][0], analysis_data, batch_model)
+
+        return await asyncio.gather(*(
+            self._complete_commit(
+                context,
+                repo_url,
+                cached.get(context["commit_data"].get("sha")) or batch_analyses.get(context["commit_data"].get("sha"))
+            )
+            for context in contexts
+        ))
+
+    async def _prefetch_push_diffs(
+        self,
+        commits: list[Dict[str, Any]],
+        repo_url: str,
+        push_range: Optional[Dict[str, str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        if not push_range or len(commits) < 2:
+            return {}
+        try:
+            return await self.github_client.get_push_diffs(
+                repo_url,
+                push_range.get("before"),
+                push_range.get("after"),
+                [commit.get("sha") for commit in commits],
+                self.max_diff_size
+            )
+        except Exception as e:
+            logger.warning(f"Bulk diff fetch failed for {repo_url}, falling back to per-commit fetch: {e}")
+            return {}
+
     async def batch_analyze_commits(
         self, 
         commits: list[Dict[str, Any]], 
-        repo_url: str
+        repo_url: str,
+        push_range: Optional[Dict[str, str]] = None
     ) -> list[Dict[str, Any]]:
-        results = []
-        for commit in commits:
-            result = await self.analyze_commit(commit, repo_url)
-            results.append(result)
-        return results
+        diffs = await self._prefetch_push_diffs(commits, repo_url, push_range)
+        contexts = await asyncio.gather(
+            *(self._prepare_with_limit(commit, repo_url, diffs.get(commit.get("sha"))) for commit in commits),
+            return_exceptions=True
+        )
+
+        groups = []
+        batchable = []
+        for index, (commit, context) in enumerate(zip(commits, contexts)):
+            if isinstance(context, Exception):
+                groups.append(([index], self._as_list(self._save_failure(commit, repo_url, context))))
+            elif self.micro_batcher.is_batchable(context):
+                batchable.append((index, context))
+            else:
+                groups.append(([index], self._as_list(self._complete_commit(context, repo_url))))
+
+        for batch in self.micro_batcher.partition(batchable):
+            groups.append((
+                [index for index, _ in batch],
+                self._analyze_micro_batch([context for _, context in batch], repo_url)
+            ))
+
+        results: list[Any] = [None] * len(commits)
+        outcomes = await asyncio.gather(*(coroutine for _, coroutine in groups), return_exceptions=True)
+        for (indexes, _), outcome in zip(groups, outcomes):
+            values = [outcome] * len(indexes) if isinstance(outcome, Exception) else outcome
+            for index, value in zip(indexes, values):
+                results[index] = value
+
+        return [
+            {
+                "hash": commit.get("sha"),
+                "repository": repo_url,
+                "analysis_status": "failed",
+                "error": str(result)
+            } if isinstance(result, Exception) else result
+            for commit, result in zip(commits, results)
+        ]
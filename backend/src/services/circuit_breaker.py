@@ -0,0 +1,48 @@
+import time
+from typing import Dict, Any, Optional
+
+CLOSED_PERMIT = "closed"
+TRIAL_PERMIT = "trial"
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def acquire(self) -> Optional[str]:
+        state = self.state
+        if state == "closed":
+            return CLOSED_PERMIT
+        if state == "half_open" and not self.trial_in_progress:
+            self.trial_in_progress = True
+            return TRIAL_PERMIT
+        return None
+
+    def record_success(self, permit: str):
+        self.failures = 0
+        self.opened_at = None
+        self.release(permit)
+
+    def release(self, permit: str):
+        if permit == TRIAL_PERMIT:
+            self.trial_in_progress = False
+
+    def record_failure(self, permit: str):
+        self.failures += 1
+        if permit == TRIAL_PERMIT or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self.release(permit)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures}
@@ -0,0 +1,64 @@
+from typing import Dict, Any, List, Optional
+from src.config import Config
+from src.agents.context.batch_analysis_prompt import build_batch_analysis_prompt
+from src.services.analysis_response_parser import parse_analysis_response
+
+class MicroBatchAnalyzer:
+    def is_batchable(self, context: Dict[str, Any]) -> bool:
+        return (
+            Config.MICRO_BATCH_ENABLED
+            and context["heuristic_analysis"] is None
+            and not context["diff_result"]["truncated"]
+            and context["diff_result"]["size"] <= Config.MICRO_BATCH_MAX_DIFF_BYTES
+            and context["impact_score"] <= Config.MICRO_BATCH_MAX_IMPACT
+        )
+
+    def partition(self, contexts: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        size = max(Config.MICRO_BATCH_SIZE, 1)
+        return [contexts[index:index + size] for index in range(0, len(contexts), size)]
+
+    def _validate(self, item: Any, expected_shas: set) -> Optional[Dict[str, Any]]:
+        if not isinstance(item, dict) or item.get("sha") not in expected_shas:
+            return None
+        if not isinstance(item.get("summary"), str) or not item["summary"].strip():
+            return None
+        if not isinstance(item.get("details", ""), str):
+            return None
+        if not isinstance(item.get("key_changes", []), list) or not isinstance(item.get("potential_issues", []), list):
+            return None
+        return {
+            "summary": item["summary"],
+            "details": item.get("details", ""),
+            "key_changes": item.get("key_changes", []),
+            "potential_issues": item.get("potential_issues", [])
+        }
+
+    def _split(self, ai_response: str, expected_shas: set) -> Dict[str, Dict[str, Any]]:
+        parsed = parse_analysis_response(ai_response)
+        if isinstance(parsed, dict):
+            parsed = parsed.get("commits")
+        if not isinstance(parsed, list):
+            return {}
+        return self._collect(parsed, expected_shas)
+
+    def _collect(self, items: List[Any], expected_shas: set) -> Dict[str, Dict[str, Any]]:
+        analyses = {}
+        for item in items:
+            analysis_data = self._validate(item, expected_shas)
+            if analysis_data and item["sha"] not in analyses:
+                analyses[item["sha"]] = analysis_data
+        return analyses
+
+    async def analyze(self, agent, contexts: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        expected_shas = {context["commit_data"].get("sha") for context in contexts}
+        config = {"configurable": {"thread_id": f"batch_{'_'.join(sorted(expected_shas))[:200]}"}}
+        response = await agent.ainvoke(
+            {"messages": [{"role": "user", "content": build_batch_analysis_prompt(contexts)}]},
+            config
+        )
+        structured_response = response.get("structured_response")
+        if structured_response is not None:
+            analyses = self._collect(structured_response.model_dump()["commits"], expected_shas)
+            if analyses:
+                return analyses
+        return self._split(response["messages"][-1].content, expected_shas)
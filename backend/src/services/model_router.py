@@ -0,0 +1,94 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, TypeVar
+from src.config import Config
+from src.services.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.provider_errors import is_upstream_error
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class ModelUnavailableError(Exception):
+    pass
+
+class ModelRouter:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ModelRouter, cls).__new__(cls)
+            cls._instance.limiters = {}
+            cls._instance.breakers = {}
+        return cls._instance
+
+    def _limiter(self, model: str) -> AdaptiveConcurrencyLimiter:
+        if model not in self.limiters:
+            self.limiters[model] = AdaptiveConcurrencyLimiter(
+                Config.MODEL_CONCURRENCY_INITIAL,
+                Config.MODEL_CONCURRENCY_MIN,
+                Config.MODEL_CONCURRENCY_MAX,
+                Config.MODEL_LATENCY_TOLERANCE
+            )
+        return self.limiters[model]
+
+    def _breaker(self, model: str) -> CircuitBreaker:
+        if model not in self.breakers:
+            self.breakers[model] = CircuitBreaker(
+                Config.MODEL_CIRCUIT_FAILURE_THRESHOLD,
+                Config.MODEL_CIRCUIT_RESET_SECONDS
+            )
+        return self.breakers[model]
+
+    def select_tier(self, diff_size: int, impact_score: int) -> str:
+        if (
+            Config.ANALYSIS_MODEL_TIERING
+            and diff_size <= Config.ANALYSIS_SMALL_MAX_DIFF_BYTES
+            and impact_score <= Config.ANALYSIS_SMALL_MAX_IMPACT
+        ):
+            return "small"
+        return "large"
+
+    def analysis_models(self, tier: str) -> List[str]:
+        models = [Config.ANALYSIS_SMALL_MODEL, Config.ANALYSIS_MODEL]
+        if tier == "large":
+            models.reverse()
+        return list(dict.fromkeys(models))
+
+    def report_models(self) -> List[str]:
+        return list(dict.fromkeys([Config.REPORT_MODEL, Config.REPORT_FALLBACK_MODEL]))
+
+    async def run(self, models: List[str], call: Callable[[str], Awaitable[T]]) -> T:
+        last_error = None
+        for model in models:
+            breaker = self._breaker(model)
+            permit = breaker.acquire()
+            if permit is None:
+                logger.info(f"Circuit open for {model}, trying next model tier")
+                continue
+            try:
+                async with self._limiter(model).slot():
+                    result = await call(model)
+            except Exception as e:
+                if is_upstream_error(e):
+                    breaker.record_failure(permit)
+                last_error = e
+                logger.warning(f"Model {model} failed, falling back: {e}")
+                continue
+            finally:
+                breaker.release(permit)
+            breaker.record_success(permit)
+            return result
+
+        if last_error is not None:
+            raise last_error
+        raise ModelUnavailableError(f"No model available among {', '.join(models)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            model: {
+                **self._limiter(model).get_stats(),
+                "circuit": self._breaker(model).get_stats()
+            }
+            for model in set(self.limiters) | set(self.breakers)
+        }
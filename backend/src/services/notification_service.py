@@ -1,8 +1,7 @@
 import abc
-import httpx
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -12,11 +11,13 @@ class NotificationAdapter(abc.ABC):
         pass
 
 from src.integration.settings import SettingsDAO
+from src.integration.http_clients import HttpClientRegistry
 
 class GoogleChatAdapter(NotificationAdapter):
-    def __init__(self, webhook_url: str = None):
+    def __init__(self, webhook_url: str = None, http_clients: Optional[HttpClientRegistry] = None):
         self.manual_url = webhook_url
         self.settings_dao = SettingsDAO()
+        self.http_clients = http_clients or HttpClientRegistry()
 
     async def send_report(self, repo_name: str, report_text: str) -> bool:
         webhook_url = self.manual_url
@@ -35,18 +36,18 @@ class GoogleChatAdapter(NotificationAdapter):
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(self.webhook_url, json=message)
-                response.raise_for_status()
-                return True
+            response = await self.http_clients.get("notifications").post(webhook_url, json=message)
+            response.raise_for_status()
+            return True
         except Exception as e:
             logger.error(f"Failed to send report to Google Chat: {e}")
             return False
 
 class SlackAdapter(NotificationAdapter):
-    def __init__(self, webhook_url: str = None):
+    def __init__(self, webhook_url: str = None, http_clients: Optional[HttpClientRegistry] = None):
         self.manual_url = webhook_url
         self.settings_dao = SettingsDAO()
+        self.http_clients = http_clients or HttpClientRegistry()
 
     async def send_report(self, repo_name: str, report_text: str) -> bool:
         webhook_url = self.manual_url
@@ -65,18 +66,18 @@ class SlackAdapter(NotificationAdapter):
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(webhook_url, json=message)
-                response.raise_for_status()
-                return True
+            response = await self.http_clients.get("notifications").post(webhook_url, json=message)
+            response.raise_for_status()
+            return True
         except Exception as e:
             logger.error(f"Failed to send report to Slack: {e}")
             return False
 
 class WhatsAppAdapter(NotificationAdapter):
     """Real implementation for WhatsApp using the Baileys bridge service"""
-    def __init__(self):
+    def __init__(self, http_clients: Optional[HttpClientRegistry] = None):
         self.settings_dao = SettingsDAO()
+        self.http_clients = http_clients or HttpClientRegistry()
         self.bridge_url = os.getenv("WHATSAPP_BRIDGE_URL", "http://localhost:8001")
 
     async def send_report(self, repo_name: str, report_text: str) -> bool:
@@ -88,16 +89,15 @@ class WhatsAppAdapter(NotificationAdapter):
         message = f"*Daily Report*\n\n{report_text}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.bridge_url}/api/whatsapp/send",
-                    json={
-                        "jid": wa_group_id,
-                        "message": message
-                    }
-                )
-                response.raise_for_status()
-                return response.json().get("success", False)
+            response = await self.http_clients.get("whatsapp_bridge").post(
+                f"{self.bridge_url}/api/whatsapp/send",
+                json={
+                    "jid": wa_group_id,
+                    "message": message
+                }
+            )
+            response.raise_for_status()
+            return response.json().get("success", False)
         except Exception as e:
             logger.error(f"Failed to send report to WhatsApp via bridge: {e}")
             return False
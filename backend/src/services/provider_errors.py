@@ -0,0 +1,22 @@
+import asyncio
+from typing import Optional
+import httpx
+
+CONNECTION_ERROR_NAMES = {"APIConnectionError", "APITimeoutError"}
+
+def error_status_code(error: Exception) -> Optional[int]:
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+def is_overload_error(error: Exception) -> bool:
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status_code = error_status_code(error)
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+def is_upstream_error(error: Exception) -> bool:
+    if is_overload_error(error) or isinstance(error, httpx.TransportError):
+        return True
+    return any(cls.__name__ in CONNECTION_ERROR_NAMES for cls in type(error).__mro__)
@@ -2,15 +2,22 @@ from datetime import datetime
 from src.integration.commits import CommitDAO
 from src.agents.report_aggregation_agent import get_report_aggregation_agent
 from src.services.notification_service import NotificationService
+from src.services.model_router import ModelRouter
 from typing import Dict, Any, List
 import json
 
 class ReportService:
     def __init__(self):
         self.commit_dao = CommitDAO()
-        self.agent = get_report_aggregation_agent()
+        self.agents = {}
+        self.model_router = ModelRouter()
         self.notification_service = NotificationService()
 
+    def _agent_for(self, model: str):
+        if model not in self.agents:
+            self.agents[model] = get_report_aggregation_agent(model)
+        return self.agents[model]
+
     async def generate_and_send_daily_report(self, repo_url: str, repo_name: str, target: str = "google") -> Dict[str, Any]:
         # 1. Fetch today's commits
         date_str = datetime.utcnow().strftime("%Y-%m-%d")
@@ -37,9 +44,12 @@ class ReportService:
         prompt = f"Here are the analyzed commits for {repo_name} today ({date_str}):\n\n{json.dumps(commit_data_for_ai, indent=2)}"
         
         config = {"configurable": {"thread_id": f"report_{repo_name}_{date_str}"}}
-        response = await self.agent.ainvoke(
-            {"messages": [{"role": "user", "content": prompt}]},
-            config
+        response = await self.model_router.run(
+            self.model_router.report_models(),
+            lambda model: self._agent_for(model).ainvoke(
+                {"messages": [{"role": "user", "content": prompt}]},
+                config
+            )
         )
         
         report_text = response["messages"][-1].content
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from typing import Dict, Any, Optional
+from src.config import Config
+from src.integration.repositories import RepositoryDAO
+from src.utils.repository_url import normalize_repository_url
+
+class RepositoryRegistry:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RepositoryRegistry, cls).__new__(cls)
+            cls._instance.repo_dao = RepositoryDAO()
+            cls._instance.repositories = {}
+            cls._instance.loaded_at = None
+            cls._instance.load_lock = asyncio.Lock()
+        return cls._instance
+
+    async def _reload(self):
+        repositories = await self.repo_dao.get_all_repositories(length=None)
+        self.repositories = {
+            normalize_repository_url(repo["url"]): repo
+            for repo in repositories
+        }
+        self.loaded_at = time.monotonic()
+
+    async def load(self):
+        async with self.load_lock:
+            await self._reload()
+
+    async def invalidate(self):
+        await self.load()
+
+    def _is_stale(self) -> bool:
+        if self.loaded_at is None:
+            return True
+        return time.monotonic() - self.loaded_at > Config.REPOSITORY_REGISTRY_REFRESH_SECONDS
+
+    def _match(self, urls: list[str]) -> Optional[Dict[str, Any]]:
+        for url in urls:
+            repo_data = self.repositories.get(normalize_repository_url(url))
+            if repo_data:
+                return repo_data
+        return None
+
+    async def find(self, urls: list[str]) -> Optional[Dict[str, Any]]:
+        if self._is_stale():
+            async with self.load_lock:
+                if self._is_stale():
+                    await self._reload()
+        return self._match(urls)
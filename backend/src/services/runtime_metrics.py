@@ -0,0 +1,80 @@
+import asyncio
+import os
+import resource
+import logging
+from collections import deque
+from typing import Dict, Any, Optional
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+def _percentile(values: list, percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+class RuntimeMetrics:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RuntimeMetrics, cls).__new__(cls)
+            cls._instance.lag_samples = deque(maxlen=2048)
+            cls._instance.max_lag = 0.0
+            cls._instance.task = None
+        return cls._instance
+
+    async def _sample_loop_lag(self):
+        loop = asyncio.get_running_loop()
+        interval = Config.RUNTIME_METRICS_INTERVAL
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lag = max(0.0, loop.time() - expected)
+            self.lag_samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._sample_loop_lag())
+            logger.info("Runtime metrics sampling started")
+
+    async def stop(self):
+        if self.task is None:
+            return
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.task = None
+
+    def reset(self):
+        self.lag_samples.clear()
+        self.max_lag = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        samples = list(self.lag_samples)
+        return {
+            "event_loop_lag_ms": {
+                "p50": round(_percentile(samples, 50) * 1000, 3),
+                "p95": round(_percentile(samples, 95) * 1000, 3),
+                "p99": round(_percentile(samples, 99) * 1000, 3),
+                "max": round(self.max_lag * 1000, 3),
+                "samples": len(samples)
+            },
+            "memory": {
+                "rss_bytes": _rss_bytes(),
+                "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+            },
+            "tasks": len(asyncio.all_tasks())
+        }
@@ -0,0 +1,89 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from src.agents.structured_output.incremental_json import IncrementalJSONObjectParser
+from src.agents.structured_output.commit_analysis_result import validate_analysis, validate_analysis_field
+from src.services.analysis_response_parser import parse_analysis_response
+
+logger = logging.getLogger(__name__)
+
+FieldCallback = Callable[[str, Any], Awaitable[None]]
+
+def _chunk_text(chunk) -> str:
+    content = getattr(chunk, "content", "")
+    if isinstance(content, list):
+        content = "".join(
+            part.get("text", "") if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    tool_arguments = "".join(
+        tool_call.get("args") or ""
+        for tool_call in getattr(chunk, "tool_call_chunks", None) or []
+    )
+    return (content or "") + tool_arguments
+
+def _message_text(message) -> str:
+    content = getattr(message, "content", "")
+    if isinstance(content, list):
+        return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    return content or ""
+
+class StreamingAnalysisRunner:
+    async def _emit(self, on_field: Optional[FieldCallback], name: str, value: Any, emitted: set):
+        if name in emitted:
+            return
+        try:
+            value = validate_analysis_field(name, value)
+        except ValueError:
+            return
+        emitted.add(name)
+        if on_field is None:
+            return
+        try:
+            await on_field(name, value)
+        except Exception as e:
+            logger.warning(f"Failed to publish streamed analysis field {name}: {e}")
+
+    async def run(
+        self,
+        agent,
+        prompt: str,
+        thread_id: str,
+        on_field: Optional[FieldCallback] = None
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        config = {"configurable": {"thread_id": thread_id}}
+        parser = IncrementalJSONObjectParser()
+        message_id = None
+        emitted: set = set()
+        final_state: Dict[str, Any] = {}
+
+        async for mode, payload in agent.astream(
+            {"messages": [{"role": "user", "content": prompt}]},
+            config,
+            stream_mode=["messages", "values"]
+        ):
+            if mode == "values":
+                final_state = payload
+                continue
+            chunk, _ = payload
+            if getattr(chunk, "id", None) != message_id:
+                message_id = getattr(chunk, "id", None)
+                parser = IncrementalJSONObjectParser()
+            for name, value in parser.feed(_chunk_text(chunk)):
+                await self._emit(on_field, name, value, emitted)
+
+        messages = final_state.get("messages") or []
+        raw_output = _message_text(messages[-1]) if messages else ""
+
+        structured_response = final_state.get("structured_response")
+        if structured_response is not None:
+            analysis_data = validate_analysis(structured_response)
+            if analysis_data is not None:
+                return analysis_data, raw_output
+
+        for candidate in (parser.result(), parse_analysis_response(raw_output)):
+            analysis_data = validate_analysis(candidate) if candidate is not None else None
+            if analysis_data is not None:
+                return analysis_data, raw_output
+
+        logger.info(f"Analysis output for {thread_id} did not match the schema")
+        return None, raw_output
@@ -0,0 +1,158 @@
+import difflib
+import os
+import re
+from typing import Callable, Dict, Any, List, Optional
+from src.config import Config
+from src.agents.tools.parsed_diff import ParsedDiff, FileDiff
+from src.agents.context.generated_files import classify_generated_file
+
+DOCUMENTATION_EXTENSIONS = {".md", ".markdown", ".rst", ".adoc"}
+TEXT_EXTENSIONS = {".txt", ".text"}
+DOCUMENTATION_BASENAMES = {"readme", "license", "changelog", "contributing", "authors", "notice", "copying"}
+BUILD_FILES = {"cmakelists.txt", "makefile", "dockerfile", "meson.build", "build.bazel", "setup.py", "setup.cfg"}
+REQUIREMENTS_PATTERN = re.compile(r"^requirements[\w.-]*\.(?:txt|in)$")
+DEPENDENCY_MANIFESTS = {
+    "package.json",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "pyproject.toml",
+    "pipfile",
+    "go.mod",
+    "cargo.toml",
+    "gemfile",
+    "composer.json",
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts"
+}
+DEPENDENCY_MESSAGE_PATTERN = re.compile(r"\b(?:bump|upgrade|update|pin)\b.*\b(?:dep|deps|dependency|dependencies|version|from|to)\b|\bdependabot\b|\brenovate\b", re.IGNORECASE)
+TYPO_MESSAGE_PATTERN = re.compile(r"\b(?:typo|typos|spelling|misspell|wording|grammar)\b", re.IGNORECASE)
+
+def _is_lockfile(file_diff: FileDiff) -> bool:
+    return classify_generated_file(file_diff) == "lockfile"
+
+def _is_manifest(file_diff: FileDiff) -> bool:
+    basename = os.path.basename(file_diff.filename.lower())
+    return basename in DEPENDENCY_MANIFESTS or bool(REQUIREMENTS_PATTERN.match(basename))
+
+def _is_build_file(file_diff: FileDiff) -> bool:
+    return os.path.basename(file_diff.filename.lower()) in BUILD_FILES
+
+def _is_dependency_file(file_diff: FileDiff) -> bool:
+    return _is_manifest(file_diff) or _is_lockfile(file_diff)
+
+def _is_documentation(file_diff: FileDiff) -> bool:
+    if file_diff.is_binary or _is_dependency_file(file_diff) or _is_build_file(file_diff):
+        return False
+    stem, extension = os.path.splitext(os.path.basename(file_diff.filename.lower()))
+    return extension in DOCUMENTATION_EXTENSIONS or stem in DOCUMENTATION_BASENAMES
+
+def _is_text(file_diff: FileDiff) -> bool:
+    if _is_documentation(file_diff):
+        return True
+    if file_diff.is_binary or _is_dependency_file(file_diff) or _is_build_file(file_diff):
+        return False
+    return os.path.splitext(file_diff.filename.lower())[1] in TEXT_EXTENSIONS
+
+def _file_lines(parsed_diff: ParsedDiff) -> List[str]:
+    return [
+        f"Updated {file_diff.filename} (+{file_diff.lines_added} -{file_diff.lines_removed})"
+        for file_diff in parsed_diff.files[:5]
+    ]
+
+def _summary(message: str, fallback: str) -> str:
+    first_line = message.strip().split("\n", 1)[0].strip()
+    return (first_line or fallback)[:100]
+
+def docs_only(parsed_diff: ParsedDiff, message: str) -> Optional[Dict[str, Any]]:
+    if not all(_is_documentation(file_diff) for file_diff in parsed_diff.files):
+        return None
+    return {
+        "summary": _summary(message, "Update documentation"),
+        "details": (
+            f"Documentation-only change across {len(parsed_diff.files)} file(s) "
+            f"(+{parsed_diff.lines_added} -{parsed_diff.lines_removed}). No source code is affected."
+        ),
+        "key_changes": _file_lines(parsed_diff),
+        "potential_issues": []
+    }
+
+def lockfile_only(parsed_diff: ParsedDiff, message: str) -> Optional[Dict[str, Any]]:
+    if not all(_is_lockfile(file_diff) for file_diff in parsed_diff.files):
+        return None
+    return {
+        "summary": _summary(message, "Regenerate dependency lockfiles"),
+        "details": (
+            f"Lockfile-only change across {len(parsed_diff.files)} file(s) "
+            f"(+{parsed_diff.lines_added} -{parsed_diff.lines_removed}). Resolved dependency versions changed without manifest edits."
+        ),
+        "key_changes": _file_lines(parsed_diff),
+        "potential_issues": []
+    }
+
+def dependency_bump(parsed_diff: ParsedDiff, message: str) -> Optional[Dict[str, Any]]:
+    if not all(_is_dependency_file(file_diff) for file_diff in parsed_diff.files):
+        return None
+    manifest_lines = sum(
+        file_diff.lines_added + file_diff.lines_removed
+        for file_diff in parsed_diff.files
+        if not _is_lockfile(file_diff)
+    )
+    if manifest_lines > Config.HEURISTIC_MAX_DEPENDENCY_LINES or not DEPENDENCY_MESSAGE_PATTERN.search(message):
+        return None
+    return {
+        "summary": _summary(message, "Bump dependencies"),
+        "details": (
+            f"Dependency update touching {len(parsed_diff.files)} manifest/lock file(s) "
+            f"with {manifest_lines} changed manifest line(s)."
+        ),
+        "key_changes": _file_lines(parsed_diff),
+        "potential_issues": []
+    }
+
+def typo_fix(parsed_diff: ParsedDiff, message: str) -> Optional[Dict[str, Any]]:
+    if len(parsed_diff.files) != 1 or parsed_diff.lines_added != parsed_diff.lines_removed:
+        return None
+    if not _is_text(parsed_diff.files[0]):
+        return None
+    if parsed_diff.lines_added == 0 or parsed_diff.lines_added > Config.HEURISTIC_MAX_TYPO_LINES:
+        return None
+    removed = [line for hunk in parsed_diff.files[0].hunks for line in hunk.removed_lines()]
+    added = [line for hunk in parsed_diff.files[0].hunks for line in hunk.added_lines()]
+    similar = all(
+        difflib.SequenceMatcher(None, old, new).ratio() >= 0.8
+        for old, new in zip(removed, added)
+    )
+    if not similar or not TYPO_MESSAGE_PATTERN.search(message):
+        return None
+    return {
+        "summary": _summary(message, f"Fix typo in {parsed_diff.files[0].filename}"),
+        "details": (
+            f"Small textual correction in {parsed_diff.files[0].filename} "
+            f"affecting {parsed_diff.lines_added} line(s)."
+        ),
+        "key_changes": _file_lines(parsed_diff),
+        "potential_issues": []
+    }
+
+RULES: Dict[str, Callable[[ParsedDiff, str], Optional[Dict[str, Any]]]] = {
+    "docs_only": docs_only,
+    "lockfile_only": lockfile_only,
+    "dependency_bump": dependency_bump,
+    "typo_fix": typo_fix
+}
+
+class TrivialCommitClassifier:
+    def __init__(self, rule_names: Optional[List[str]] = None):
+        if rule_names is None:
+            rule_names = [name.strip() for name in Config.HEURISTIC_RULES.split(",") if name.strip()]
+        self.rules = [RULES[name] for name in rule_names if name in RULES]
+
+    def analyze(self, parsed_diff: ParsedDiff, message: str, truncated: bool) -> Optional[Dict[str, Any]]:
+        if truncated or not parsed_diff.files:
+            return None
+        for rule in self.rules:
+            analysis_data = rule(parsed_diff, message or "")
+            if analysis_data:
+                return analysis_data
+        return None
@@ -0,0 +1,15 @@
+import hashlib
+import re
+
+HUNK_RANGE_PATTERN = re.compile(r"^@@ -\d+(?:,\d+)? \+\d+(?:,\d+)? @@")
+
+def normalize_diff(diff: str) -> str:
+    lines = []
+    for line in diff.split("\n"):
+        if line.startswith("index "):
+            continue
+        lines.append(HUNK_RANGE_PATTERN.sub("@@", line).rstrip())
+    return "\n".join(lines).strip()
+
+def diff_fingerprint(diff: str) -> str:
+    return hashlib.sha256(normalize_diff(diff).encode("utf-8")).hexdigest()
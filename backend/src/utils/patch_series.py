@@ -0,0 +1,18 @@
+import re
+from typing import Dict
+
+PATCH_HEADER_PATTERN = re.compile(r"^From ([0-9a-f]{40}) Mon Sep 17 00:00:00 2001$", re.MULTILINE)
+SIGNATURE_PATTERN = re.compile(r"\n-- \n[^\n]*\n*\Z")
+
+def split_patch_series(patch_text: str) -> Dict[str, str]:
+    headers = list(PATCH_HEADER_PATTERN.finditer(patch_text))
+    diffs = {}
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(patch_text)
+        section = patch_text[header.end():end]
+        diff_start = section.find("\ndiff --git ")
+        if diff_start == -1:
+            diffs[header.group(1)] = ""
+            continue
+        diffs[header.group(1)] = SIGNATURE_PATTERN.sub("\n", section[diff_start + 1:])
+    return diffs
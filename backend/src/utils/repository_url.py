@@ -0,0 +1,14 @@
+from urllib.parse import urlparse
+
+def normalize_repository_url(url: str) -> str:
+    candidate = url.strip()
+    if "://" not in candidate:
+        candidate = f"https://{candidate}"
+    parsed = urlparse(candidate)
+    host = parsed.netloc.lower().rsplit("@", 1)[-1]
+    if host.startswith("www."):
+        host = host[4:]
+    path = parsed.path.strip("/").lower()
+    if path.endswith(".git"):
+        path = path[:-4]
+    return f"{host}/{path.rstrip('/')}"
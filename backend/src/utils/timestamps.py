@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def fallback_timestamp(created_at: Any) -> datetime:
+    return created_at if isinstance(created_at, datetime) else datetime.utcnow()
@@ -0,0 +1,11 @@
+import re
+
+HTML_URL_PATTERN = re.compile(rb'"html_url"\s*:\s*"([^"\\]{1,512})"')
+
+def extract_repository_url_candidates(body: bytes, max_candidates: int = 8) -> list[str]:
+    candidates = []
+    for match in HTML_URL_PATTERN.finditer(body):
+        candidates.append(match.group(1).decode("utf-8", errors="ignore"))
+        if len(candidates) >= max_candidates:
+            break
+    return candidates
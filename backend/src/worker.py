@@ -0,0 +1,25 @@
+import asyncio
+import logging
+from dotenv import load_dotenv
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    from src.config import Config
+    from src.integration.database import Database
+    from src.integration.http_clients import HttpClientRegistry
+    from src.workers.worker_pool import AnalysisWorkerPool
+
+    async def main():
+        await Database().create_indexes()
+        HttpClientRegistry().startup()
+        try:
+            await AnalysisWorkerPool(Config.ANALYSIS_WORKERS).run_forever()
+        finally:
+            await HttpClientRegistry().shutdown()
+
+    asyncio.run(main())
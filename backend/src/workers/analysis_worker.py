@@ -0,0 +1,95 @@
+import asyncio
+import random
+import logging
+from typing import Dict, Any
+from src.config import Config
+from src.integration.analysis_jobs import AnalysisJobDAO
+from src.api.services.webhook_service import WebhookService
+
+logger = logging.getLogger(__name__)
+
+class AnalysisWorker:
+    def __init__(
+        self,
+        worker_id: str,
+        job_dao: AnalysisJobDAO,
+        webhook_service: WebhookService
+    ):
+        self.worker_id = worker_id
+        self.job_dao = job_dao
+        self.webhook_service = webhook_service
+
+    def retry_delay(self, attempts: int) -> float:
+        delay = min(
+            Config.JOB_RETRY_BASE_DELAY * (2 ** (attempts - 1)),
+            Config.JOB_RETRY_MAX_DELAY
+        )
+        return delay * random.uniform(0.5, 1.0)
+
+    async def heartbeat(self, job_id):
+        interval = min(Config.JOB_HEARTBEAT_INTERVAL, Config.JOB_VISIBILITY_TIMEOUT / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.job_dao.extend_lease(job_id, self.worker_id, Config.JOB_VISIBILITY_TIMEOUT):
+                    logger.warning(f"Worker {self.worker_id} lost the lease on job {job_id}")
+                    return
+            except Exception as e:
+                logger.error(f"Worker {self.worker_id} failed to extend the lease on job {job_id}: {e}")
+
+    async def process_job(self, job: Dict[str, Any]):
+        heartbeat = asyncio.create_task(self.heartbeat(job["_id"]))
+        try:
+            result = await self.webhook_service.process_commits(
+                job["commits"],
+                job["repo_owner"],
+                job["repository"],
+                force=job.get("force", False),
+                job_id=job["_id"],
+                push_range=job.get("push_range")
+            )
+        except Exception as e:
+            if job["attempts"] >= Config.JOB_MAX_ATTEMPTS:
+                if await self.job_dao.fail(job["_id"], self.worker_id, str(e)):
+                    logger.error(f"Job {job['_id']} failed permanently for {job['repository']}: {e}")
+                else:
+                    logger.warning(f"Job {job['_id']} failed after its lease moved to another worker: {e}")
+                return
+            delay = self.retry_delay(job["attempts"])
+            if await self.job_dao.retry(job["_id"], self.worker_id, str(e), delay):
+                logger.warning(f"Job {job['_id']} failed, retrying in {delay:.1f}s: {e}")
+            else:
+                logger.warning(f"Job {job['_id']} failed after its lease moved to another worker: {e}")
+            return
+        finally:
+            heartbeat.cancel()
+
+        try:
+            acknowledged = await self.job_dao.ack(job["_id"], self.worker_id)
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id} failed to acknowledge job {job['_id']}: {e}")
+            return
+        if not acknowledged:
+            logger.warning(f"Job {job['_id']} finished but its lease had moved to another worker")
+            return
+        logger.info(
+            f"Job {job['_id']} completed: {len(result['analyzed'])} analyzed, "
+            f"{len(result['skipped'])} skipped for {job['repository']}"
+        )
+
+    async def run(self, stop_event: asyncio.Event):
+        while not stop_event.is_set():
+            try:
+                job = await self.job_dao.lease(self.worker_id, Config.JOB_VISIBILITY_TIMEOUT)
+            except Exception as e:
+                logger.error(f"Worker {self.worker_id} failed to lease a job: {e}")
+                job = None
+
+            if job:
+                await self.process_job(job)
+                continue
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=Config.JOB_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
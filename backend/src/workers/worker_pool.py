@@ -0,0 +1,32 @@
+import asyncio
+import socket
+import os
+from src.integration.analysis_jobs import AnalysisJobDAO
+from src.api.services.webhook_service import WebhookService
+from src.workers.analysis_worker import AnalysisWorker
+
+class AnalysisWorkerPool:
+    def __init__(self, size: int):
+        self.size = size
+        self.stop_event = asyncio.Event()
+        self.tasks = []
+
+    def start(self):
+        job_dao = AnalysisJobDAO()
+        webhook_service = WebhookService()
+        prefix = f"{socket.gethostname()}-{os.getpid()}"
+        self.tasks = [
+            asyncio.create_task(
+                AnalysisWorker(f"{prefix}-{index}", job_dao, webhook_service).run(self.stop_event)
+            )
+            for index in range(self.size)
+        ]
+
+    async def stop(self):
+        self.stop_event.set()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    async def run_forever(self):
+        self.start()
+        await asyncio.gather(*self.tasks)
@@ -0,0 +1,18 @@
+from datetime import datetime
+import pytest
+
+bson = pytest.importorskip("bson")
+
+from src.utils.commit_cursor import encode_cursor, decode_cursor
+
+def test_cursor_round_trips_timestamp_and_id():
+    timestamp = datetime(2024, 5, 1, 12, 30, 15, 250000)
+    document_id = bson.ObjectId("65f1c2a9b1e4c3d2a1b0c9d8")
+    cursor = encode_cursor(timestamp, document_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (timestamp, document_id)
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "eyJ0IjoieCJ9", "eyJ0IjoiMjAyNC0wNS0wMVQxMjozMDoxNSIsImkiOiJ4In0"])
+def test_malformed_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,53 @@
+from src.agents.tools.parsed_diff import parse_diff
+from src.agents.context.diff_reducer import DiffReducer
+
+class WordCounter:
+    def count(self, text: str) -> int:
+        return len(text.split())
+
+def _file(filename: str, *hunks: str) -> str:
+    return (
+        f"diff --git a/{filename} b/{filename}\n"
+        f"--- a/{filename}\n"
+        f"+++ b/{filename}\n"
+        + "".join(hunks)
+    )
+
+def _hunk(start: int, *lines: str) -> str:
+    return f"@@ -{start},{len(lines)} +{start},{len(lines)} @@\n" + "".join(f"{line}\n" for line in lines)
+
+CODE_HUNK = _hunk(1, "-def load(path):", "+def load(path, strict=False):")
+COMMENT_HUNK = _hunk(40, "-# old note about caching", "+# new note about caching")
+
+def test_small_diff_is_kept_whole():
+    parsed_diff = parse_diff(_file("app/store.py", CODE_HUNK))
+    result = DiffReducer(1000, 1000, WordCounter()).reduce(parsed_diff)
+    assert result["reduced"] is False
+    assert result["omitted_files"] == [] and result["partial_files"] == []
+    assert "+def load(path, strict=False):" in result["diff"]
+
+def test_lockfiles_are_summarized_instead_of_rendered():
+    parsed_diff = parse_diff(_file("package-lock.json", _hunk(1, '-"version": "1.0.0"', '+"version": "1.0.1"')) + _file("app/store.py", CODE_HUNK))
+    result = DiffReducer(1000, 1000, WordCounter()).reduce(parsed_diff)
+    assert result["omitted_files"] == [{"filename": "package-lock.json", "reason": "lockfile"}]
+    assert "... (lockfile omitted, +1 -1)" in result["diff"]
+    assert '"version": "1.0.1"' not in result["diff"]
+    assert result["reduced"] is True
+
+def test_tight_budget_keeps_the_highest_ranked_hunk():
+    parsed_diff = parse_diff(_file("app/store.py", COMMENT_HUNK, CODE_HUNK))
+    result = DiffReducer(30, 1000, WordCounter()).reduce(parsed_diff)
+    assert "+def load(path, strict=False):" in result["diff"]
+    assert "new note about caching" not in result["diff"]
+    assert "... (1 of 2 hunks omitted)" in result["diff"]
+    assert result["reduced"] is True
+
+def test_oversized_hunk_is_truncated_and_reported_as_partial():
+    lines = [f"+    step_{index} = run({index})" for index in range(40)]
+    parsed_diff = parse_diff(_file("app/pipeline.py", _hunk(1, *lines)))
+    result = DiffReducer(60, 1000, WordCounter()).reduce(parsed_diff)
+    assert result["partial_files"] == ["app/pipeline.py"]
+    assert "+    step_0 = run(0)" in result["diff"]
+    assert "+    step_39 = run(39)" not in result["diff"]
+    assert "hunk lines elided)" in result["diff"]
+    assert result["reduced"] is True
@@ -0,0 +1,40 @@
+import json
+from src.agents.structured_output.incremental_json import IncrementalJSONObjectParser
+
+ANALYSIS = {
+    "summary": "Add retry {with} \"backoff\"",
+    "details": "Retries, now: capped",
+    "key_changes": ["retry loop", {"nested": [1, 2]}],
+    "impact": 4,
+    "breaking": False
+}
+
+def _feed_in_chunks(text: str, size: int):
+    parser = IncrementalJSONObjectParser()
+    fields = []
+    for start in range(0, len(text), size):
+        fields.extend(parser.feed(text[start:start + size]))
+    return parser, fields
+
+def test_fields_are_emitted_in_order_as_they_complete():
+    parser, fields = _feed_in_chunks(json.dumps(ANALYSIS), 3)
+    assert fields == list(ANALYSIS.items())
+    assert parser.result() == ANALYSIS
+
+def test_single_character_chunks_produce_the_same_fields():
+    _, fields = _feed_in_chunks(json.dumps(ANALYSIS, indent=2), 1)
+    assert dict(fields) == ANALYSIS
+
+def test_text_before_the_object_is_ignored():
+    parser, fields = _feed_in_chunks('Here is the analysis:\n```json\n{"summary": "ok"}\n```', 5)
+    assert fields == [("summary", "ok")]
+    assert parser.result() == {"summary": "ok"}
+
+def test_summary_is_available_before_the_object_closes():
+    parser = IncrementalJSONObjectParser()
+    assert parser.feed('{"summary": "Fix cache key", "det') == [("summary", "Fix cache key")]
+    assert parser.result() is None
+
+def test_unfinished_object_has_no_result():
+    parser, _ = _feed_in_chunks('{"summary": "ok", "details": "cut of', 4)
+    assert parser.result() is None
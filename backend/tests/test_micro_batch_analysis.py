@@ -0,0 +1,29 @@
+import json
+from src.services.micro_batch_analysis import MicroBatchAnalyzer
+
+def _analysis(sha: str, summary: str = "Rename variable") -> dict:
+    return {"sha": sha, "summary": summary, "details": "", "key_changes": ["rename"], "potential_issues": []}
+
+def test_partition_respects_the_batch_size(monkeypatch):
+    monkeypatch.setattr("src.config.Config.MICRO_BATCH_SIZE", 3)
+    assert MicroBatchAnalyzer().partition(list(range(7))) == [[0, 1, 2], [3, 4, 5], [6]]
+
+def test_split_reads_a_commits_object_from_a_fenced_response():
+    response = "```json\n" + json.dumps({"commits": [_analysis("a1"), _analysis("b2", "Fix typo")]}) + "\n```"
+    analyses = MicroBatchAnalyzer()._split(response, {"a1", "b2"})
+    assert set(analyses) == {"a1", "b2"}
+    assert analyses["b2"]["summary"] == "Fix typo"
+
+def test_split_drops_unknown_duplicate_and_invalid_entries():
+    response = json.dumps([
+        _analysis("a1"),
+        _analysis("a1", "Second answer"),
+        _analysis("zz"),
+        {"sha": "b2", "summary": "   "},
+        {"sha": "c3", "summary": "ok", "key_changes": "not a list"}
+    ])
+    analyses = MicroBatchAnalyzer()._split(response, {"a1", "b2", "c3"})
+    assert analyses == {"a1": {"summary": "Rename variable", "details": "", "key_changes": ["rename"], "potential_issues": []}}
+
+def test_split_returns_nothing_for_unparseable_output():
+    assert MicroBatchAnalyzer()._split("The commits look fine.", {"a1"}) == {}
@@ -0,0 +1,45 @@
+from src.agents.tools.parsed_diff import parse_diff
+
+DIFF = (
+    "diff --git a/app/service.py b/app/service.py\n"
+    "index 1111111..2222222 100644\n"
+    "--- a/app/service.py\n"
+    "+++ b/app/service.py\n"
+    "@@ -10,3 +10,4 @@ class Service:\n"
+    "     def run(self):\n"
+    "-        return 1\n"
+    "+        value = compute()\n"
+    "+        return value\n"
+    "diff --git a/docs/new.md b/docs/new.md\n"
+    "new file mode 100644\n"
+    "--- /dev/null\n"
+    "+++ b/docs/new.md\n"
+    "@@ -0,0 +1 @@\n"
+    "+# New\n"
+    "diff --git a/logo.png b/logo.png\n"
+    "Binary files a/logo.png and b/logo.png differ\n"
+)
+
+def test_parse_diff_counts_lines_per_file_and_hunk():
+    parsed_diff = parse_diff(DIFF)
+    assert [file_diff.filename for file_diff in parsed_diff.files] == ["app/service.py", "docs/new.md", "logo.png"]
+    service = parsed_diff.files[0]
+    assert (service.lines_added, service.lines_removed) == (2, 1)
+    assert service.hunks[0].context == "class Service:"
+    assert (service.hunks[0].old_start, service.hunks[0].new_count) == (10, 4)
+    assert service.added_lines() == ["        value = compute()", "        return value"]
+    assert (parsed_diff.lines_added, parsed_diff.lines_removed, parsed_diff.total_lines) == (3, 1, 4)
+
+def test_parse_diff_reads_file_status_from_headers():
+    parsed_diff = parse_diff(DIFF)
+    assert [file_diff.status for file_diff in parsed_diff.files] == ["modified", "added", "modified"]
+    assert [file_diff.is_binary for file_diff in parsed_diff.files] == [False, False, True]
+
+def test_file_changes_summarize_each_file():
+    assert parse_diff(DIFF).file_changes()[1] == {"filename": "docs/new.md", "lines_added": 1, "lines_removed": 0}
+
+def test_parse_diff_returns_the_cached_instance_for_the_same_text():
+    assert parse_diff(DIFF) is parse_diff(DIFF)
+
+def test_parse_diff_ignores_text_before_the_first_file_header():
+    assert parse_diff("From 123 Mon Sep 17 00:00:00 2001\n+not a file line\n").files == []
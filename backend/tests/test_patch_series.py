@@ -0,0 +1,43 @@
+from src.utils.patch_series import split_patch_series
+
+FIRST_SHA = "a" * 40
+SECOND_SHA = "b" * 40
+
+def _patch(sha: str, subject: str, body: str) -> str:
+    return (
+        f"From {sha} Mon Sep 17 00:00:00 2001\n"
+        "From: Dev <dev@example.com>\n"
+        f"Subject: [PATCH] {subject}\n"
+        "\n"
+        "---\n"
+        " app.py | 1 +\n"
+        "\n"
+        f"{body}"
+    )
+
+FIRST_DIFF = (
+    "diff --git a/app.py b/app.py\n"
+    "--- a/app.py\n"
+    "+++ b/app.py\n"
+    "@@ -1 +1,2 @@\n"
+    " import os\n"
+    "+import sys\n"
+)
+SECOND_DIFF = (
+    "diff --git a/README.md b/README.md\n"
+    "--- a/README.md\n"
+    "+++ b/README.md\n"
+    "@@ -1 +1 @@\n"
+    "-# App\n"
+    "+# Service\n"
+)
+
+def test_split_patch_series_maps_each_commit_to_its_diff():
+    patch_text = _patch(FIRST_SHA, "Import sys", FIRST_DIFF) + _patch(SECOND_SHA, "Rename", SECOND_DIFF + "-- \n2.44.0\n\n")
+    assert split_patch_series(patch_text) == {FIRST_SHA: FIRST_DIFF, SECOND_SHA: SECOND_DIFF}
+
+def test_commit_without_a_diff_maps_to_an_empty_string():
+    assert split_patch_series(_patch(FIRST_SHA, "Empty commit", "")) == {FIRST_SHA: ""}
+
+def test_text_without_patch_headers_yields_nothing():
+    assert split_patch_series(FIRST_DIFF) == {}
@@ -0,0 +1,66 @@
+from src.agents.tools.parsed_diff import parse_diff
+from src.agents.tools.symbol_extraction import extract_modified_symbols
+
+def _diff(filename: str, header: str, *lines: str) -> str:
+    return (
+        f"diff --git a/{filename} b/{filename}\n"
+        f"--- a/{filename}\n"
+        f"+++ b/{filename}\n"
+        f"{header}\n"
+        + "".join(f"{line}\n" for line in lines)
+    )
+
+def test_changes_inside_a_function_mark_the_hunk_context_as_modified():
+    diff = _diff(
+        "app/service.py",
+        "@@ -10,2 +10,2 @@ def handle(event):",
+        "     payload = event.body",
+        "-    return payload",
+        "+    return payload.strip()"
+    )
+    assert extract_modified_symbols(parse_diff(diff)) == {
+        "app/service.py": {"modified": ["handle"], "added": [], "removed": []}
+    }
+
+def test_added_and_removed_definitions_are_reported_separately():
+    diff = _diff(
+        "app/service.py",
+        "@@ -1,2 +1,2 @@",
+        "-def legacy_handler(event):",
+        "-    return None",
+        "+class EventHandler:",
+        "+    pass"
+    )
+    assert extract_modified_symbols(parse_diff(diff)) == {
+        "app/service.py": {"modified": [], "added": ["EventHandler"], "removed": ["legacy_handler"]}
+    }
+
+def test_lines_after_a_removed_definition_belong_to_that_symbol():
+    diff = _diff(
+        "app/service.py",
+        "@@ -1,4 +1,3 @@ class Service:",
+        "     def keep(self):",
+        "-    def drop(self):",
+        "-        return 1",
+        "+        return 2"
+    )
+    assert extract_modified_symbols(parse_diff(diff))["app/service.py"] == {
+        "modified": [],
+        "added": [],
+        "removed": ["drop"]
+    }
+
+def test_redefined_symbol_is_modified():
+    diff = _diff(
+        "web/api.ts",
+        "@@ -1 +1 @@",
+        "-export function fetchCommits(page) {",
+        "+export async function fetchCommits(page: number) {"
+    )
+    assert extract_modified_symbols(parse_diff(diff)) == {
+        "web/api.ts": {"modified": ["fetchCommits"], "added": [], "removed": []}
+    }
+
+def test_files_without_language_patterns_are_skipped():
+    diff = _diff("README.md", "@@ -1 +1 @@", "-# Old", "+# New")
+    assert extract_modified_symbols(parse_diff(diff)) == {}
@@ -0,0 +1,38 @@
+from src.agents.tools.parsed_diff import parse_diff
+from src.agents.tools.technology_detection import classify_file, detect_technologies
+
+def _added_file(filename: str, *lines: str) -> str:
+    body = "".join(f"+{line}\n" for line in lines)
+    return (
+        f"diff --git a/{filename} b/{filename}\n"
+        "new file mode 100644\n"
+        "--- /dev/null\n"
+        f"+++ b/{filename}\n"
+        f"@@ -0,0 +1,{len(lines)} @@\n"
+        f"{body}"
+    )
+
+def test_classify_file_uses_extensions_and_known_filenames():
+    assert classify_file("src/app/main.py") == "python"
+    assert classify_file("web/App.TSX") == "typescript"
+    assert classify_file("Dockerfile.prod") == "docker"
+    assert classify_file("deploy/docker-compose.yml") == "docker"
+    assert classify_file("go.mod") == "go"
+    assert classify_file("LICENSE") is None
+
+def test_detect_technologies_prefers_the_path_over_content():
+    parsed_diff = parse_diff(_added_file("scripts/build.py", "#!/bin/bash", "echo build"))
+    assert detect_technologies(parsed_diff)["files"] == {"scripts/build.py": ["python"]}
+
+def test_detect_technologies_sniffs_added_lines_of_unknown_files():
+    parsed_diff = parse_diff(
+        _added_file("bin/release", "#!/usr/bin/env bash", "set -e")
+        + _added_file("queries/report", "SELECT id FROM commits")
+    )
+    result = detect_technologies(parsed_diff)
+    assert result["files"] == {"bin/release": ["shell"], "queries/report": ["sql"]}
+    assert result["technologies"] == ["shell", "sql"]
+
+def test_detect_technologies_returns_nothing_for_unknown_plain_text():
+    parsed_diff = parse_diff(_added_file("NOTES", "remember to rotate keys"))
+    assert detect_technologies(parsed_diff) == {"files": {"NOTES": []}, "technologies": []}
@@ -0,0 +1,52 @@
+from src.agents.tools.parsed_diff import parse_diff
+from src.services.trivial_commit_rules import TrivialCommitClassifier
+
+def _diff(filename: str, removed: str, added: str) -> str:
+    return (
+        f"diff --git a/{filename} b/{filename}\n"
+        f"--- a/{filename}\n"
+        f"+++ b/{filename}\n"
+        "@@ -1,2 +1,3 @@\n"
+        f" {removed}\n"
+        f"+{added}\n"
+    )
+
+def test_requirements_change_is_not_documentation():
+    diff = _diff("requirements.txt", "fastapi==0.110.0", "redis==5.0.1")
+    assert TrivialCommitClassifier().analyze(parse_diff(diff), "Add redis client", False) is None
+
+def test_cmakelists_change_is_not_documentation():
+    diff = _diff("CMakeLists.txt", "project(app)", "add_subdirectory(plugins)")
+    assert TrivialCommitClassifier().analyze(parse_diff(diff), "Build plugins", False) is None
+
+def test_readme_change_is_documentation():
+    diff = _diff("README.md", "# App", "Install with pip.")
+    analysis = TrivialCommitClassifier().analyze(parse_diff(diff), "Document install", False)
+    assert analysis is not None
+    assert analysis["details"].startswith("Documentation-only change")
+
+def test_requirements_bump_is_dependency_update():
+    diff = _diff("requirements-dev.txt", "pytest", "ruff==0.5.0")
+    analysis = TrivialCommitClassifier().analyze(parse_diff(diff), "Bump ruff to 0.5.0", False)
+    assert analysis is not None
+    assert analysis["details"].startswith("Dependency update")
+
+def _replacement_diff(filename: str, removed: str, added: str) -> str:
+    return (
+        f"diff --git a/{filename} b/{filename}\n"
+        f"--- a/{filename}\n"
+        f"+++ b/{filename}\n"
+        "@@ -1 +1 @@\n"
+        f"-{removed}\n"
+        f"+{added}\n"
+    )
+
+def test_typo_fix_in_code_is_not_trivial():
+    diff = _replacement_diff("app/limits.py", "if retries > limit:", "if retries >= limit:")
+    assert TrivialCommitClassifier().analyze(parse_diff(diff), "Fix typo in retry check", False) is None
+
+def test_typo_fix_in_text_file_is_trivial():
+    diff = _replacement_diff("notes.txt", "Recieve the payload first.", "Receive the payload first.")
+    analysis = TrivialCommitClassifier().analyze(parse_diff(diff), "Fix typo in notes", False)
+    assert analysis is not None
+    assert analysis["details"].startswith("Small textual correction")
@@ -1,3 +1,4 @@
+import { useRef } from 'react';
 import { useQuery } from '@tanstack/react-query';
 import api from '@/api/client';
 
@@ -20,18 +21,28 @@ export interface CommitAnalysis {
 }
 
 export const useCommits = (repoId: string | null, params: { page?: number; limit?: number; date?: string } = {}) => {
+    const pageCursors = useRef<Record<string, string>>({});
+
     const commitsQuery = useQuery({
         queryKey: ['commits', repoId, params],
         queryFn: async () => {
             if (!repoId) return [];
+            const page = params.page || 1;
+            const limit = params.limit || 20;
+            const cursorKey = (targetPage: number) => `${repoId}|${params.date || ''}|${limit}|${targetPage}`;
             const encodedId = encodeURIComponent(repoId);
-            const { data } = await api.get<CommitAnalysis[]>(`/repositories/${encodedId}/commits`, {
+            const { data, headers } = await api.get<CommitAnalysis[]>(`/repositories/${encodedId}/commits`, {
                 params: {
-                    page: params.page || 1,
-                    limit: params.limit || 20,
+                    page,
+                    limit,
                     date: params.date || undefined,
+                    cursor: page > 1 ? pageCursors.current[cursorKey(page)] : undefined,
                 }
             });
+            const nextCursor = headers['x-next-cursor'];
+            if (nextCursor) {
+                pageCursors.current[cursorKey(page + 1)] = nextCursor;
+            }
             return data;
         },
         enabled: !!repoId,
@@ -37,12 +37,25 @@ case "$1" in
     echo "⚙️ Starting Backend..."
     cd backend && PYTHONPATH=. uv run src/main.py
     ;;
+  "worker")
+    echo "🧵 Starting Analysis Workers..."
+    cd backend && PYTHONPATH=. uv run src/worker.py
+    ;;
+  "migrate")
+    echo "🗃️ Normalizing stored commit timestamps and moving embedded diffs..."
+    cd backend && PYTHONPATH=. uv run python -m src.migrations.normalize_commit_timestamps "${@:2}" \
+      && PYTHONPATH=. uv run python -m src.migrations.move_embedded_diffs "${@:2}"
+    ;;
+  "reanalyze")
+    echo "🔁 Queueing stored commits for forced re-analysis..."
+    cd backend && PYTHONPATH=. uv run python -m src.commands.reanalyze "${@:2}"
+    ;;
   "whatsapp")
     echo "📱 Starting WhatsApp Bridge..."
     cd whatsapp-bridge && pnpm start
     ;;
   *)
-    echo "Usage: ./manage.sh {dev|build|start|frontend|backend|whatsapp}"
+    echo "Usage: ./manage.sh {dev|build|start|frontend|backend|worker|migrate|reanalyze|whatsapp}"
     echo ""
     echo "Options:"
     echo "  dev      - Run backend, frontend & whatsapp bridge in parallel"
@@ -50,6 +63,9 @@ case "$1" in
     echo "  start    - Run backend, frontend preview & whatsapp bridge"
     echo "  frontend - Run only frontend"
     echo "  backend  - Run only backend"
+    echo "  worker   - Run only analysis workers"
+    echo "  migrate  - Normalize commit timestamps and move embedded diffs (resumable)"
+    echo "  reanalyze - Queue stored commits for forced re-analysis"
     echo "  whatsapp - Run only whatsapp bridge"
     exit 1
     ;;